@@ -3,19 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import importlib.util
+import io
+import itertools
 import logging
 import os
-import random
 import re
+import sys
+import tempfile
+import weakref
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
 from pathlib import Path
-from xml.etree import ElementTree
+from typing import TYPE_CHECKING, Any
 
 import httpx
+from lxml import etree
+from pydantic import TypeAdapter
 
 from paper_assistant.config import Config
+from paper_assistant.fileio import apply_umask_mode, read_json_cache, write_json_cache
 from paper_assistant.models import PaperMetadata
+from paper_assistant.ratelimit import (
+    AsyncTokenBucket,
+    compute_backoff_delay,
+    server_retry_delay,
+)
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 ARXIV_API_URL = "https://export.arxiv.org/api/query"
 ARXIV_PDF_URL = "https://arxiv.org/pdf/{arxiv_id}"
@@ -27,21 +45,62 @@ DEFAULT_ARXIV_USER_AGENT = (
 DEFAULT_ARXIV_MAX_RETRIES = 6
 DEFAULT_ARXIV_BACKOFF_BASE_SECONDS = 2.0
 DEFAULT_ARXIV_BACKOFF_CAP_SECONDS = 90.0
-
-# Matches arXiv URLs and bare IDs
+# arXiv announces new metadata roughly once a day
+ARXIV_METADATA_CACHE_TTL_SECONDS = 24 * 60 * 60
+PDF_CHUNK_BYTES = 64 * 1024
+# arXiv's API accepts up to 100 comma-joined IDs per id_list query
+ARXIV_ID_LIST_BATCH_SIZE = 100
+# Atom/HTML compress ~5x; httpx decodes br/zstd via the brotli/zstd extras
+ARXIV_TEXT_ACCEPT_ENCODING = "gzip, br, zstd"
+
+# Matches arXiv abs/pdf URLs (group 1) and bare IDs (group 2) in a single pass
 ARXIV_PATTERN = re.compile(
-    r"(?:https?://)?(?:www\.)?arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})(?:v\d+)?(?:\.pdf)?$"
+    r"(?:(?:https?://)?(?:www\.)?arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})(?:v\d+)?(?:\.pdf)?"
+    r"|(\d{4}\.\d{4,5})(?:v\d+)?)$"
 )
 HF_PAPER_PATTERN = re.compile(
     r"(?:https?://)?(?:(?:www\.)?huggingface\.co|hf\.co)/papers/(\d{4}\.\d{4,5})(?:v\d+)?/?$"
 )
-BARE_ID_PATTERN = re.compile(r"^(\d{4}\.\d{4,5})(?:v\d+)?$")
+
+# Shared connection pool limits for arXiv requests
+ARXIV_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=30.0,
+)
+# Multiplex concurrent requests over one connection per host when h2 is installed
+ARXIV_HTTP2 = importlib.util.find_spec("h2") is not None
 
 # arXiv Atom XML namespaces
 ATOM_NS = "http://www.w3.org/2005/Atom"
 ARXIV_NS = "http://arxiv.org/schemas/atom"
+_ATOM_ENTRY_TAG = f"{{{ATOM_NS}}}entry"
+_TAG_ID = f"{{{ATOM_NS}}}id"
+_TAG_TITLE = f"{{{ATOM_NS}}}title"
+_TAG_SUMMARY = f"{{{ATOM_NS}}}summary"
+_TAG_AUTHOR = f"{{{ATOM_NS}}}author"
+_TAG_NAME = f"{{{ATOM_NS}}}name"
+_TAG_PUBLISHED = f"{{{ATOM_NS}}}published"
+_TAG_CATEGORY = f"{{{ATOM_NS}}}category"
+_TAG_PRIMARY_CATEGORY = f"{{{ARXIV_NS}}}primary_category"
 logger = logging.getLogger(__name__)
 
+# Cache (de)serializer: bytes in/out through pydantic-core, no str round trip
+_METADATA_ADAPTER = TypeAdapter(PaperMetadata)
+
+# One pooled client per event loop: httpx clients must not cross loops, and
+# each CLI command runs its own loop via asyncio.run().
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+_inflight: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Future[PaperMetadata]]
+] = weakref.WeakKeyDictionary()
+
+
+# arXiv asks API clients to stay under one request every three seconds
+_ARXIV_BUCKET = AsyncTokenBucket(rate=1 / 3, burst=2)
+
 
 class PaperNotFoundError(Exception):
     """Raised when an arXiv paper is not found."""
@@ -50,7 +109,7 @@ class PaperNotFoundError(Exception):
 class ArxivRateLimitError(Exception):
     """Raised when arXiv returns rate limiting repeatedly."""
 
-    def __init__(self, attempts: int, retry_after_seconds: float | None = None):
+    def __init__(self, attempts: int, retry_after_seconds: float | None = None) -> None:
         self.attempts = attempts
         self.retry_after_seconds = retry_after_seconds
         wait_seconds = max(1, int(round(retry_after_seconds))) if retry_after_seconds else 30
@@ -61,9 +120,13 @@ class ArxivRateLimitError(Exception):
         )
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_arxiv_url(url: str) -> str:
     """Extract arXiv ID from a URL or bare ID string.
 
+    Results are memoized since the same input is typically parsed several
+    times per request (``is_arxiv_url`` followed by the actual lookup).
+
     Supports:
       - https://arxiv.org/abs/2503.10291
       - https://arxiv.org/pdf/2503.10291
@@ -79,15 +142,10 @@ def parse_arxiv_url(url: str) -> str:
     """
     url = url.strip()
 
-    # Try bare ID first
-    match = BARE_ID_PATTERN.match(url)
-    if match:
-        return match.group(1)
-
-    # Try URL pattern
+    # Try bare ID or arXiv URL
     match = ARXIV_PATTERN.match(url)
     if match:
-        return match.group(1)
+        return match.group(1) or match.group(2)
 
     # Try Hugging Face paper page URL
     match = HF_PAPER_PATTERN.match(url)
@@ -101,6 +159,52 @@ def parse_arxiv_url(url: str) -> str:
     )
 
 
+def _get_client() -> httpx.AsyncClient:
+    """Return the keep-alive client bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            follow_redirects=True, limits=ARXIV_CLIENT_LIMITS, http2=ARXIV_HTTP2
+        )
+        _clients[loop] = client
+    return client
+
+
+def shared_client() -> httpx.AsyncClient:
+    """Return the running loop's pooled client for other outbound fetchers.
+
+    Hugging Face and web-article fetches reuse it so one ``add`` (or a whole
+    ``add-batch``) keeps warm connections instead of paying DNS and TLS setup
+    per call. Callers pass their own timeout and headers per request.
+    """
+    return _get_client()
+
+
+async def aclose_client() -> None:
+    """Close the pooled client for the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def warmup(config: Config | None = None) -> None:
+    """Open keep-alive connections to the arXiv hosts ahead of first use.
+
+    Pays DNS, TCP and TLS setup up front so the first real request finds a
+    live connection in the pool. Safe to fire and forget right after
+    startup with ``asyncio.create_task(warmup())``; failures are ignored
+    and the probes do not draw from the request pacing bucket.
+    """
+    client = _get_client()
+    headers = {"User-Agent": _resolve_request_policy(config)[0]}
+    await asyncio.gather(
+        client.head("https://export.arxiv.org/", headers=headers, timeout=10.0),
+        client.head("https://arxiv.org/", headers=headers, timeout=10.0),
+        return_exceptions=True,
+    )
+
+
 def _resolve_request_policy(config: Config | None) -> tuple[str, int, float, float]:
     if config is not None:
         return (
@@ -109,7 +213,16 @@ def _resolve_request_policy(config: Config | None) -> tuple[str, int, float, flo
             max(0.1, config.arxiv_backoff_base_seconds),
             max(0.1, config.arxiv_backoff_cap_seconds),
         )
+    return _env_request_policy()
+
 
+@functools.lru_cache(maxsize=1)
+def _env_request_policy() -> tuple[str, int, float, float]:
+    """Request policy from environment variables, parsed once per process.
+
+    Call ``_env_request_policy.cache_clear()`` after changing the
+    ``PAPER_ASSIST_ARXIV_*`` variables at runtime.
+    """
     user_agent = os.getenv("PAPER_ASSIST_ARXIV_USER_AGENT", DEFAULT_ARXIV_USER_AGENT)
     max_retries = int(os.getenv("PAPER_ASSIST_ARXIV_MAX_RETRIES", DEFAULT_ARXIV_MAX_RETRIES))
     backoff_base = float(
@@ -126,37 +239,6 @@ def _resolve_request_policy(config: Config | None) -> tuple[str, int, float, flo
     )
 
 
-def _utc_now() -> datetime:
-    return datetime.now(timezone.utc)
-
-
-def _parse_retry_after_seconds(value: str | None) -> float | None:
-    if not value:
-        return None
-
-    stripped = value.strip()
-    try:
-        seconds = float(stripped)
-        return max(0.0, seconds)
-    except ValueError:
-        pass
-
-    try:
-        retry_at = parsedate_to_datetime(stripped)
-        if retry_at is None:
-            return None
-        if retry_at.tzinfo is None:
-            retry_at = retry_at.replace(tzinfo=timezone.utc)
-        return max(0.0, (retry_at - _utc_now()).total_seconds())
-    except (TypeError, ValueError):
-        return None
-
-
-def _compute_backoff_delay(attempt: int, base_seconds: float, cap_seconds: float) -> float:
-    exp = min(cap_seconds, base_seconds * (2**attempt))
-    return max(0.0, min(cap_seconds, exp * random.uniform(0.8, 1.2)))
-
-
 async def _arxiv_get_with_retries(
     *,
     client: httpx.AsyncClient,
@@ -167,22 +249,32 @@ async def _arxiv_get_with_retries(
     backoff_base_seconds: float,
     backoff_cap_seconds: float,
     accept: str,
+    timeout: float,
+    accept_encoding: str | None = None,
     fail_fast_on_429: bool = False,
     params: dict[str, str] | None = None,
+    stream: bool = False,
 ) -> httpx.Response:
+    """GET with retries; with ``stream`` the returned body is left unread."""
     total_attempts = max_retries + 1
+    headers = {"User-Agent": user_agent, "Accept": accept}
+    if accept_encoding:
+        headers["Accept-Encoding"] = accept_encoding
 
     for attempt in range(total_attempts):
+        await _ARXIV_BUCKET.acquire()
         try:
-            resp = await client.get(
-                url,
-                params=params,
-                headers={"User-Agent": user_agent, "Accept": accept},
-            )
+            if stream:
+                request = client.build_request(
+                    "GET", url, params=params, headers=headers, timeout=timeout
+                )
+                resp = await client.send(request, stream=True)
+            else:
+                resp = await client.get(url, params=params, headers=headers, timeout=timeout)
         except (httpx.TimeoutException, httpx.TransportError) as exc:
             if attempt == max_retries:
                 raise
-            delay = _compute_backoff_delay(attempt, backoff_base_seconds, backoff_cap_seconds)
+            delay = compute_backoff_delay(attempt, backoff_base_seconds, backoff_cap_seconds)
             logger.warning(
                 "arXiv %s request failed (%s), retry %d/%d in %.1fs",
                 request_label,
@@ -194,8 +286,12 @@ async def _arxiv_get_with_retries(
             await asyncio.sleep(delay)
             continue
 
+        if resp.is_error:
+            # Release the connection before retrying or raising
+            await resp.aclose()
+
         if resp.status_code == 429:
-            retry_after_seconds = _parse_retry_after_seconds(resp.headers.get("Retry-After"))
+            retry_after_seconds = server_retry_delay(resp)
             if fail_fast_on_429:
                 raise ArxivRateLimitError(
                     attempts=attempt + 1,
@@ -207,9 +303,9 @@ async def _arxiv_get_with_retries(
                     retry_after_seconds=retry_after_seconds,
                 )
             delay = (
-                retry_after_seconds
+                min(retry_after_seconds, backoff_cap_seconds)
                 if retry_after_seconds is not None
-                else _compute_backoff_delay(attempt, backoff_base_seconds, backoff_cap_seconds)
+                else compute_backoff_delay(attempt, backoff_base_seconds, backoff_cap_seconds)
             )
             logger.warning(
                 "arXiv %s rate limited (429), retry %d/%d in %.1fs",
@@ -218,13 +314,21 @@ async def _arxiv_get_with_retries(
                 total_attempts,
                 delay,
             )
-            await asyncio.sleep(delay)
+            # The limit is per client, so pause the shared pacing bucket; the
+            # acquire at the top of the loop waits it out with every sibling
+            _ARXIV_BUCKET.defer(delay)
             continue
 
         if 500 <= resp.status_code < 600:
             if attempt == max_retries:
                 resp.raise_for_status()
-            delay = _compute_backoff_delay(attempt, backoff_base_seconds, backoff_cap_seconds)
+            # A 503 with a server hint means "come back at T": one exact sleep
+            retry_after_seconds = server_retry_delay(resp)
+            delay = (
+                min(retry_after_seconds, backoff_cap_seconds)
+                if retry_after_seconds is not None
+                else compute_backoff_delay(attempt, backoff_base_seconds, backoff_cap_seconds)
+            )
             logger.warning(
                 "arXiv %s server error (%d), retry %d/%d in %.1fs",
                 request_label,
@@ -242,10 +346,86 @@ async def _arxiv_get_with_retries(
     raise RuntimeError("Unreachable: arXiv retry loop exited without response")
 
 
+@asynccontextmanager
+async def _arxiv_stream_with_retries(**kwargs: Any) -> AsyncIterator[httpx.Response]:
+    """Open a streamed arXiv response; retries happen before any body bytes are read."""
+    resp = await _arxiv_get_with_retries(stream=True, **kwargs)
+    try:
+        yield resp
+    finally:
+        await resp.aclose()
+
+
+def _metadata_cache_path(arxiv_id: str, config: Config) -> Path:
+    return config.arxiv_cache_dir / f"{arxiv_id}.json"
+
+
+def _read_cached_metadata(arxiv_id: str, config: Config | None) -> PaperMetadata | None:
+    """Return cached API metadata younger than the TTL, or None."""
+    if config is None:
+        return None
+    return read_json_cache(
+        _metadata_cache_path(arxiv_id, config),
+        ARXIV_METADATA_CACHE_TTL_SECONDS,
+        _METADATA_ADAPTER,
+    )
+
+
+def _write_cached_metadata(metadata: PaperMetadata, config: Config | None) -> None:
+    """Atomically persist API metadata; cache failures never break a fetch."""
+    if config is None or not metadata.arxiv_id:
+        return
+    write_json_cache(_metadata_cache_path(metadata.arxiv_id, config), metadata, _METADATA_ADAPTER)
+
+
 async def fetch_metadata(arxiv_id: str, config: Config | None = None) -> PaperMetadata:
-    """Fetch paper metadata from arXiv, with abs-page fallback on transient failures."""
+    """Fetch paper metadata from arXiv, with abs-page fallback on transient failures.
+
+    Successful Atom API responses are cached under ``config.arxiv_cache_dir``
+    for 24 hours. Abs-page fallback results are never cached because they
+    lack categories.
+    """
+    cached = _read_cached_metadata(arxiv_id, config)
+    if cached is not None:
+        return cached
+
+    # Concurrent callers for the same ID share one in-flight request. It runs
+    # in its own task so cancelling one caller does not cancel the others.
+    loop = asyncio.get_running_loop()
+    inflight = _inflight.setdefault(loop, {})
+    while True:
+        pending = inflight.get(arxiv_id)
+        if pending is None:
+            pending = loop.create_task(_fetch_metadata_uncoalesced(arxiv_id, config=config))
+            inflight[arxiv_id] = pending
+            pending.add_done_callback(functools.partial(_forget_inflight, inflight, arxiv_id))
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            # A cancelled shared fetch (e.g. an abandoned fetch_metadata_many
+            # batch) is not this caller's cancellation: start a fresh fetch
+            if not pending.cancelled():
+                raise
+
+
+def _forget_inflight(
+    inflight: dict[str, asyncio.Future[PaperMetadata]],
+    arxiv_id: str,
+    future: asyncio.Future[PaperMetadata],
+) -> None:
+    if inflight.get(arxiv_id) is future:
+        del inflight[arxiv_id]
+    # Mark retrieved so a failure nobody is still awaiting does not log at GC
+    if not future.cancelled():
+        future.exception()
+
+
+async def _fetch_metadata_uncoalesced(
+    arxiv_id: str,
+    config: Config | None = None,
+) -> PaperMetadata:
     try:
-        return await _fetch_metadata_from_api(arxiv_id, config=config)
+        metadata = await _fetch_metadata_from_api(arxiv_id, config=config)
     except (ArxivRateLimitError, httpx.TimeoutException, httpx.TransportError) as exc:
         logger.warning("Falling back to abs-page metadata for %s after %s", arxiv_id, exc)
         return await _fallback_abs_page_or_raise(arxiv_id=arxiv_id, config=config, original_exc=exc)
@@ -264,6 +444,9 @@ async def fetch_metadata(arxiv_id: str, config: Config | None = None) -> PaperMe
             )
         raise
 
+    _write_cached_metadata(metadata, config)
+    return metadata
+
 
 async def _fallback_abs_page_or_raise(
     *,
@@ -291,70 +474,233 @@ async def _fetch_metadata_from_api(arxiv_id: str, config: Config | None = None)
     """
     user_agent, max_retries, backoff_base, backoff_cap = _resolve_request_policy(config)
 
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        resp = await _arxiv_get_with_retries(
-            client=client,
-            url=ARXIV_API_URL,
-            request_label="metadata",
-            params={"id_list": arxiv_id},
-            user_agent=user_agent,
-            max_retries=max_retries,
-            backoff_base_seconds=backoff_base,
-            backoff_cap_seconds=backoff_cap,
-            accept="application/atom+xml, application/xml;q=0.9, */*;q=0.1",
-            fail_fast_on_429=True,
-        )
+    resp = await _arxiv_get_with_retries(
+        client=_get_client(),
+        url=ARXIV_API_URL,
+        request_label="metadata",
+        params={"id_list": arxiv_id},
+        user_agent=user_agent,
+        max_retries=max_retries,
+        backoff_base_seconds=backoff_base,
+        backoff_cap_seconds=backoff_cap,
+        accept="application/atom+xml, application/xml;q=0.9, */*;q=0.1",
+        accept_encoding=ARXIV_TEXT_ACCEPT_ENCODING,
+        fail_fast_on_429=True,
+        timeout=30.0,
+    )
 
-    root = ElementTree.fromstring(resp.text)
-    entries = root.findall(f"{{{ATOM_NS}}}entry")
+    # Stream-parse and stop at the first entry; the rest of the feed is never built
+    for entry in _iter_atom_entries(resp.content):
+        return _metadata_from_entry(entry, arxiv_id)
 
-    if not entries:
-        raise PaperNotFoundError(f"No paper found for arXiv ID: {arxiv_id}")
+    raise PaperNotFoundError(f"No paper found for arXiv ID: {arxiv_id}")
 
-    entry = entries[0]
 
-    # Check for error (arXiv returns an entry with id containing "Error")
-    entry_id = entry.findtext(f"{{{ATOM_NS}}}id", "")
-    if "Error" in entry_id:
-        raise PaperNotFoundError(f"No paper found for arXiv ID: {arxiv_id}")
+async def fetch_metadata_many(
+    arxiv_ids: list[str],
+    config: Config | None = None,
+) -> list[PaperMetadata]:
+    """Fetch metadata for many arXiv IDs with one API query per 100 uncached IDs.
 
-    title = entry.findtext(f"{{{ATOM_NS}}}title", "").strip()
-    # Collapse newlines in title (arXiv wraps long titles)
-    title = re.sub(r"\s+", " ", title)
+    Cached IDs are served from disk and IDs already being fetched by a
+    concurrent :func:`fetch_metadata` call are awaited rather than
+    re-requested. Batched queries have no abs-page fallback.
 
-    abstract = entry.findtext(f"{{{ATOM_NS}}}summary", "").strip()
+    Returns:
+        PaperMetadata for each input ID, in input order.
 
-    authors = [
-        author.findtext(f"{{{ATOM_NS}}}name", "").strip()
-        for author in entry.findall(f"{{{ATOM_NS}}}author")
-    ]
+    Raises:
+        PaperNotFoundError: If arXiv returns no entry for one or more IDs.
+        httpx.HTTPError: On network failures.
+    """
+    loop = asyncio.get_running_loop()
+    inflight = _inflight.setdefault(loop, {})
+    results: dict[str, PaperMetadata] = {}
+    pending: dict[str, asyncio.Future[PaperMetadata]] = {}
+    owned: dict[str, asyncio.Future[PaperMetadata]] = {}
+
+    for arxiv_id in dict.fromkeys(arxiv_ids):
+        cached = _read_cached_metadata(arxiv_id, config)
+        if cached is not None:
+            results[arxiv_id] = cached
+        elif arxiv_id in inflight:
+            pending[arxiv_id] = inflight[arxiv_id]
+        else:
+            owned[arxiv_id] = inflight[arxiv_id] = loop.create_future()
+
+    missing: list[str] = []
+    to_fetch = iter(list(owned))
+    try:
+        while batch := list(itertools.islice(to_fetch, ARXIV_ID_LIST_BATCH_SIZE)):
+            fetched = await _fetch_metadata_batch_from_api(batch, config=config)
+            for arxiv_id in batch:
+                future = owned.pop(arxiv_id)
+                inflight.pop(arxiv_id, None)
+                metadata = fetched.get(arxiv_id)
+                if metadata is None:
+                    missing.append(arxiv_id)
+                    future.set_exception(
+                        PaperNotFoundError(f"No paper found for arXiv ID: {arxiv_id}")
+                    )
+                    future.exception()
+                    continue
+                _write_cached_metadata(metadata, config)
+                future.set_result(metadata)
+                results[arxiv_id] = metadata
+    except BaseException as exc:
+        for arxiv_id, future in owned.items():
+            inflight.pop(arxiv_id, None)
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                future.exception()
+        raise
 
-    published_str = entry.findtext(f"{{{ATOM_NS}}}published", "")
-    published = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
+    for arxiv_id, future in pending.items():
+        try:
+            results[arxiv_id] = await asyncio.shield(future)
+        except PaperNotFoundError:
+            missing.append(arxiv_id)
 
-    categories = [
-        cat.get("term", "")
-        for cat in entry.findall(f"{{{ARXIV_NS}}}primary_category")
-    ]
-    # Also grab all categories
-    categories += [
-        cat.get("term", "")
-        for cat in entry.findall(f"{{{ATOM_NS}}}category")
-        if cat.get("term", "") not in categories
-    ]
+    if missing:
+        raise PaperNotFoundError(f"No paper found for arXiv IDs: {', '.join(missing)}")
+    return [results[arxiv_id] for arxiv_id in arxiv_ids]
+
+
+async def _fetch_metadata_batch_from_api(
+    arxiv_ids: list[str],
+    config: Config | None = None,
+) -> dict[str, PaperMetadata]:
+    """Query the Atom API for up to 100 IDs at once, keyed by arXiv ID."""
+    user_agent, max_retries, backoff_base, backoff_cap = _resolve_request_policy(config)
+
+    resp = await _arxiv_get_with_retries(
+        client=_get_client(),
+        url=ARXIV_API_URL,
+        request_label="metadata batch",
+        params={"id_list": ",".join(arxiv_ids), "max_results": str(len(arxiv_ids))},
+        user_agent=user_agent,
+        max_retries=max_retries,
+        backoff_base_seconds=backoff_base,
+        backoff_cap_seconds=backoff_cap,
+        accept="application/atom+xml, application/xml;q=0.9, */*;q=0.1",
+        accept_encoding=ARXIV_TEXT_ACCEPT_ENCODING,
+        timeout=30.0,
+    )
+
+    fetched: dict[str, PaperMetadata] = {}
+    for entry in _iter_atom_entries(resp.content):
+        try:
+            arxiv_id = parse_arxiv_url(entry.findtext(_TAG_ID, ""))
+        except ValueError:
+            continue
+        fetched[arxiv_id] = _metadata_from_entry(entry, arxiv_id)
+    return fetched
+
+
+def _iter_atom_entries(content: bytes) -> Iterator[etree._Element]:
+    """Yield each Atom ``<entry>`` as soon as it is parsed, clearing it afterwards."""
+    for _event, entry in etree.iterparse(
+        io.BytesIO(content),
+        events=("end",),
+        tag=_ATOM_ENTRY_TAG,
+        remove_blank_text=True,
+        resolve_entities=False,
+    ):
+        try:
+            yield entry
+        finally:
+            entry.clear()
 
+
+def _metadata_from_entry(entry: etree._Element, arxiv_id: str) -> PaperMetadata:
     return PaperMetadata(
         arxiv_id=arxiv_id,
-        title=title,
-        authors=authors,
-        abstract=abstract,
-        published=published,
-        categories=categories,
         arxiv_url=ARXIV_ABS_URL.format(arxiv_id=arxiv_id),
         pdf_url=ARXIV_PDF_URL.format(arxiv_id=arxiv_id),
+        **_extract_entry_fields(entry, arxiv_id),
     )
 
 
+def _extract_entry_fields(entry: etree._Element, arxiv_id: str) -> dict[str, object]:
+    """Extract PaperMetadata fields from a single Atom ``<entry>`` element.
+
+    Walks the entry's children once and dispatches on tag.
+
+    Raises:
+        PaperNotFoundError: If the entry is arXiv's error placeholder.
+    """
+    entry_id = title = abstract = published_str = ""
+    authors: list[str] = []
+    primary_categories: list[str] = []
+    categories: list[str] = []
+
+    for child in entry:
+        tag = child.tag
+        if tag == _TAG_AUTHOR:
+            authors.append(child.findtext(_TAG_NAME, "").strip())
+        elif tag == _TAG_CATEGORY:
+            categories.append(child.get("term", ""))
+        elif tag == _TAG_PRIMARY_CATEGORY:
+            primary_categories.append(child.get("term", ""))
+        elif tag == _TAG_ID:
+            entry_id = child.text or ""
+        elif tag == _TAG_TITLE:
+            title = child.text or ""
+        elif tag == _TAG_SUMMARY:
+            abstract = child.text or ""
+        elif tag == _TAG_PUBLISHED:
+            published_str = child.text or ""
+
+    # Check for error (arXiv returns an entry with id containing "Error")
+    if "Error" in entry_id:
+        raise PaperNotFoundError(f"No paper found for arXiv ID: {arxiv_id}")
+
+    # Collapse newlines and any other whitespace runs in title (arXiv wraps
+    # long titles); str.split() covers the same Unicode whitespace as \s
+    title = " ".join(title.split())
+    published = _parse_arxiv_datetime(published_str)
+
+    return {
+        "title": title,
+        "authors": authors,
+        "abstract": abstract.strip(),
+        "published": published,
+        # Primary category first, then the rest in feed order, deduplicated
+        "categories": [
+            term
+            for term in dict.fromkeys(itertools.chain(primary_categories, categories))
+            if term
+        ],
+    }
+
+
+def _parse_arxiv_datetime(value: str) -> datetime:
+    """Parse an Atom timestamp such as ``2025-03-13T17:59:59Z`` as UTC.
+
+    arXiv always emits this fixed-width form, so the fields are sliced out
+    directly instead of going through the generic ISO parser. Anything else
+    falls back to ``datetime.fromisoformat``.
+    """
+    if len(value) == 20 and value[-1] == "Z" and value[10] == "T":
+        try:
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    if sys.version_info >= (3, 11):
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 async def _fetch_metadata_from_abs_page(
     arxiv_id: str,
     config: Config | None = None,
@@ -365,20 +711,21 @@ async def _fetch_metadata_from_abs_page(
     user_agent, max_retries, backoff_base, backoff_cap = _resolve_request_policy(config)
     abs_url = ARXIV_ABS_URL.format(arxiv_id=arxiv_id)
 
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        resp = await _arxiv_get_with_retries(
-            client=client,
-            url=abs_url,
-            request_label="abs-page",
-            user_agent=user_agent,
-            max_retries=max_retries,
-            backoff_base_seconds=backoff_base,
-            backoff_cap_seconds=backoff_cap,
-            accept="text/html,application/xhtml+xml;q=0.9,*/*;q=0.1",
-            fail_fast_on_429=True,
-        )
+    resp = await _arxiv_get_with_retries(
+        client=_get_client(),
+        url=abs_url,
+        request_label="abs-page",
+        user_agent=user_agent,
+        max_retries=max_retries,
+        backoff_base_seconds=backoff_base,
+        backoff_cap_seconds=backoff_cap,
+        accept="text/html,application/xhtml+xml;q=0.9,*/*;q=0.1",
+        accept_encoding=ARXIV_TEXT_ACCEPT_ENCODING,
+        fail_fast_on_429=True,
+        timeout=30.0,
+    )
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(resp.content, "html.parser", from_encoding=resp.encoding)
 
     title = _meta_content(soup, "citation_title")
     if not title and (heading := soup.find("h1", class_="title")):
@@ -419,7 +766,7 @@ async def _fetch_metadata_from_abs_page(
     )
 
 
-def _meta_content(soup, name: str) -> str:
+def _meta_content(soup: BeautifulSoup, name: str) -> str:
     tag = soup.find("meta", attrs={"name": name})
     if tag and tag.get("content"):
         return tag["content"].strip()
@@ -446,17 +793,24 @@ def _parse_abs_page_date(value: str) -> datetime | None:
 
 
 async def download_pdf(arxiv_id: str, output_path: Path, config: Config | None = None) -> Path:
-    """Download the PDF from arXiv.
+    """Download the PDF from arXiv, reusing an existing non-empty file.
 
     Returns:
         Path to the downloaded PDF.
     """
+    if output_path.is_file() and output_path.stat().st_size > 0:
+        return output_path
+
     url = ARXIV_PDF_URL.format(arxiv_id=arxiv_id)
     user_agent, max_retries, backoff_base, backoff_cap = _resolve_request_policy(config)
 
-    async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-        resp = await _arxiv_get_with_retries(
-            client=client,
+    # Stream into a uniquely named sibling temp file and rename once complete,
+    # so any existing output_path is always a whole PDF and concurrent
+    # downloads of the same paper never write into each other's file
+    temp_path: Path | None = None
+    try:
+        async with _arxiv_stream_with_retries(
+            client=_get_client(),
             url=url,
             request_label="pdf",
             user_agent=user_agent,
@@ -464,7 +818,41 @@ async def download_pdf(arxiv_id: str, output_path: Path, config: Config | None =
             backoff_base_seconds=backoff_base,
             backoff_cap_seconds=backoff_cap,
             accept="application/pdf, */*;q=0.1",
-        )
+            timeout=60.0,
+        ) as resp:
+            with tempfile.NamedTemporaryFile(
+                dir=output_path.parent,
+                prefix=f".{output_path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                temp_path = Path(f.name)
+                async for chunk in resp.aiter_bytes(PDF_CHUNK_BYTES):
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+        apply_umask_mode(temp_path)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
+        raise
 
-    output_path.write_bytes(resp.content)
     return output_path
+
+
+async def fetch_all(
+    arxiv_id: str,
+    output_path: Path,
+    config: Config | None = None,
+) -> tuple[PaperMetadata, Path]:
+    """Fetch metadata and download the PDF concurrently over the shared client.
+
+    Latency is ``max(metadata, pdf)`` rather than their sum; the pacing
+    bucket's burst of two lets both requests start immediately.
+    """
+    metadata, pdf_path = await asyncio.gather(
+        fetch_metadata(arxiv_id, config=config),
+        download_pdf(arxiv_id, output_path, config=config),
+    )
+    return metadata, pdf_path
@@ -13,9 +13,12 @@ misconfiguration is visible.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
 import tempfile
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
@@ -24,6 +27,7 @@ from paper_assistant.config import Config
 from paper_assistant.models import Paper, ProcessingStatus
 from paper_assistant.storage import StorageManager, make_audio_filename
 from paper_assistant.tts import (
+    EdgeTTSBackend,
     EdgeTTSError,
     FfmpegMissingError,
     MlxConfigError,
@@ -32,6 +36,7 @@ from paper_assistant.tts import (
     TTSBackendError,
     get_edge_backend,
     get_tts_backend,
+    iter_speech_chunks,
     prepare_script_for_tts,
     prepare_text_for_tts,
 )
@@ -80,8 +85,12 @@ async def render_audio_assets(
         )
         return result
 
+    audio_name = make_audio_filename(paper_id)
+    audio_path = config.audio_dir / audio_name
+
     # --- Decide the script ---
     script_markdown: str | None = None
+    audio_streamed = False
     if provided_script_markdown is not None:
         script_markdown = provided_script_markdown.strip() or None
         if script_markdown is None:
@@ -103,12 +112,28 @@ async def render_audio_assets(
             "audio will use the raw summary."
         )
     else:
-        script_markdown, script_model, script_warning = await _try_generate_script(
-            config=config,
-            paper=paper,
-            source_markdown=source_markdown,
-            model_override=script_model_override,
-        )
+        primary = get_tts_backend(config)
+        streamed = None
+        if isinstance(primary, EdgeTTSBackend) and config.anthropic_api_key:
+            # Speak the script while Claude is still writing it
+            streamed = await _try_stream_script_audio(
+                config=config,
+                backend=primary,
+                paper=paper,
+                source_markdown=source_markdown,
+                model_override=script_model_override,
+                audio_path=audio_path,
+            )
+        if streamed is not None:
+            script_markdown, script_model, script_warning = streamed
+            audio_streamed = script_markdown is not None
+        else:
+            script_markdown, script_model, script_warning = await _try_generate_script(
+                config=config,
+                paper=paper,
+                source_markdown=source_markdown,
+                model_override=script_model_override,
+            )
         if script_model:
             result.script_model = script_model
         if script_warning:
@@ -124,30 +149,48 @@ async def render_audio_assets(
             result.warnings.append(f"Failed to persist transcript: {exc}")
             script_markdown = None
 
-    # --- Choose TTS input ---
-    if script_markdown:
-        tts_text = prepare_script_for_tts(script_markdown)
+    backend_used: Literal["mlx", "edge"] | None
+    tts_hash: str | None = None
+    audio_reused = False
+    if audio_streamed:
+        backend_used = "edge"
+        if script_markdown:
+            # The streamed chunks speak this same script, so fingerprint it as one text
+            tts_hash = tts_fingerprint(config, prepare_script_for_tts(script_markdown))
     else:
-        tts_text = prepare_text_for_tts(
-            source_markdown,
-            paper.metadata.title,
-            paper.metadata.authors,
-            source_label=paper.metadata.source_label,
-        )
+        # --- Choose TTS input ---
+        if script_markdown:
+            tts_text = prepare_script_for_tts(script_markdown)
+        else:
+            tts_text = prepare_text_for_tts(
+                source_markdown,
+                paper.metadata.title,
+                paper.metadata.authors,
+                source_label=paper.metadata.source_label,
+            )
 
-    # --- Synthesize audio ---
-    audio_path = config.audio_dir / make_audio_filename(paper_id)
-    backend_used = await _synthesize_with_fallback(
-        config=config,
-        text=tts_text,
-        audio_path=audio_path,
-        warnings=result.warnings,
-    )
+        # --- Synthesize audio, unless the existing MP3 already speaks this text ---
+        tts_hash = tts_fingerprint(config, tts_text)
+        current = storage.get_paper(paper_id) or paper
+        if audio_path.exists() and current.audio_path and current.tts_hash == tts_hash:
+            audio_reused = True
+            backend_used = None
+        else:
+            backend_used = await _synthesize_with_fallback(
+                config=config,
+                text=tts_text,
+                audio_path=audio_path,
+                warnings=result.warnings,
+            )
+            if backend_used != config.tts_backend:
+                # A fallback voice must not satisfy the next primary-backend check
+                tts_hash = None
 
-    if backend_used is not None and audio_path.exists():
+    if audio_reused or (backend_used is not None and audio_path.exists()):
         try:
             paper_for_update = storage.get_paper(paper_id) or paper
-            paper_for_update.audio_path = f"audio/{make_audio_filename(paper_id)}"
+            paper_for_update.audio_path = f"audio/{audio_name}"
+            paper_for_update.tts_hash = tts_hash
             paper_for_update.status = ProcessingStatus.AUDIO_GENERATED
             storage.add_paper(paper_for_update)
         except Exception as exc:
@@ -164,6 +207,25 @@ async def render_audio_assets(
     return result
 
 
+def tts_fingerprint(config: Config, text: str) -> str:
+    """Hash the narration text together with every setting that shapes the voice."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        config.tts_backend,
+        config.tts_voice,
+        config.tts_rate,
+        config.mlx_tts_model,
+        config.mlx_tts_voice or "",
+        config.mlx_tts_speaker or "",
+        str(config.mlx_tts_speed),
+        text,
+    ):
+        data = part.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
 async def _try_generate_script(
     *,
     config: Config,
@@ -196,6 +258,86 @@ async def _try_generate_script(
     return script_result.script_markdown, script_result.model_used, None
 
 
+async def _try_stream_script_audio(
+    *,
+    config: Config,
+    backend: EdgeTTSBackend,
+    paper: Paper,
+    source_markdown: str,
+    model_override: str | None,
+    audio_path: Path,
+) -> tuple[str | None, str | None, str | None] | None:
+    """Generate the narration script and synthesize it paragraph by paragraph.
+
+    Returns ``(script, model, warning)`` like :func:`_try_generate_script`;
+    a non-None script means the audio at ``audio_path`` was published. A
+    script failure returns ``(None, None, warning)`` so the caller narrates
+    the raw summary. A TTS failure returns ``None`` so the caller retries the
+    non-streaming path with its usual fallback and warnings.
+    """
+    from paper_assistant.audio_script import AudioScriptError, stream_audio_script
+
+    parts: list[str] = []
+
+    async def _deltas() -> AsyncIterator[str]:
+        async for delta in stream_audio_script(
+            markdown=source_markdown,
+            metadata=paper.metadata,
+            config=config,
+            model=model_override,
+        ):
+            parts.append(delta)
+            yield delta
+
+    async def _speech() -> AsyncIterator[str]:
+        async for chunk in iter_speech_chunks(_deltas()):
+            text = prepare_script_for_tts(chunk)
+            if text:
+                yield text
+
+    speech = _read_ahead(_speech())
+    try:
+        await _publish_audio(
+            backend.name,
+            audio_path,
+            lambda temp_path: backend.synthesize_stream(speech, temp_path),
+        )
+    except AudioScriptError as exc:
+        return None, None, f"Transcript generation failed ({exc}); audio uses raw summary."
+    except (TTSBackendError, OSError) as exc:
+        logger.warning("Streaming narration failed, retrying without streaming: %s", exc)
+        return None
+    finally:
+        # Stops the background Claude stream if TTS bailed out early
+        await speech.aclose()
+
+    return "".join(parts).strip(), model_override or config.audio_script_model, None
+
+
+_END_OF_STREAM = object()
+
+
+async def _read_ahead(source: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Drain ``source`` in a background task so the producer never waits on TTS."""
+    queue: asyncio.Queue[object] = asyncio.Queue()
+
+    async def _pump() -> None:
+        try:
+            async for item in source:
+                queue.put_nowait(item)
+        finally:
+            queue.put_nowait(_END_OF_STREAM)
+
+    task = asyncio.create_task(_pump())
+    try:
+        while (item := await queue.get()) is not _END_OF_STREAM:
+            yield item
+        # Re-raises whatever stopped the source early
+        await task
+    finally:
+        task.cancel()
+
+
 async def _synthesize_with_fallback(
     *,
     config: Config,
@@ -261,6 +403,17 @@ async def _try_edge(
 
 async def _synthesize_to_temporary_path(backend, text: str, audio_path: Path) -> None:
     """Publish backend output atomically so failed regeneration keeps old audio."""
+    await _publish_audio(
+        backend.name, audio_path, lambda temp_path: backend.synthesize(text, temp_path)
+    )
+
+
+async def _publish_audio(
+    backend_name: str,
+    audio_path: Path,
+    write: Callable[[Path], Awaitable[object]],
+) -> None:
+    """Run ``write`` against a sibling temp file, then move it over ``audio_path``."""
     audio_path.parent.mkdir(parents=True, exist_ok=True)
     temp_path: Path | None = None
     try:
@@ -271,9 +424,9 @@ async def _synthesize_to_temporary_path(backend, text: str, audio_path: Path) ->
             delete=False,
         ) as temp_file:
             temp_path = Path(temp_file.name)
-        await backend.synthesize(text, temp_path)
+        await write(temp_path)
         if not temp_path.exists() or temp_path.stat().st_size == 0:
-            raise TTSBackendError(f"{backend.name} produced no audio data.")
+            raise TTSBackendError(f"{backend_name} produced no audio data.")
         os.replace(temp_path, audio_path)
     finally:
         if temp_path is not None and temp_path.exists():
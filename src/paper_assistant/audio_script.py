@@ -8,6 +8,7 @@ inside the installed wheel.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -69,13 +70,13 @@ def _format_user_message(markdown: str, metadata: PaperMetadata) -> str:
     )
 
 
-async def generate_audio_script(
+def _request_kwargs(
     markdown: str,
     metadata: PaperMetadata,
     config: Config,
-    model: str | None = None,
-) -> AudioScriptResult:
-    """Generate a narration script from a stored summary body."""
+    model: str | None,
+) -> dict[str, object]:
+    """Validate inputs and build the ``messages`` request shared by both entry points."""
     if not config.anthropic_api_key:
         raise AudioScriptError(
             "ANTHROPIC_API_KEY is required for narration script generation."
@@ -83,20 +84,30 @@ async def generate_audio_script(
     if not markdown.strip():
         raise AudioScriptError("Source markdown is empty.")
 
-    chosen_model = model or config.audio_script_model
-    system_prompt = _load_system_prompt()
+    return {
+        "model": model or config.audio_script_model,
+        "max_tokens": 4096,
+        "system": _load_system_prompt(),
+        "messages": [
+            {"role": "user", "content": _format_user_message(markdown, metadata)}
+        ],
+    }
+
+
+async def generate_audio_script(
+    markdown: str,
+    metadata: PaperMetadata,
+    config: Config,
+    model: str | None = None,
+) -> AudioScriptResult:
+    """Generate a narration script from a stored summary body."""
+    request = _request_kwargs(markdown, metadata, config, model)
+    chosen_model = request["model"]
 
     client = anthropic.AsyncAnthropic(api_key=config.anthropic_api_key)
 
     try:
-        response = await client.messages.create(
-            model=chosen_model,
-            max_tokens=4096,
-            system=system_prompt,
-            messages=[
-                {"role": "user", "content": _format_user_message(markdown, metadata)}
-            ],
-        )
+        response = await client.messages.create(**request)
     except anthropic.APIError as exc:
         raise AudioScriptError(f"Claude API error: {exc}") from exc
     except Exception as exc:
@@ -115,3 +126,33 @@ async def generate_audio_script(
         input_tokens=getattr(response.usage, "input_tokens", 0),
         output_tokens=getattr(response.usage, "output_tokens", 0),
     )
+
+
+async def stream_audio_script(
+    markdown: str,
+    metadata: PaperMetadata,
+    config: Config,
+    model: str | None = None,
+) -> AsyncIterator[str]:
+    """Yield narration script text deltas as Claude writes them.
+
+    Lets callers start speech synthesis before the script is complete. Raises
+    :class:`AudioScriptError` under the same conditions as
+    :func:`generate_audio_script`, including an empty script.
+    """
+    request = _request_kwargs(markdown, metadata, config, model)
+    client = anthropic.AsyncAnthropic(api_key=config.anthropic_api_key)
+
+    produced = False
+    try:
+        async with client.messages.stream(**request) as stream:
+            async for text in stream.text_stream:
+                produced = produced or bool(text.strip())
+                yield text
+    except anthropic.APIError as exc:
+        raise AudioScriptError(f"Claude API error: {exc}") from exc
+    except Exception as exc:
+        raise AudioScriptError(f"Unexpected script generation error: {exc}") from exc
+
+    if not produced:
+        raise AudioScriptError("Claude returned an empty narration script.")
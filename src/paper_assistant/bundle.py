@@ -9,6 +9,8 @@ from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
 from typing import Iterable
 
+from pydantic import TypeAdapter
+
 from paper_assistant.config import Config
 from paper_assistant.models import Paper
 from paper_assistant.storage import StorageManager
@@ -22,6 +24,8 @@ FILES_PREFIX = "files"
 _ASSET_ATTRS = ("summary_path", "transcript_path", "audio_path", "pdf_path")
 _ALLOWED_ASSET_DIRS = {"papers", "transcripts", "audio", "pdfs"}
 _NOTION_EXPORT_FIELDS = {"notion_page_id", "notion_modified_at", "last_synced_at"}
+# Validates a whole manifest's papers mapping in one pydantic-core call
+_PAPERS_ADAPTER = TypeAdapter(dict[str, Paper])
 
 
 @dataclass
@@ -270,15 +274,13 @@ def _read_manifest(zf: zipfile.ZipFile) -> dict[str, Paper]:
     if not isinstance(raw_papers, dict):
         raise ValueError("Bundle manifest has no papers mapping")
 
-    papers: dict[str, Paper] = {}
-    for paper_id, raw_paper in raw_papers.items():
-        paper = Paper.model_validate(raw_paper)
+    papers = _PAPERS_ADAPTER.validate_python(raw_papers)
+    for paper_id, paper in papers.items():
         if paper.metadata.paper_id != paper_id:
             raise ValueError(
                 f"Bundle manifest key {paper_id!r} does not match paper_id "
                 f"{paper.metadata.paper_id!r}"
             )
-        papers[paper_id] = paper
     return papers
 
 
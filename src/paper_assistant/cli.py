@@ -2,19 +2,79 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 from pathlib import Path
 import re
 import subprocess
+import sys
 import tempfile
+from typing import TYPE_CHECKING
 
 import click
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.table import Table
 
-console = Console()
+if TYPE_CHECKING:
+    from paper_assistant.config import Config
+    from paper_assistant.storage import StorageManager
+
+# Syntax highlighting only matters when styles reach a terminal
+console = Console(highlight=sys.stdout.isatty())
+
+
+def _get_config(obj: dict) -> Config:
+    """Load the config once per invocation and cache it on the Click context object.
+
+    ``add-batch`` runs every URL against the same object, so the adds share
+    one load instead of re-reading ``.env`` and the environment per URL.
+    """
+    config = obj.get("_config")
+    if config is None:
+        from paper_assistant.config import load_config
+
+        config = load_config(**{k: v for k, v in obj.items() if not k.startswith("_")})
+        obj["_config"] = config
+    return config
+
+
+def _get_storage(obj: dict) -> StorageManager:
+    """Return the invocation's shared StorageManager, creating it on first use.
+
+    The manager keeps its parsed index between lookups, so sharing it lets a
+    command read ``index.json`` once. The add paths build their own managers
+    because ``add-batch`` runs them concurrently, each in its own transaction.
+    """
+    storage = obj.get("_storage")
+    if storage is None:
+        from paper_assistant.storage import StorageManager
+
+        storage = StorageManager(_get_config(obj), reuse_index=True)
+        obj["_storage"] = storage
+    return storage
+
+
+async def _close_client_after(coro):
+    from paper_assistant.arxiv import aclose_client
+
+    try:
+        return await coro
+    finally:
+        await aclose_client()
+
+
+def _run(coro):
+    """Run a command's coroutine, on uvloop when it is installed.
+
+    uvloop is a soft dependency (the ``speedups`` extra); without it this is
+    plain ``asyncio.run``. The pooled HTTP client shared by the fetchers is
+    closed before the loop shuts down, so keep-alive connections end cleanly.
+    """
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(_close_client_after(coro))
+    return uvloop.run(_close_client_after(coro))
 
 
 @click.group()
@@ -48,6 +108,11 @@ def main(ctx: click.Context, data_dir: str | None) -> None:
 )
 @click.option("--tags", "-t", multiple=True, help="Tags to apply to this paper.")
 @click.option("--force", is_flag=True, help="Re-process even if paper already exists.")
+@click.option(
+    "--no-llm-cache",
+    is_flag=True,
+    help="Always call Claude, even if an identical summary request is cached.",
+)
 @click.pass_context
 def add(
     ctx: click.Context,
@@ -57,6 +122,7 @@ def add(
     skip_transcript: bool,
     tags: tuple[str, ...],
     force: bool,
+    no_llm_cache: bool,
 ) -> None:
     """Add and summarize a paper from an arXiv ID, paper URL, or web article URL.
 
@@ -66,8 +132,17 @@ def add(
       paper-assist add https://huggingface.co/papers/2503.10291
       paper-assist add https://example.com/blog/article
     """
-    asyncio.run(
-        _add_paper(ctx.obj, url, native_pdf, skip_audio, skip_transcript, list(tags), force)
+    _run(
+        _add_paper(
+            ctx.obj,
+            url,
+            native_pdf,
+            skip_audio,
+            skip_transcript,
+            list(tags),
+            force,
+            use_llm_cache=not no_llm_cache,
+        )
     )
 
 
@@ -79,15 +154,157 @@ async def _add_paper(
     skip_transcript: bool = False,
     tags: list[str] | None = None,
     force: bool = False,
+    *,
+    use_llm_cache: bool = True,
 ) -> None:
     """Full pipeline: fetch -> extract -> summarize -> TTS -> RSS."""
     from paper_assistant.web_article import is_arxiv_url
 
     tag_list = list(tags or [])
     if is_arxiv_url(url):
-        await _add_arxiv_paper(obj, url, native_pdf, skip_audio, skip_transcript, tag_list, force)
+        await _add_arxiv_paper(
+            obj,
+            url,
+            native_pdf,
+            skip_audio,
+            skip_transcript,
+            tag_list,
+            force,
+            use_llm_cache=use_llm_cache,
+        )
     else:
-        await _add_web_article(obj, url, skip_audio, skip_transcript, tag_list, force)
+        await _add_web_article(
+            obj, url, skip_audio, skip_transcript, tag_list, force, use_llm_cache=use_llm_cache
+        )
+
+
+@main.command("add-batch")
+@click.argument("urls", nargs=-1)
+@click.option(
+    "--from-file",
+    "from_file",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Read additional URLs from a file (one per line, # starts a comment).",
+)
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Maximum number of papers processed at once.",
+)
+@click.option(
+    "--native-pdf",
+    is_flag=True,
+    help="When PDF fallback is needed, send raw PDF to Claude instead of extracted text.",
+)
+@click.option("--skip-audio", is_flag=True, help="Skip TTS audio generation.")
+@click.option(
+    "--skip-transcript",
+    is_flag=True,
+    help="Skip the derived narration transcript (TTS uses the raw summary).",
+)
+@click.option("--tags", "-t", multiple=True, help="Tags to apply to every paper.")
+@click.option("--force", is_flag=True, help="Re-process even if a paper already exists.")
+@click.option(
+    "--no-llm-cache",
+    is_flag=True,
+    help="Always call Claude, even if an identical summary request is cached.",
+)
+@click.pass_context
+def add_batch(
+    ctx: click.Context,
+    urls: tuple[str, ...],
+    from_file: str | None,
+    concurrency: int,
+    native_pdf: bool,
+    skip_audio: bool,
+    skip_transcript: bool,
+    tags: tuple[str, ...],
+    force: bool,
+    no_llm_cache: bool,
+) -> None:
+    """Add several papers or articles concurrently in one process.
+
+    Examples:
+      paper-assist add-batch 2503.10291 2501.09898
+      paper-assist add-batch --from-file urls.txt -j 8
+    """
+    all_urls = list(urls)
+    if from_file:
+        for line in Path(from_file).read_text(encoding="utf-8").splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                all_urls.append(line)
+    # Keep order but drop repeats so the same paper is never processed twice at once
+    all_urls = list(dict.fromkeys(all_urls))
+    if not all_urls:
+        raise click.UsageError("Provide at least one URL or --from-file.")
+
+    failures = _run(
+        _add_papers_batch(
+            ctx.obj,
+            all_urls,
+            concurrency,
+            native_pdf,
+            skip_audio,
+            skip_transcript,
+            list(tags),
+            force,
+            use_llm_cache=not no_llm_cache,
+        )
+    )
+    if failures:
+        raise click.ClickException(f"{len(failures)} of {len(all_urls)} URLs failed.")
+
+
+async def _add_papers_batch(
+    obj: dict,
+    urls: list[str],
+    concurrency: int,
+    native_pdf: bool,
+    skip_audio: bool,
+    skip_transcript: bool = False,
+    tags: list[str] | None = None,
+    force: bool = False,
+    *,
+    use_llm_cache: bool = True,
+) -> dict[str, BaseException]:
+    """Run ``_add_paper`` for each URL, at most ``concurrency`` at a time.
+
+    A failure in one URL does not cancel the others; unexpected errors are
+    collected and returned keyed by URL.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(url: str) -> None:
+        async with semaphore:
+            console.print(f"[bold cyan]==> {url}[/bold cyan]")
+            await _add_paper(
+                obj,
+                url,
+                native_pdf,
+                skip_audio,
+                skip_transcript,
+                tags,
+                force,
+                use_llm_cache=use_llm_cache,
+            )
+
+    results = await asyncio.gather(*(_one(url) for url in urls), return_exceptions=True)
+    failures = {
+        url: result for url, result in zip(urls, results) if isinstance(result, BaseException)
+    }
+    for url, exc in failures.items():
+        console.print(f"[red]Failed:[/red] {url}: {exc}")
+    console.print(
+        f"[bold]Batch complete:[/bold] {len(urls) - len(failures)}/{len(urls)} processed"
+    )
+    return failures
 
 
 async def _add_arxiv_paper(
@@ -98,11 +315,13 @@ async def _add_arxiv_paper(
     skip_transcript: bool = False,
     tags: list[str] | None = None,
     force: bool = False,
+    *,
+    use_llm_cache: bool = True,
 ) -> None:
     """arXiv paper pipeline: fetch -> extract -> summarize -> TTS -> RSS."""
-    tags = list(tags or [])
+    import asyncio
+
     from paper_assistant.arxiv import download_pdf, fetch_metadata as fetch_arxiv_metadata, parse_arxiv_url
-    from paper_assistant.config import load_config
     from paper_assistant.hf_papers import (
         fetch_markdown_body as fetch_hf_markdown_body,
         fetch_metadata as fetch_hf_metadata,
@@ -114,7 +333,9 @@ async def _add_arxiv_paper(
         summarize_paper_pdf,
         summarize_paper_text,
     )
-    config = load_config(**obj)
+
+    tags = list(tags or [])
+    config = _get_config(obj)
     if not config.anthropic_api_key:
         console.print(
             "[red]ANTHROPIC_API_KEY is required for summarization.[/red] "
@@ -122,7 +343,7 @@ async def _add_arxiv_paper(
         )
         return
     config.ensure_dirs()
-    storage = StorageManager(config)
+    storage = StorageManager(config, reuse_index=True)
 
     # Step 1: Parse URL and fetch metadata
     console.print("[bold]Step 1/5:[/bold] Parsing arXiv URL...")
@@ -139,119 +360,140 @@ async def _add_arxiv_paper(
         return
 
     console.print(f"[bold]Step 1/5:[/bold] Fetching metadata for {arxiv_id}...")
+    # The HF markdown body only needs the arXiv ID, so fetch it while metadata loads
+    body_task = asyncio.create_task(fetch_hf_markdown_body(arxiv_id, config=config))
+    # Every exit below must reap the body task, including errors and early returns
     try:
-        metadata = await fetch_hf_metadata(arxiv_id, config=config)
-        console.print("  Source: Hugging Face paper metadata")
-    except Exception as e:
-        console.print(f"  [yellow]HF metadata unavailable:[/yellow] {e}")
+        metadata = None
         try:
-            metadata = await fetch_arxiv_metadata(arxiv_id, config=config)
-            console.print("  Source: arXiv metadata fallback")
-        except Exception as fallback_exc:
-            console.print(f"[red]Error fetching metadata:[/red] {fallback_exc}")
+            metadata = await fetch_hf_metadata(arxiv_id, config=config)
+            console.print("  Source: Hugging Face paper metadata")
+        except Exception as e:
+            console.print(f"  [yellow]HF metadata unavailable:[/yellow] {e}")
+            try:
+                metadata = await fetch_arxiv_metadata(arxiv_id, config=config)
+                console.print("  Source: arXiv metadata fallback")
+            except Exception as fallback_exc:
+                console.print(f"[red]Error fetching metadata:[/red] {fallback_exc}")
+        if metadata is None:
             return
 
-    paper_id = metadata.paper_id
-    console.print(f"  Title: [cyan]{metadata.title}[/cyan]")
-    console.print(f"  Authors: {', '.join(metadata.authors[:3])}")
-
-    # Create paper record early
-    paper = Paper(
-        metadata=metadata,
-        tags=tags,
-        status=ProcessingStatus.PENDING,
-    )
-    storage.add_paper(paper)
+        paper_id = metadata.paper_id
+        console.print(f"  Title: [cyan]{metadata.title}[/cyan]")
+        console.print(f"  Authors: {', '.join(metadata.authors[:3])}")
 
-    # Step 2: Fetch paper content
-    console.print("[bold]Step 2/5:[/bold] Fetching paper content...")
-    paper_text: str | None = None
-    pdf_path = config.pdfs_dir / make_pdf_filename(paper_id)
-    try:
-        paper_text = await fetch_hf_markdown_body(arxiv_id, config=config)
-        paper.status = ProcessingStatus.FETCHED
-        storage.add_paper(paper)
-        console.print(f"  Source: Hugging Face arXiv HTML markdown ({len(paper_text)} characters)")
-    except Exception as e:
-        console.print(f"  [yellow]HF markdown unavailable or rejected:[/yellow] {e}")
-        console.print("  Falling back to PDF.")
-        try:
-            await download_pdf(arxiv_id, pdf_path, config=config)
-            paper.pdf_path = f"pdfs/{make_pdf_filename(paper_id)}"
-            paper.status = ProcessingStatus.FETCHED
-            storage.add_paper(paper)
-        except Exception as pdf_exc:
-            console.print(f"[red]Error downloading PDF:[/red] {pdf_exc}")
-            paper.status = ProcessingStatus.ERROR
-            paper.error_message = str(pdf_exc)
+        # Coalesce the per-step index writes into one write at the end
+        with storage.transaction():
+            # Create paper record early
+            existing = storage.get_paper(paper_id)
+            paper = Paper(
+                metadata=metadata,
+                tags=tags,
+                status=ProcessingStatus.PENDING,
+                # Keep the current MP3 on --force so unchanged narration is reused
+                audio_path=existing.audio_path if existing else None,
+                tts_hash=existing.tts_hash if existing else None,
+            )
             storage.add_paper(paper)
-            return
-
-    # Step 3: Summarize with Claude
-    console.print(f"[bold]Step 3/5:[/bold] Summarizing with {config.claude_model}...")
-    try:
-        if paper_text is not None:
-            result = await summarize_paper_text(config, metadata, paper_text)
-        elif native_pdf:
-            result = await summarize_paper_pdf(config, metadata, pdf_path)
-        else:
-            from paper_assistant.pdf import extract_text_from_pdf
-
-            paper_text = extract_text_from_pdf(pdf_path)
-            result = await summarize_paper_text(config, metadata, paper_text)
 
-        from paper_assistant.visuals import enrich_summary_with_visuals
-
-        result.full_markdown = enrich_summary_with_visuals(
-            full_markdown=result.full_markdown,
-            source_markdown=paper_text,
-        )
-
-        summary_content = format_summary_file(metadata, result)
-        summary_path = storage.save_summary(paper_id, summary_content)
-        paper = storage.get_paper(paper_id)  # Re-fetch with updated summary_path
-        paper.model_used = result.model_used
-        paper.token_count = result.input_tokens + result.output_tokens
-        console.print(
-            f"  Tokens used: {result.input_tokens} in + {result.output_tokens} out"
-        )
-    except Exception as e:
-        console.print(f"[red]Error during summarization:[/red] {e}")
-        paper.status = ProcessingStatus.ERROR
-        paper.error_message = str(e)
-        storage.add_paper(paper)
-        return
-
-    # Step 4: Generate audio
-    await _generate_audio_step(
-        config, storage, paper_id, result.full_markdown, skip_audio, skip_transcript, "4/5"
-    )
-    paper = storage.get_paper(paper_id) or paper
-
-    # Step 5: Update RSS feed
-    _update_feed_step(config, storage, paper, "5/5")
+            # Step 2: Fetch paper content
+            console.print("[bold]Step 2/5:[/bold] Fetching paper content...")
+            paper_text: str | None = None
+            pdf_name = make_pdf_filename(paper_id)
+            pdf_path = config.pdfs_dir / pdf_name
+            try:
+                paper_text = await body_task
+                paper.status = ProcessingStatus.FETCHED
+                storage.add_paper(paper)
+                console.print(
+                    f"  Source: Hugging Face arXiv HTML markdown ({len(paper_text)} characters)"
+                )
+            except Exception as e:
+                console.print(f"  [yellow]HF markdown unavailable or rejected:[/yellow] {e}")
+                console.print("  Falling back to PDF.")
+                try:
+                    await download_pdf(arxiv_id, pdf_path, config=config)
+                    paper.pdf_path = f"pdfs/{pdf_name}"
+                    paper.status = ProcessingStatus.FETCHED
+                    storage.add_paper(paper)
+                except Exception as pdf_exc:
+                    console.print(f"[red]Error downloading PDF:[/red] {pdf_exc}")
+                    paper.status = ProcessingStatus.ERROR
+                    paper.error_message = str(pdf_exc)
+                    storage.add_paper(paper)
+                    return
+
+            # Step 3: Summarize with Claude
+            console.print(f"[bold]Step 3/5:[/bold] Summarizing with {config.claude_model}...")
+            try:
+                if paper_text is not None:
+                    result = await summarize_paper_text(
+                        config, metadata, paper_text, use_cache=use_llm_cache
+                    )
+                elif native_pdf:
+                    result = await summarize_paper_pdf(
+                        config, metadata, pdf_path, use_cache=use_llm_cache
+                    )
+                else:
+                    from paper_assistant.pdf import extract_text_from_pdf_bounded
+
+                    # PDF parsing is CPU-bound; keep the event loop free for sibling adds
+                    paper_text, pages_used, page_count = await asyncio.to_thread(
+                        extract_text_from_pdf_bounded,
+                        pdf_path,
+                        max_chars=config.max_extract_chars,
+                        max_pages=config.max_pdf_pages,
+                    )
+                    if pages_used < page_count:
+                        console.print(
+                            f"  Extracted the first {pages_used} of {page_count} PDF pages "
+                            f"({len(paper_text)} characters)"
+                        )
+                    result = await summarize_paper_text(
+                        config, metadata, paper_text, use_cache=use_llm_cache
+                    )
+
+                from paper_assistant.visuals import enrich_summary_with_visuals
+
+                result.full_markdown = enrich_summary_with_visuals(
+                    full_markdown=result.full_markdown,
+                    source_markdown=paper_text,
+                )
 
-    # Copy audio to iCloud Drive for iPhone access
-    if paper.audio_path and config.icloud_sync:
-        _copy_to_icloud(config, paper, metadata.title, paper_id)
+                summary_content = format_summary_file(metadata, result)
+                summary_path = storage.save_summary(paper_id, summary_content, paper=paper)
+                paper.model_used = result.model_used
+                paper.token_count = result.total_input_tokens + result.output_tokens
+                _print_token_usage(result)
+            except Exception as e:
+                console.print(f"[red]Error during summarization:[/red] {e}")
+                paper.status = ProcessingStatus.ERROR
+                paper.error_message = str(e)
+                storage.add_paper(paper)
+                return
+
+            # Step 4: Generate audio
+            await _generate_audio_step(
+                config, storage, paper_id, result.full_markdown, skip_audio, skip_transcript, "4/5"
+            )
+            paper = storage.get_paper(paper_id) or paper
 
-    # Update search index
-    from paper_assistant.search import get_search_manager
+            # Step 5: Update RSS feed
+            await _update_feed_step(config, storage, paper, "5/5")
 
-    search_mgr = get_search_manager(config)
-    if search_mgr:
-        try:
-            search_mgr.sync_paper(paper_id, storage)
-        except Exception:
-            console.print("[yellow]Warning: Search index update failed.[/yellow]")
+            # iCloud copy and search indexing are independent; run them together
+            await _publish_outputs_step(config, storage, paper, metadata.title, paper_id)
 
-    console.print()
-    console.print("[green]Done![/green] Paper processed successfully.")
-    console.print(f"  Summary: {summary_path}")
-    if paper.transcript_path:
-        console.print(f"  Transcript: {config.data_dir / paper.transcript_path}")
-    if paper.audio_path:
-        console.print(f"  Audio:   {config.data_dir / paper.audio_path}")
+            console.print()
+            console.print("[green]Done![/green] Paper processed successfully.")
+            console.print(f"  Summary: {summary_path}")
+            if paper.transcript_path:
+                console.print(f"  Transcript: {config.data_dir / paper.transcript_path}")
+            if paper.audio_path:
+                console.print(f"  Audio:   {config.data_dir / paper.audio_path}")
+    finally:
+        body_task.cancel()
+        await asyncio.gather(body_task, return_exceptions=True)
 
 
 async def _add_web_article(
@@ -261,16 +503,17 @@ async def _add_web_article(
     skip_transcript: bool = False,
     tags: list[str] | None = None,
     force: bool = False,
+    *,
+    use_llm_cache: bool = True,
 ) -> None:
     """Web article pipeline: fetch -> summarize -> TTS -> RSS."""
     tags = list(tags or [])
-    from paper_assistant.config import load_config
     from paper_assistant.models import Paper, ProcessingStatus
     from paper_assistant.storage import StorageManager
     from paper_assistant.summarizer import format_summary_file, summarize_article_text
     from paper_assistant.web_article import fetch_article
 
-    config = load_config(**obj)
+    config = _get_config(obj)
     if not config.anthropic_api_key:
         console.print(
             "[red]ANTHROPIC_API_KEY is required for summarization.[/red] "
@@ -278,7 +521,7 @@ async def _add_web_article(
         )
         return
     config.ensure_dirs()
-    storage = StorageManager(config)
+    storage = StorageManager(config, reuse_index=True)
 
     # Step 1: Fetch article content and metadata
     console.print("[bold]Step 1/4:[/bold] Fetching web article...")
@@ -300,62 +543,56 @@ async def _add_web_article(
         console.print(f"  Authors: {', '.join(metadata.authors[:3])}")
     console.print(f"  Content: {len(body_text)} characters extracted")
 
-    paper = Paper(
-        metadata=metadata,
-        tags=tags,
-        status=ProcessingStatus.FETCHED,
-    )
-    storage.add_paper(paper)
-
-    # Step 2: Summarize with Claude
-    console.print(f"[bold]Step 2/4:[/bold] Summarizing with {config.claude_model}...")
-    try:
-        result = await summarize_article_text(config, metadata, body_text)
-        summary_content = format_summary_file(metadata, result)
-        summary_path = storage.save_summary(paper_id, summary_content)
-        paper = storage.get_paper(paper_id)
-        paper.model_used = result.model_used
-        paper.token_count = result.input_tokens + result.output_tokens
-        console.print(
-            f"  Tokens used: {result.input_tokens} in + {result.output_tokens} out"
+    # Coalesce the per-step index writes into one write at the end
+    with storage.transaction():
+        existing = storage.get_paper(paper_id)
+        paper = Paper(
+            metadata=metadata,
+            tags=tags,
+            status=ProcessingStatus.FETCHED,
+            # Keep the current MP3 on --force so unchanged narration is reused
+            audio_path=existing.audio_path if existing else None,
+            tts_hash=existing.tts_hash if existing else None,
         )
-    except Exception as e:
-        console.print(f"[red]Error during summarization:[/red] {e}")
-        paper.status = ProcessingStatus.ERROR
-        paper.error_message = str(e)
         storage.add_paper(paper)
-        return
-
-    # Step 3: Generate audio
-    await _generate_audio_step(
-        config, storage, paper_id, result.full_markdown, skip_audio, skip_transcript, "3/4"
-    )
-    paper = storage.get_paper(paper_id) or paper
 
-    # Step 4: Update RSS feed
-    _update_feed_step(config, storage, paper, "4/4")
+        # Step 2: Summarize with Claude
+        console.print(f"[bold]Step 2/4:[/bold] Summarizing with {config.claude_model}...")
+        try:
+            result = await summarize_article_text(
+                config, metadata, body_text, use_cache=use_llm_cache
+            )
+            summary_content = format_summary_file(metadata, result)
+            summary_path = storage.save_summary(paper_id, summary_content, paper=paper)
+            paper.model_used = result.model_used
+            paper.token_count = result.total_input_tokens + result.output_tokens
+            _print_token_usage(result)
+        except Exception as e:
+            console.print(f"[red]Error during summarization:[/red] {e}")
+            paper.status = ProcessingStatus.ERROR
+            paper.error_message = str(e)
+            storage.add_paper(paper)
+            return
 
-    # Copy audio to iCloud Drive
-    if paper.audio_path and config.icloud_sync:
-        _copy_to_icloud(config, paper, metadata.title, paper_id)
+        # Step 3: Generate audio
+        await _generate_audio_step(
+            config, storage, paper_id, result.full_markdown, skip_audio, skip_transcript, "3/4"
+        )
+        paper = storage.get_paper(paper_id) or paper
 
-    # Update search index
-    from paper_assistant.search import get_search_manager
+        # Step 4: Update RSS feed
+        await _update_feed_step(config, storage, paper, "4/4")
 
-    search_mgr = get_search_manager(config)
-    if search_mgr:
-        try:
-            search_mgr.sync_paper(paper_id, storage)
-        except Exception:
-            console.print("[yellow]Warning: Search index update failed.[/yellow]")
+        # iCloud copy and search indexing are independent; run them together
+        await _publish_outputs_step(config, storage, paper, metadata.title, paper_id)
 
-    console.print()
-    console.print("[green]Done![/green] Article processed successfully.")
-    console.print(f"  Summary: {summary_path}")
-    if paper.transcript_path:
-        console.print(f"  Transcript: {config.data_dir / paper.transcript_path}")
-    if paper.audio_path:
-        console.print(f"  Audio:   {config.data_dir / paper.audio_path}")
+        console.print()
+        console.print("[green]Done![/green] Article processed successfully.")
+        console.print(f"  Summary: {summary_path}")
+        if paper.transcript_path:
+            console.print(f"  Transcript: {config.data_dir / paper.transcript_path}")
+        if paper.audio_path:
+            console.print(f"  Audio:   {config.data_dir / paper.audio_path}")
 
 
 async def _generate_audio_step(
@@ -392,35 +629,100 @@ async def _generate_audio_step(
         console.print(f"  Audio backend: {result.backend_used}")
 
 
-def _update_feed_step(config, storage, paper, step_label):
-    """Shared RSS feed update step."""
+def _print_token_usage(result) -> None:
+    """Print Claude token usage, including the prompt-cache hit ratio."""
+    if result.from_cache:
+        console.print("  Summary reused from the local LLM cache (no tokens spent)")
+        return
+    cached = result.cache_read_input_tokens
+    line = f"  Tokens used: {result.total_input_tokens} in + {result.output_tokens} out"
+    if result.total_input_tokens and (cached or result.cache_creation_input_tokens):
+        line += f" ({cached / result.total_input_tokens:.0%} of input from prompt cache)"
+    console.print(line)
+
+
+async def _update_feed_step(config, storage, paper, step_label):
+    """Shared RSS feed update step.
+
+    Feed XML parsing and writing run in a worker thread so concurrent
+    ``add-batch`` siblings keep streaming while the feed is rewritten.
+    """
+    import asyncio
+
     from paper_assistant.models import ProcessingStatus
-    from paper_assistant.podcast import generate_feed
+    from paper_assistant.podcast import update_or_generate_feed
 
     console.print(f"[bold]Step {step_label}:[/bold] Updating podcast feed...")
     try:
-        all_papers = storage.list_papers()
-        generate_feed(config, all_papers)
+        # Patch this paper's episode in place; rebuild only if there is no feed yet
+        await asyncio.to_thread(update_or_generate_feed, config, paper, storage.list_papers)
         paper.status = ProcessingStatus.COMPLETE
         storage.add_paper(paper)
     except Exception as e:
         console.print(f"[yellow]Warning: Feed generation failed:[/yellow] {e}")
 
 
-def _copy_to_icloud(config, paper, title, paper_id, *, quiet: bool = False) -> str | None:
+async def _publish_outputs_step(config, storage, paper, title, paper_id) -> None:
+    """Copy audio to iCloud Drive and refresh the search index concurrently.
+
+    Neither depends on the other and they are slow for different reasons (a
+    multi-megabyte file copy versus qmd re-indexing and embedding), so the
+    slower one sets the wall-clock time. Each reports its own failure.
+    """
+    import asyncio
+
+    steps = [_sync_search_index(config, storage, paper_id)]
+    if paper.audio_path and config.icloud_sync:
+        steps.append(_copy_to_icloud(config, paper, title, paper_id))
+    await asyncio.gather(*steps)
+
+
+async def _sync_search_index(config, storage, paper_id) -> None:
+    """Regenerate the paper's qmd search doc, if search is enabled."""
+    import asyncio
+
+    from paper_assistant.search import get_search_manager
+
+    search_mgr = get_search_manager(config)
+    if search_mgr is None:
+        return
+    try:
+        # sync_paper shells out to qmd; keep the event loop free meanwhile
+        await asyncio.to_thread(search_mgr.sync_paper, paper_id, storage)
+    except Exception:
+        console.print("[yellow]Warning: Search index update failed.[/yellow]")
+
+
+async def _copy_to_icloud(
+    config, paper, title, paper_id, *, quiet: bool = False
+) -> str | None:
+    """Async wrapper for :func:`_copy_to_icloud_blocking`.
+
+    The copy runs in a worker thread so concurrent ``add-batch`` siblings are
+    not stalled behind a multi-megabyte mp3 write.
+    """
+    import asyncio
+
+    return await asyncio.to_thread(
+        _copy_to_icloud_blocking, config, paper, title, paper_id, quiet=quiet
+    )
+
+
+def _copy_to_icloud_blocking(
+    config, paper, title, paper_id, *, quiet: bool = False
+) -> str | None:
     """Copy audio to iCloud Drive for iPhone access.
 
     With ``quiet`` (JSON output mode) nothing is printed — stdout must stay
     machine-parseable — and a failure message is returned instead so the
     caller can surface it through structured warnings.
     """
-    import shutil
+    from paper_assistant.storage import copy_file, make_icloud_audio_filename
 
     try:
         config.icloud_dir.mkdir(parents=True, exist_ok=True)
-        safe_title = title[:60].replace("/", "-").replace(":", " -")
-        icloud_dest = config.icloud_dir / f"{safe_title} [{paper_id}].mp3"
-        shutil.copy2(config.data_dir / paper.audio_path, icloud_dest)
+        icloud_dest = config.icloud_dir / make_icloud_audio_filename(paper_id, title)
+        copy_file(config.data_dir / paper.audio_path, icloud_dest)
         if not quiet:
             console.print(f"  iCloud:  Synced to {icloud_dest.name}")
         return None
@@ -431,13 +733,28 @@ def _copy_to_icloud(config, paper, title, paper_id, *, quiet: bool = False) -> s
         return None
 
 
+def _read_clipboard() -> str:
+    """Return the macOS clipboard text.
+
+    Reads the pasteboard in-process through PyObjC when it is installed,
+    avoiding a ``pbpaste`` fork/exec; falls back to ``pbpaste`` otherwise.
+    """
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+    except ImportError:
+        result = subprocess.run(["pbpaste"], capture_output=True, text=True)
+        return result.stdout
+
+    text = NSPasteboard.generalPasteboard().stringForType_(NSPasteboardTypeString)
+    return str(text) if text else ""
+
+
 def _read_markdown_input(file_path: str | None) -> str:
     """Read markdown from a file or the macOS clipboard."""
     if file_path:
         return Path(file_path).read_text(encoding="utf-8")
 
-    result = subprocess.run(["pbpaste"], capture_output=True, text=True)
-    return result.stdout
+    return _read_clipboard()
 
 
 def _build_model_label(model: str, model_version: str | None) -> str:
@@ -710,7 +1027,7 @@ def import_paper(
 ) -> None:
     """Import a pre-generated summary from clipboard or file.
 
-    Reads markdown from the macOS clipboard (pbpaste) by default,
+    Reads markdown from the macOS clipboard by default,
     or from a file with --file. Skips the Claude API summarization step.
 
     Examples:
@@ -726,7 +1043,7 @@ def import_paper(
         return
 
     try:
-        result = asyncio.run(
+        result = _run(
             _run_import_pipeline(
                 ctx.obj,
                 url=url,
@@ -760,13 +1077,12 @@ async def _run_import_pipeline(
     provided_script_markdown: str | None = None,
     skip_script_generation: bool = False,
 ):
-    from paper_assistant.config import load_config
     from paper_assistant.pipeline import import_paper_summary
     from paper_assistant.storage import StorageManager
 
-    config = load_config(**obj)
+    config = _get_config(obj)
     config.ensure_dirs()
-    storage = StorageManager(config)
+    storage = StorageManager(config, reuse_index=True)
 
     return await import_paper_summary(
         config=config,
@@ -845,7 +1161,7 @@ def skill_import(
     model_label = _build_model_label(model, model_version)
 
     try:
-        result = asyncio.run(
+        result = _run(
             _run_import_pipeline(
                 ctx.obj,
                 url=url,
@@ -968,7 +1284,7 @@ def create_note(
     if not json_output:
         console.print("[bold]Creating local note entry...[/bold]")
     try:
-        config, outcome = asyncio.run(
+        config, outcome = _run(
             _run_create_pipeline(
                 ctx.obj,
                 title=title,
@@ -999,7 +1315,7 @@ def create_note(
     paper_id = paper.metadata.paper_id
 
     if paper.audio_path and config.icloud_sync:
-        icloud_error = _copy_to_icloud(
+        icloud_error = _copy_to_icloud_blocking(
             config, paper, paper.metadata.title, paper_id, quiet=json_output
         )
         if icloud_error:
@@ -1033,13 +1349,12 @@ async def _run_create_pipeline(
     provided_script_markdown: str | None = None,
     skip_script_generation: bool = False,
 ):
-    from paper_assistant.config import load_config
     from paper_assistant.pipeline import create_local_entry
     from paper_assistant.storage import StorageManager
 
-    config = load_config(**obj)
+    config = _get_config(obj)
     config.ensure_dirs()
-    storage = StorageManager(config)
+    storage = StorageManager(config, reuse_index=True)
 
     outcome = await create_local_entry(
         config=config,
@@ -1092,12 +1407,10 @@ def _local_entry_result_to_dict(outcome, config) -> dict[str, object]:
 @click.pass_context
 def list_papers(ctx: click.Context, status: str, tag: str | None, json_output: bool) -> None:
     """List all processed papers."""
-    from paper_assistant.config import load_config
     from paper_assistant.models import ProcessingStatus
-    from paper_assistant.storage import StorageManager
 
-    config = load_config(**ctx.obj)
-    storage = StorageManager(config)
+    config = _get_config(ctx.obj)
+    storage = _get_storage(ctx.obj)
 
     status_filter = None if status == "all" else ProcessingStatus(status)
     papers = storage.list_papers(status=status_filter, tag=tag)
@@ -1133,6 +1446,25 @@ def list_papers(ctx: click.Context, status: str, tag: str | None, json_output: b
         console.print("[dim]No papers found.[/dim]")
         return
 
+    if not console.is_terminal:
+        # Piped or redirected: plain tab-separated rows, no table layout
+        for p in papers:
+            click.echo(
+                "\t".join(
+                    (
+                        p.metadata.paper_id,
+                        p.metadata.title,
+                        p.date_added_label,
+                        p.status.value,
+                        "Y" if p.audio_path else "-",
+                        ",".join(p.tags),
+                    )
+                )
+            )
+        return
+
+    from rich.table import Table
+
     table = Table(title="Papers", show_lines=True)
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Title", max_width=50)
@@ -1144,13 +1476,21 @@ def list_papers(ctx: click.Context, status: str, tag: str | None, json_output: b
     for p in papers:
         table.add_row(
             p.metadata.paper_id,
-            p.metadata.title[:50] + ("..." if len(p.metadata.title) > 50 else ""),
-            p.date_added.strftime("%Y-%m-%d"),
+            p.display_title,
+            p.date_added_label,
             p.status.value,
             "Y" if p.audio_path else "-",
-            ", ".join(p.tags) if p.tags else "",
+            ", ".join(p.tags),
         )
 
+    # A rich Table is laid out in one pass, so for a library taller than the
+    # terminal hand it to the pager rather than scrolling it all past.
+    if len(papers) > console.height:
+        with console.pager(styles=True):
+            console.print(table)
+            console.print(f"\n[dim]Total: {len(papers)} papers[/dim]")
+        return
+
     console.print(table)
     console.print(f"\n[dim]Total: {len(papers)} papers[/dim]")
 
@@ -1166,11 +1506,8 @@ def list_papers(ctx: click.Context, status: str, tag: str | None, json_output: b
 @click.pass_context
 def show(ctx: click.Context, paper_id: str, body_only: bool) -> None:
     """Display the summary for a specific paper."""
-    from paper_assistant.config import load_config
-    from paper_assistant.storage import StorageManager
-
-    config = load_config(**ctx.obj)
-    storage = StorageManager(config)
+    config = _get_config(ctx.obj)
+    storage = _get_storage(ctx.obj)
     paper = storage.get_paper(paper_id)
 
     if not paper:
@@ -1185,12 +1522,16 @@ def show(ctx: click.Context, paper_id: str, body_only: bool) -> None:
         console.print(f"[yellow]Paper {paper_id} has no summary yet.[/yellow]")
         return
 
-    content = (config.data_dir / paper.summary_path).read_text(encoding="utf-8")
+    # Summary files are written by this tool with "\n" endings, so skip the
+    # text-layer newline translation and decode the bytes directly
+    content = (config.data_dir / paper.summary_path).read_bytes().decode("utf-8")
     if body_only:
         from paper_assistant.summarizer import normalize_summary_body
 
         click.echo(normalize_summary_body(content))
         return
+    from rich.markdown import Markdown
+
     console.print(Markdown(content))
 
 
@@ -1201,11 +1542,8 @@ def show(ctx: click.Context, paper_id: str, body_only: bool) -> None:
 @click.pass_context
 def remove(ctx: click.Context, paper_id: str, keep_files: bool) -> None:
     """Remove a paper from the index."""
-    from paper_assistant.config import load_config
-    from paper_assistant.storage import StorageManager
-
-    config = load_config(**ctx.obj)
-    storage = StorageManager(config)
+    config = _get_config(ctx.obj)
+    storage = _get_storage(ctx.obj)
 
     if storage.delete_paper(paper_id, delete_files=not keep_files):
         from paper_assistant.search import get_search_manager
@@ -1229,10 +1567,9 @@ def serve(ctx: click.Context, host: str, port: int) -> None:
     """Start the web UI and podcast feed server."""
     import uvicorn
 
-    from paper_assistant.config import load_config
     from paper_assistant.web.app import create_app
 
-    config = load_config(**ctx.obj)
+    config = _get_config(ctx.obj)
     config.ensure_dirs()
     app = create_app(config)
 
@@ -1247,18 +1584,27 @@ def serve(ctx: click.Context, host: str, port: int) -> None:
 @click.pass_context
 def regenerate_feed(ctx: click.Context) -> None:
     """Regenerate the RSS podcast feed from existing data."""
-    from paper_assistant.config import load_config
     from paper_assistant.podcast import generate_feed
-    from paper_assistant.storage import StorageManager
 
-    config = load_config(**ctx.obj)
-    storage = StorageManager(config)
+    config = _get_config(ctx.obj)
+    storage = _get_storage(ctx.obj)
     papers = storage.list_papers()
 
     generate_feed(config, papers)
     console.print(f"[green]Feed regenerated:[/green] {config.feed_path}")
 
 
+@main.command("llm-cache-clear")
+@click.pass_context
+def llm_cache_clear(ctx: click.Context) -> None:
+    """Delete all cached Claude summarization results."""
+    from paper_assistant import llm_cache
+
+    config = _get_config(ctx.obj)
+    removed = llm_cache.clear(config)
+    console.print(f"[green]Removed {removed} cached summaries[/green] from {config.llm_cache_dir}")
+
+
 @main.group("bundle")
 def bundle_group() -> None:
     """Export and import portable local paper bundles."""
@@ -1280,11 +1626,9 @@ def bundle_export(
     Notion linkage metadata is stripped from the bundle.
     """
     from paper_assistant.bundle import export_bundle
-    from paper_assistant.config import load_config
-    from paper_assistant.storage import StorageManager
 
-    config = load_config(**ctx.obj)
-    storage = StorageManager(config)
+    config = _get_config(ctx.obj)
+    storage = _get_storage(ctx.obj)
 
     try:
         report = export_bundle(
@@ -1334,11 +1678,9 @@ def bundle_import(
 ) -> None:
     """Import a portable zip bundle into the local library."""
     from paper_assistant.bundle import import_bundle
-    from paper_assistant.config import load_config
-    from paper_assistant.storage import StorageManager
 
-    config = load_config(**ctx.obj)
-    storage = StorageManager(config)
+    config = _get_config(ctx.obj)
+    storage = _get_storage(ctx.obj)
 
     try:
         report = import_bundle(
@@ -1427,10 +1769,9 @@ def search(
     json_output: bool,
 ) -> None:
     """Search across paper summaries and metadata."""
-    from paper_assistant.config import load_config
     from paper_assistant.search import EmbeddingsNotAvailableError, SearchManager
 
-    config = load_config(**ctx.obj)
+    config = _get_config(ctx.obj)
 
     if not config.qmd_enabled:
         console.print(
@@ -1475,6 +1816,8 @@ def search(
         console.print("[dim]No results found.[/dim]")
         return
 
+    from rich.table import Table
+
     table = Table(title=f"Search: {query}")
     table.add_column("#", style="dim", width=3)
     table.add_column("Paper ID", style="cyan", no_wrap=True)
@@ -1492,11 +1835,9 @@ def search(
 @click.pass_context
 def index_setup(ctx: click.Context) -> None:
     """Set up the qmd search index (idempotent)."""
-    from paper_assistant.config import load_config
     from paper_assistant.search import SearchManager
-    from paper_assistant.storage import StorageManager
 
-    config = load_config(**ctx.obj)
+    config = _get_config(ctx.obj)
 
     if not config.qmd_enabled:
         console.print(
@@ -1515,7 +1856,7 @@ def index_setup(ctx: click.Context) -> None:
     console.print("[bold]Setting up search index...[/bold]")
     mgr.setup()
 
-    storage = StorageManager(config)
+    storage = _get_storage(ctx.obj)
     console.print("Rebuilding search documents...")
     mgr.rebuild_all(storage)
 
@@ -1527,11 +1868,9 @@ def index_setup(ctx: click.Context) -> None:
 @click.pass_context
 def index_rebuild(ctx: click.Context, embed: bool) -> None:
     """Regenerate all search documents and update the index."""
-    from paper_assistant.config import load_config
     from paper_assistant.search import SearchManager
-    from paper_assistant.storage import StorageManager
 
-    config = load_config(**ctx.obj)
+    config = _get_config(ctx.obj)
 
     if not config.qmd_enabled:
         console.print(
@@ -1547,7 +1886,7 @@ def index_rebuild(ctx: click.Context, embed: bool) -> None:
         )
         raise SystemExit(1)
 
-    storage = StorageManager(config)
+    storage = _get_storage(ctx.obj)
     console.print("[bold]Rebuilding search documents...[/bold]")
     mgr.rebuild_all(storage)
     console.print("[green]Search documents rebuilt.[/green]")
@@ -1564,17 +1903,16 @@ def index_rebuild(ctx: click.Context, embed: bool) -> None:
 @click.pass_context
 def notion_sync(ctx: click.Context, paper_id: str | None, dry_run: bool) -> None:
     """Run manual two-way sync between local storage and Notion."""
-    asyncio.run(_notion_sync(ctx.obj, paper_id, dry_run))
+    _run(_notion_sync(ctx.obj, paper_id, dry_run))
 
 
 async def _notion_sync(obj: dict, paper_id: str | None, dry_run: bool) -> None:
-    from paper_assistant.config import load_config
     from paper_assistant.notion import describe_exception, sync_notion
     from paper_assistant.storage import StorageManager
 
-    config = load_config(**obj)
+    config = _get_config(obj)
     config.ensure_dirs()
-    storage = StorageManager(config)
+    storage = StorageManager(config, reuse_index=True)
 
     mode = "preview" if dry_run else "apply"
     target = paper_id if paper_id else "all papers"
@@ -1628,14 +1966,13 @@ async def _notion_sync(obj: dict, paper_id: str | None, dry_run: bool) -> None:
 @click.pass_context
 def notion_preflight(ctx: click.Context) -> None:
     """Verify that Notion sync can reach the configured database."""
-    asyncio.run(_notion_preflight(ctx.obj))
+    _run(_notion_preflight(ctx.obj))
 
 
 async def _notion_preflight(obj: dict) -> None:
-    from paper_assistant.config import load_config
     from paper_assistant.notion import preflight_notion
 
-    config = load_config(**obj)
+    config = _get_config(obj)
 
     try:
         await preflight_notion(config=config)
@@ -1677,7 +2014,7 @@ def transcript_regenerate(
         if not provided_script:
             raise click.ClickException("--script-file was empty.")
 
-    asyncio.run(
+    _run(
         _transcript_regenerate(
             ctx.obj,
             paper_id=paper_id,
@@ -1694,13 +2031,12 @@ async def _transcript_regenerate(
     model: str | None,
     provided_script: str | None,
 ) -> None:
-    from paper_assistant.config import load_config
     from paper_assistant.pipeline import regenerate_transcript_and_audio
     from paper_assistant.storage import StorageManager
 
-    config = load_config(**obj)
+    config = _get_config(obj)
     config.ensure_dirs()
-    storage = StorageManager(config)
+    storage = StorageManager(config, reuse_index=True)
 
     console.print(f"[bold]Regenerating transcript + audio for {paper_id}...[/bold]")
     try:
@@ -1748,7 +2084,7 @@ def tts_group() -> None:
 @click.pass_context
 def tts_check(ctx: click.Context) -> None:
     """Probe the configured TTS backend and report readiness."""
-    asyncio.run(_tts_check(ctx.obj))
+    _run(_tts_check(ctx.obj))
 
 
 async def _tts_check(obj: dict) -> None:
@@ -1757,7 +2093,6 @@ async def _tts_check(obj: dict) -> None:
 
     import httpx
 
-    from paper_assistant.config import load_config
     from paper_assistant.tts import (
         EdgeTTSError,
         MlxConfigError,
@@ -1770,7 +2105,7 @@ async def _tts_check(obj: dict) -> None:
         raise_for_audio_quality,
     )
 
-    config = load_config(**obj)
+    config = _get_config(obj)
     config.ensure_dirs()
 
     console.print(f"[bold]TTS backend:[/bold] {config.tts_backend}")
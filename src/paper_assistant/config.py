@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import shlex
+from functools import cached_property
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -12,9 +13,16 @@ from pydantic import BaseModel
 
 DEFAULT_DATA_DIR = Path.home() / ".paper-assistant"
 
+# Data directories whose layout ensure_dirs has already created in this process
+_ENSURED_DATA_DIRS: set[Path] = set()
+
 
 class Config(BaseModel):
-    """Application configuration."""
+    """Application configuration.
+
+    Directory and file paths are cached on first access; assigning
+    ``data_dir`` or ``cache_dir`` (or ``model_copy``) recomputes them.
+    """
 
     anthropic_api_key: str | None = None
     data_dir: Path = DEFAULT_DATA_DIR
@@ -26,6 +34,7 @@ class Config(BaseModel):
     podcast_title: str = "Paper Assistant - ML Paper Summaries"
     podcast_base_url: str = "http://127.0.0.1:8877"
     max_pdf_pages: int = 100
+    max_extract_chars: int = 400_000  # 0 extracts every page up to max_pdf_pages
     cache_pdfs: bool = True
     icloud_sync: bool = True
     icloud_dir: Path = Path.home() / "Library/Mobile Documents/com~apple~CloudDocs/Paper Assistant"
@@ -36,6 +45,8 @@ class Config(BaseModel):
     arxiv_max_retries: int = 6
     arxiv_backoff_base_seconds: float = 2.0
     arxiv_backoff_cap_seconds: float = 90.0
+    cache_dir: Path | None = None  # defaults to data_dir / "cache"
+    llm_cache_ttl_days: int = 30  # 0 disables the summarization cache
     notion_sync_enabled: bool = False
     notion_token: str | None = None
     notion_database_id: str | None = None
@@ -62,50 +73,94 @@ class Config(BaseModel):
     # Audio narration script (derived transcript) settings
     audio_script_model: str = "claude-haiku-4-5-20251001"
 
-    @property
+    @cached_property
     def papers_dir(self) -> Path:
         return self.data_dir / "papers"
 
-    @property
+    @cached_property
     def audio_dir(self) -> Path:
         return self.data_dir / "audio"
 
-    @property
+    @cached_property
     def transcripts_dir(self) -> Path:
         return self.data_dir / "transcripts"
 
-    @property
+    @cached_property
     def pdfs_dir(self) -> Path:
         return self.data_dir / "pdfs"
 
-    @property
+    @cached_property
     def images_dir(self) -> Path:
         """Figure images extracted from papers, served by the web UI at /images
         and uploaded to Notion as native file-upload image blocks."""
         return self.data_dir / "images"
 
-    @property
+    @cached_property
+    def arxiv_cache_dir(self) -> Path:
+        """Cached arXiv API metadata, one JSON file per arXiv ID."""
+        return (self.cache_dir or self.data_dir / "cache") / "arxiv"
+
+    @cached_property
+    def hf_cache_dir(self) -> Path:
+        """Cached Hugging Face paper metadata, one JSON file per arXiv ID."""
+        return (self.cache_dir or self.data_dir / "cache") / "hf"
+
+    @cached_property
+    def llm_cache_dir(self) -> Path:
+        """Cached Claude summarization results, one JSON file per prompt hash."""
+        return (self.cache_dir or self.data_dir / "cache") / "llm"
+
+    @cached_property
     def index_path(self) -> Path:
         return self.data_dir / "index.json"
 
-    @property
+    @cached_property
     def search_dir(self) -> Path:
         return self.data_dir / "search"
 
-    @property
+    @cached_property
     def feed_path(self) -> Path:
         return self.data_dir / "feed.xml"
 
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        if name in ("data_dir", "cache_dir"):
+            self._clear_derived_paths()
+
+    def model_copy(self, *, update: dict[str, object] | None = None, deep: bool = False) -> Config:
+        copy = super().model_copy(update=update, deep=deep)
+        copy._clear_derived_paths()
+        return copy
+
+    def _clear_derived_paths(self) -> None:
+        for name in _DERIVED_PATHS:
+            self.__dict__.pop(name, None)
+
     def ensure_dirs(self) -> None:
-        """Create all required directories."""
-        for d in [
+        """Create all required directories.
+
+        Once a data directory's layout has been created in this process, later
+        calls only check that each directory still exists, recreating any that
+        were removed underneath a long-lived process.
+        """
+        dirs = [
             self.papers_dir,
             self.audio_dir,
             self.transcripts_dir,
             self.pdfs_dir,
             self.images_dir,
-        ]:
+        ]
+        if self.data_dir in _ENSURED_DATA_DIRS and all(d.is_dir() for d in dirs):
+            return
+        for d in dirs:
             d.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DATA_DIRS.add(self.data_dir)
+
+
+# Config properties computed once per instance from data_dir / cache_dir
+_DERIVED_PATHS = tuple(
+    name for name, value in vars(Config).items() if isinstance(value, cached_property)
+)
 
 
 def load_config(**overrides: object) -> Config:
@@ -169,6 +224,18 @@ def load_config(**overrides: object) -> Config:
     if arxiv_backoff_cap_seconds is not None:
         kwargs["arxiv_backoff_cap_seconds"] = float(arxiv_backoff_cap_seconds)
 
+    cache_dir = os.getenv("PAPER_ASSIST_CACHE_DIR")
+    if cache_dir:
+        kwargs["cache_dir"] = Path(cache_dir)
+
+    llm_cache_ttl_days = os.getenv("PAPER_ASSIST_LLM_CACHE_TTL_DAYS")
+    if llm_cache_ttl_days is not None:
+        kwargs["llm_cache_ttl_days"] = int(llm_cache_ttl_days)
+
+    max_extract_chars = os.getenv("PAPER_ASSIST_MAX_EXTRACT_CHARS")
+    if max_extract_chars is not None:
+        kwargs["max_extract_chars"] = int(max_extract_chars)
+
     # Notion sync
     notion_sync_enabled = os.getenv("PAPER_ASSIST_NOTION_SYNC_ENABLED")
     if notion_sync_enabled is not None:
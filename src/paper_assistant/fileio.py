@@ -0,0 +1,74 @@
+"""Atomic file writes shared by the index, feed, and on-disk caches."""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Read once at import: os.umask can only be queried by setting it, which is
+# not safe while files are written from worker threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def apply_umask_mode(path: Path) -> None:
+    """Give ``path`` the mode a plain ``open()`` would have created it with.
+
+    ``NamedTemporaryFile`` creates files as 0600; without this, a temp file
+    swapped into place with ``os.replace`` stays unreadable to other users.
+    """
+    os.chmod(path, 0o666 & ~_UMASK)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers never see a partial file."""
+    temp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as temp_file:
+            temp_path = Path(temp_file.name)
+            temp_file.write(data)
+        apply_umask_mode(temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if temp_path is not None and temp_path.exists():
+            temp_path.unlink()
+
+
+def read_json_cache(path: Path, ttl_seconds: float, adapter: TypeAdapter[T]) -> T | None:
+    """Return the cache entry at ``path`` if younger than ``ttl_seconds``, else None.
+
+    Missing, expired, unreadable, and invalid entries all read as a miss.
+    """
+    try:
+        if time.time() - path.stat().st_mtime >= ttl_seconds:
+            return None
+        return adapter.validate_json(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable cache entry %s: %s", path, exc)
+        return None
+
+
+def write_json_cache(path: Path, value: T, adapter: TypeAdapter[T]) -> None:
+    """Atomically persist ``value`` at ``path``; cache failures are logged, never raised."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_bytes_atomic(path, adapter.dump_json(value))
+    except OSError as exc:
+        logger.warning("Failed to write cache entry %s: %s", path, exc)
@@ -6,17 +6,23 @@ from datetime import datetime, timezone
 import re
 
 import httpx
+from pydantic import TypeAdapter
 
+from paper_assistant.arxiv import shared_client
 from paper_assistant.config import Config
+from paper_assistant.fileio import read_json_cache, write_json_cache
 from paper_assistant.models import PaperMetadata
 
 HF_PAPERS_API_URL = "https://huggingface.co/api/papers/{arxiv_id}"
 HF_PAPERS_MARKDOWN_URL = "https://huggingface.co/papers/{arxiv_id}.md"
 HF_TIMEOUT_SECONDS = 30.0
 HF_MIN_BODY_CHARS = 2500
+HF_METADATA_CACHE_TTL_SECONDS = 24 * 60 * 60
 ARXIV_ABS_URL = "https://arxiv.org/abs/{arxiv_id}"
 ARXIV_PDF_URL = "https://arxiv.org/pdf/{arxiv_id}"
 
+_METADATA_ADAPTER = TypeAdapter(PaperMetadata)
+
 
 class HFPaperContentRejectedError(Exception):
     """Raised when HF markdown content is unavailable or fails the arXiv-quality gate."""
@@ -28,8 +34,11 @@ def _request_headers(config: Config | None, accept: str) -> dict[str, str]:
 
 
 async def _fetch(url: str, *, config: Config | None, accept: str) -> httpx.Response:
-    async with httpx.AsyncClient(timeout=HF_TIMEOUT_SECONDS, follow_redirects=True) as client:
-        response = await client.get(url, headers=_request_headers(config, accept))
+    response = await shared_client().get(
+        url,
+        headers=_request_headers(config, accept),
+        timeout=HF_TIMEOUT_SECONDS,
+    )
     response.raise_for_status()
     return response
 
@@ -86,8 +95,34 @@ def metadata_from_api_payload(payload: dict[str, object]) -> PaperMetadata:
     )
 
 
+def _read_cached_metadata(arxiv_id: str, config: Config | None) -> PaperMetadata | None:
+    """Return cached HF metadata younger than the TTL, or None."""
+    if config is None:
+        return None
+    return read_json_cache(
+        config.hf_cache_dir / f"{arxiv_id}.json",
+        HF_METADATA_CACHE_TTL_SECONDS,
+        _METADATA_ADAPTER,
+    )
+
+
+def _write_cached_metadata(arxiv_id: str, metadata: PaperMetadata, config: Config | None) -> None:
+    """Atomically persist HF metadata; cache failures never break a fetch."""
+    if config is None:
+        return
+    write_json_cache(config.hf_cache_dir / f"{arxiv_id}.json", metadata, _METADATA_ADAPTER)
+
+
 async def fetch_metadata(arxiv_id: str, config: Config | None = None) -> PaperMetadata:
-    """Fetch arXiv paper metadata from Hugging Face paper pages."""
+    """Fetch arXiv paper metadata from Hugging Face paper pages.
+
+    Responses are cached under ``config.hf_cache_dir`` for 24 hours, so
+    ``add --force`` and re-imports skip the round trip.
+    """
+    cached = _read_cached_metadata(arxiv_id, config)
+    if cached is not None:
+        return cached
+
     response = await _fetch(
         HF_PAPERS_API_URL.format(arxiv_id=arxiv_id),
         config=config,
@@ -96,7 +131,9 @@ async def fetch_metadata(arxiv_id: str, config: Config | None = None) -> PaperMe
     payload = response.json()
     if not isinstance(payload, dict):
         raise ValueError("HF paper metadata response was not a JSON object.")
-    return metadata_from_api_payload(payload)
+    metadata = metadata_from_api_payload(payload)
+    _write_cached_metadata(arxiv_id, metadata, config)
+    return metadata
 
 
 async def fetch_markdown(arxiv_id: str, config: Config | None = None) -> str:
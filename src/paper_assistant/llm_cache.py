@@ -0,0 +1,65 @@
+"""On-disk cache of Claude summarization results.
+
+Entries are keyed by a SHA-256 of everything that determines the response
+(model, token limit, system prompt, and the user content), so re-running
+``add --force`` on unchanged paper text reuses the earlier summary instead
+of re-spending tokens. One JSON file per key under ``config.llm_cache_dir``;
+entries older than ``config.llm_cache_ttl_days`` are ignored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from paper_assistant.config import Config
+from paper_assistant.fileio import read_json_cache, write_json_cache
+from paper_assistant.summarizer import SummarizationResult
+
+_RESULT_ADAPTER = TypeAdapter(SummarizationResult)
+
+
+def prompt_hash(*parts: str | bytes) -> str:
+    """Hash request parts into a cache key; parts are length-prefixed to avoid collisions."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _entry_path(config: Config, key: str) -> Path:
+    return config.llm_cache_dir / f"{key}.json"
+
+
+def get(config: Config, key: str) -> SummarizationResult | None:
+    """Return the cached result for ``key`` if present and within the TTL."""
+    if config.llm_cache_ttl_days <= 0:
+        return None
+
+    return read_json_cache(
+        _entry_path(config, key), config.llm_cache_ttl_days * 86400, _RESULT_ADAPTER
+    )
+
+
+def put(config: Config, key: str, result: SummarizationResult) -> None:
+    """Atomically persist ``result``; cache failures never break summarization."""
+    if config.llm_cache_ttl_days <= 0:
+        return
+
+    write_json_cache(_entry_path(config, key), result, _RESULT_ADAPTER)
+
+
+def clear(config: Config) -> int:
+    """Delete every cached entry. Returns the number of entries removed."""
+    removed = 0
+    for path in config.llm_cache_dir.glob("*.json"):
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-import re
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Colons become " -"; characters invalid in filenames are dropped
+_INVALID_FILENAME_CHARS = '<>"/\\|?*'
+_FILENAME_SANITIZE = str.maketrans({":": " -", **dict.fromkeys(_INVALID_FILENAME_CHARS)})
+_INVALID_FILENAME_BYTES = _INVALID_FILENAME_CHARS.encode("ascii")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class ProcessingStatus(str, Enum):
@@ -36,8 +45,12 @@ class PaperMetadata(BaseModel):
 
     For arXiv papers, ``arxiv_id`` is set and used as the primary key.
     For web articles and notes, ``source_slug`` is set and used as the primary key.
+    Instances are frozen: metadata is fixed once fetched, and ``paper_id`` is
+    the index key, so build a new instance (or ``model_copy``) to change it.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     # Source identification
     source_type: SourceType = SourceType.ARXIV
     source_url: str | None = None  # canonical URL for web articles / bookmarked notes
@@ -55,15 +68,27 @@ class PaperMetadata(BaseModel):
     published: datetime | None = None
     categories: list[str] = Field(default_factory=list)
 
-    @property
+    @cached_property
     def paper_id(self) -> str:
-        """Primary key: arxiv_id for arXiv papers, source_slug otherwise."""
+        """Primary key: arxiv_id for arXiv papers, source_slug otherwise.
+
+        Computed once per instance; the model is frozen, and ``model_copy``
+        drops the cached value when it applies updates.
+        """
         if self.arxiv_id:
             return self.arxiv_id
         if self.source_slug:
             return self.source_slug
         raise ValueError("PaperMetadata has neither arxiv_id nor source_slug")
 
+    def model_copy(
+        self, *, update: dict[str, object] | None = None, deep: bool = False
+    ) -> PaperMetadata:
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy.__dict__.pop("paper_id", None)
+        return copy
+
     @property
     def source_label(self) -> str:
         """Human-friendly source label for narration and UI copy."""
@@ -78,11 +103,11 @@ class Paper(BaseModel):
     """Full paper record with processing state and file paths."""
 
     metadata: PaperMetadata
-    date_added: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    date_added: datetime = Field(default_factory=_utcnow)
     status: ProcessingStatus = ProcessingStatus.PENDING
     tags: list[str] = Field(default_factory=list)
     reading_status: ReadingStatus = ReadingStatus.UNREAD
-    local_modified_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    local_modified_at: datetime = Field(default_factory=_utcnow)
     notion_modified_at: datetime | None = None
     last_synced_at: datetime | None = None
     archived_at: datetime | None = None
@@ -93,6 +118,8 @@ class Paper(BaseModel):
     summary_path: str | None = None
     audio_path: str | None = None
     transcript_path: str | None = None
+    # Fingerprint of the narration text + voice settings behind audio_path
+    tts_hash: str | None = None
 
     # Processing metadata
     model_used: str | None = None
@@ -104,22 +131,36 @@ class Paper(BaseModel):
         """Title sanitized for filenames."""
         return sanitize_filename(self.metadata.title)
 
+    @property
+    def display_title(self) -> str:
+        """Title truncated to 50 characters for table listings."""
+        title = self.metadata.title
+        return title if len(title) <= 50 else title[:50] + "..."
+
+    @property
+    def date_added_label(self) -> str:
+        """``date_added`` as ``YYYY-MM-DD``."""
+        return self.date_added.date().isoformat()
+
 
 class PaperIndex(BaseModel):
     """Top-level index stored in index.json."""
 
     papers: dict[str, Paper] = Field(default_factory=dict)  # keyed by paper_id
-    last_updated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    last_updated: datetime = Field(default_factory=_utcnow)
 
 
 def sanitize_filename(title: str, max_length: int = 80) -> str:
     """Sanitize a paper title for use in filenames."""
-    # Replace colons with dashes
-    title = title.replace(":", " -")
-    # Remove characters invalid in filenames
-    title = re.sub(r'[<>"/\\|?*]', "", title)
-    # Collapse multiple spaces
-    title = re.sub(r"\s+", " ", title).strip()
+    if title.isascii():
+        # bytes.translate/replace are tight C loops; str.translate falls back
+        # to a per-character dict lookup because ":" maps to two characters
+        raw = title.encode("ascii").translate(None, _INVALID_FILENAME_BYTES)
+        title = raw.replace(b":", b" -").decode("ascii")
+    else:
+        title = title.translate(_FILENAME_SANITIZE)
+    # Collapse runs of whitespace and strip the ends
+    title = " ".join(title.split())
     # Truncate at word boundary
     if len(title) > max_length:
         title = title[:max_length].rsplit(" ", 1)[0].rstrip(" -")
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import importlib.util
+import json
 import mimetypes
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from collections.abc import Iterator
-from typing import Any
+from collections.abc import AsyncIterator, Iterator, Mapping
+from typing import TYPE_CHECKING, Any
 from urllib.parse import quote, unquote, urlsplit
 
 import httpx
@@ -19,6 +22,7 @@ from pygments.lexers import guess_lexer
 
 from paper_assistant.config import Config
 from paper_assistant.models import Paper, PaperMetadata, ProcessingStatus, ReadingStatus, SourceType
+from paper_assistant.ratelimit import AsyncTokenBucket, compute_backoff_delay, server_retry_delay
 from paper_assistant.storage import StorageManager
 from paper_assistant.summarizer import (
     SummarizationResult,
@@ -27,6 +31,9 @@ from paper_assistant.summarizer import (
     parse_summary_sections,
 )
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 NOTION_API_BASE = "https://api.notion.com/v1"
 NOTION_VERSION = "2025-09-03"
 
@@ -41,6 +48,15 @@ _MAX_UPLOAD_BYTES = 20 * 1024 * 1024
 # elapse *after* the write lands server-side, surfacing a phantom failure.
 # Matches the timeout already used by ``_upload_file``.
 _NOTION_WRITE_TIMEOUT = 120.0
+# Keep-alive pool shared by every request a NotionClient makes, so a sync's
+# page and block fan-out reuses connections instead of a TLS handshake per call
+_NOTION_CLIENT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+_NOTION_HTTP2 = importlib.util.find_spec("h2") is not None
+# Notion allows an average of three requests per second per integration token
+_NOTION_REQUESTS_PER_SECOND = 3.0
+_NOTION_MAX_RETRIES = 4
+_NOTION_BACKOFF_BASE_SECONDS = 1.0
+_NOTION_BACKOFF_CAP_SECONDS = 30.0
 
 
 def describe_exception(exc: BaseException) -> str:
@@ -136,6 +152,8 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Notion timestamps are minute-granular, so a query's pages repeat many of them
+@lru_cache(maxsize=4096)
 def _parse_iso_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
@@ -230,6 +248,7 @@ _DISPLAY_MATH_RE = re.compile(r"\$\$\s*(.+?)\s*\$\$", re.DOTALL)
 
 
 _CODE_FENCE_RE = re.compile(r"^(`{3,}|~{3,})")
+_LEADING_WS_RE = re.compile(r"\s*")
 
 
 def _iter_lines_with_fence_state(md: str) -> Iterator[tuple[str, bool]]:
@@ -266,6 +285,8 @@ def _escape_math_pipes_in_tables(md: str) -> str:
 
     Lines inside fenced code blocks are left untouched.
     """
+    if "$" not in md:
+        return md
     result: list[str] = []
     for line, in_fence in _iter_lines_with_fence_state(md):
         if _is_table_row(line, in_fence):
@@ -287,13 +308,15 @@ def _normalise_display_math(md: str) -> str:
 
     Lines inside fenced code blocks are left untouched.
     """
+    if "$$" not in md:
+        return md
     processed: list[str] = []
     for line, in_fence in _iter_lines_with_fence_state(md):
         if _is_table_row(line, in_fence):
-            processed.append(re.sub(r"\$\$\s*(.+?)\s*\$\$", r"$\1$", line))
+            processed.append(_DISPLAY_MATH_RE.sub(r"$\1$", line))
         else:
             processed.append(line)
-    return _DISPLAY_MATH_RE.sub(lambda m: f"\n\n$$\n{m.group(1)}\n$$\n\n", "\n".join(processed))
+    return _DISPLAY_MATH_RE.sub(r"\n\n$$\n\1\n$$\n\n", "\n".join(processed))
 
 
 def _inline_to_rich_text(
@@ -301,7 +324,12 @@ def _inline_to_rich_text(
     annotations: dict[str, bool] | None = None,
     link_url: str | None = None,
 ) -> list[dict[str, Any]]:
-    """Recursively convert mistune inline AST nodes to Notion rich_text items."""
+    """Recursively convert mistune inline AST nodes to Notion rich_text items.
+
+    Leaf items share their run's ``annotations`` dict rather than copying it;
+    the dicts are never mutated, and ``_markdown_to_blocks`` hands callers a
+    JSON-decoded copy of the result.
+    """
     if annotations is None:
         annotations = {}
     items: list[dict[str, Any]] = []
@@ -315,7 +343,7 @@ def _inline_to_rich_text(
             if link_url:
                 rt["text"]["link"] = {"url": link_url}
             if annotations:
-                rt["annotations"] = {**annotations}
+                rt["annotations"] = annotations
             items.append(rt)
         elif ntype == "strong":
             merged = {**annotations, "bold": True}
@@ -360,7 +388,7 @@ def _inline_to_rich_text(
             if safe_url:
                 rt["text"]["link"] = {"url": safe_url}
             if annotations:
-                rt["annotations"] = {**annotations}
+                rt["annotations"] = annotations
             items.append(rt)
         else:
             # Fallback: render raw text if present
@@ -368,7 +396,7 @@ def _inline_to_rich_text(
             if raw:
                 rt = {"type": "text", "text": {"content": raw}}
                 if annotations:
-                    rt["annotations"] = {**annotations}
+                    rt["annotations"] = annotations
                 if link_url:
                     rt["text"]["link"] = {"url": link_url}
                 items.append(rt)
@@ -376,7 +404,16 @@ def _inline_to_rich_text(
 
 
 def _chunk_rich_text(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Split any rich_text item whose content exceeds the Notion API limit."""
+    """Split any rich_text item whose content exceeds the Notion API limit.
+
+    Returns ``items`` itself when nothing needs splitting, the usual case.
+    """
+    if all(
+        item.get("type") == "equation"
+        or len(item.get("text", {}).get("content", "")) <= _CHUNK_LIMIT
+        for item in items
+    ):
+        return items
     result: list[dict[str, Any]] = []
     for item in items:
         if item.get("type") == "equation":
@@ -600,18 +637,22 @@ def _block_text_rich_text(node: dict[str, Any]) -> list[dict[str, Any]]:
 
 
 def _strip_summary_wrapper(raw: str) -> str:
-    """Strip YAML + duplicate metadata header from saved summary file."""
-    body = raw
-    if body.startswith("---"):
-        end_idx = body.find("---", 3)
+    """Strip YAML + duplicate metadata header from saved summary file.
+
+    Works on offsets into ``raw`` so the (possibly long) body is sliced once.
+    """
+    start = 0
+    if raw.startswith("---"):
+        end_idx = raw.find("---", 3)
         if end_idx != -1:
-            body = body[end_idx + 3 :].lstrip()
+            start = _LEADING_WS_RE.match(raw, end_idx + 3).end()
 
-    hr_idx = body.find("\n---\n")
-    if hr_idx != -1 and hr_idx < 400:
-        body = body[hr_idx + 5 :].lstrip()
+    # The duplicate metadata header is closed by a rule within 400 characters
+    hr_idx = raw.find("\n---\n", start, start + 404)
+    if hr_idx != -1:
+        start = hr_idx + 5
 
-    return body.strip()
+    return raw[start:].strip()
 
 
 def _load_local_summary_markdown(config: Config, paper: Paper) -> str:
@@ -803,8 +844,18 @@ def _ast_node_to_blocks(node: dict[str, Any]) -> list[dict[str, Any]]:
 
 
 def _markdown_to_blocks(markdown: str) -> list[dict[str, Any]]:
-    """Convert markdown into Notion blocks with full inline formatting and math."""
-    md = _escape_math_pipes_in_tables(markdown or "")
+    """Convert markdown into Notion blocks with full inline formatting and math.
+
+    Conversions are memoized per markdown string (re-pushing an unchanged
+    summary skips mistune and lexer guessing); each call gets its own copy of
+    the blocks because callers rewrite image blocks in place.
+    """
+    return json.loads(_markdown_to_blocks_json(markdown or ""))
+
+
+@lru_cache(maxsize=64)
+def _markdown_to_blocks_json(markdown: str) -> str:
+    md = _escape_math_pipes_in_tables(markdown)
     md = _normalise_display_math(md)
     ast = _md_parser(md)
     if not isinstance(ast, list):
@@ -822,12 +873,38 @@ def _markdown_to_blocks(markdown: str) -> list[dict[str, Any]]:
                 "paragraph": {"rich_text": _to_rich_text("No summary available.")},
             }
         )
-    return blocks
+    return json.dumps(blocks)
 
 
 def _blocks_to_markdown(blocks: list[dict[str, Any]], indent: int = 0) -> str:
-    prefix = "  " * indent
     lines: list[str] = []
+    _append_markdown_lines(blocks, indent, lines)
+    result = "\n".join(lines)
+    return result.strip() if indent == 0 else result.rstrip()
+
+
+def _append_nested_markdown_lines(
+    children: list[dict[str, Any]], indent: int, lines: list[str]
+) -> None:
+    if not children:
+        return
+    mark = len(lines)
+    _append_markdown_lines(children, indent, lines)
+    # Trim the nested run like the ``rstrip()`` of a separately joined level
+    while len(lines) > mark and not lines[-1].strip():
+        lines.pop()
+    if len(lines) > mark:
+        lines[-1] = lines[-1].rstrip()
+
+
+def _append_markdown_lines(blocks: list[dict[str, Any]], indent: int, lines: list[str]) -> None:
+    """Render ``blocks`` into ``lines``.
+
+    Nested list items append to the same list instead of joining each level
+    into an intermediate string that its parent then copies again.
+    """
+    prefix = "  " * indent
+    mark = len(lines)
     for block in blocks:
         if not block or block.get("archived"):
             continue
@@ -844,18 +921,10 @@ def _blocks_to_markdown(blocks: list[dict[str, Any]], indent: int = 0) -> str:
             lines.append(f"{prefix}### {text}")
         elif block_type == "bulleted_list_item":
             lines.append(f"{prefix}- {text}")
-            children = payload.get("children", [])
-            if children:
-                nested = _blocks_to_markdown(children, indent + 1)
-                if nested:
-                    lines.append(nested)
+            _append_nested_markdown_lines(payload.get("children", []), indent + 1, lines)
         elif block_type == "numbered_list_item":
             lines.append(f"{prefix}1. {text}")
-            children = payload.get("children", [])
-            if children:
-                nested = _blocks_to_markdown(children, indent + 1)
-                if nested:
-                    lines.append(nested)
+            _append_nested_markdown_lines(payload.get("children", []), indent + 1, lines)
         elif block_type == "quote":
             lines.append(f"{prefix}> {text}")
         elif block_type == "code":
@@ -900,12 +969,9 @@ def _blocks_to_markdown(blocks: list[dict[str, Any]], indent: int = 0) -> str:
         elif block_type == "paragraph":
             lines.append(f"{prefix}{text}" if text else "")
 
-        if lines and lines[-1] != "":
+        if len(lines) > mark and lines[-1] != "":
             lines.append("")
 
-    result = "\n".join(lines)
-    return result.strip() if indent == 0 else result.rstrip()
-
 
 def _dedupe_tags(tags: list[str]) -> list[str]:
     seen: set[str] = set()
@@ -1016,6 +1082,27 @@ class NotionClient:
         self.notion_version = notion_version
         self._property_keys: dict[str, str] | None = None
         self._data_source_id: str | None = None
+        self._client: httpx.AsyncClient | None = None
+        # Paces this token's requests (page fan-out included) under Notion's limit
+        self._bucket = AsyncTokenBucket(rate=_NOTION_REQUESTS_PER_SECOND, burst=3)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=_NOTION_CLIENT_LIMITS, http2=_NOTION_HTTP2)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections; a later request opens a fresh pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     @property
     def _headers(self) -> dict[str, str]:
@@ -1035,14 +1122,33 @@ class NotionClient:
         timeout: float = 60.0,
     ) -> dict[str, Any]:
         url = f"{self.api_base}{path}"
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        # Encoded once (not per 429 retry), compact and as raw UTF-8: httpx
+        # 0.27 would pad separators and \u-escape every non-ASCII character
+        content = (
+            json.dumps(json_payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            if json_payload is not None
+            else None
+        )
+        client = self._get_client()
+        for attempt in range(_NOTION_MAX_RETRIES + 1):
+            await self._bucket.acquire()
             response = await client.request(
                 method,
                 url,
                 headers=self._headers,
-                json=json_payload,
+                content=content,
                 params=params,
+                timeout=timeout,
             )
+            if response.status_code != 429 or attempt == _NOTION_MAX_RETRIES:
+                break
+            delay = server_retry_delay(response)
+            if delay is None:
+                delay = compute_backoff_delay(
+                    attempt, _NOTION_BACKOFF_BASE_SECONDS, _NOTION_BACKOFF_CAP_SECONDS
+                )
+            # The limit is per token, so pause every request on this client at once
+            self._bucket.defer(min(delay, _NOTION_BACKOFF_CAP_SECONDS))
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
@@ -1171,10 +1277,27 @@ class NotionClient:
         """Validate that the configured database is reachable and schema-compatible."""
         await self._ensure_property_keys()
 
-    async def list_papers(self) -> list[NotionPaper]:
+    async def list_papers(
+        self, *, known_edit_times: Mapping[str, datetime] | None = None
+    ) -> list[NotionPaper]:
+        return [record async for record in self.iter_papers(known_edit_times=known_edit_times)]
+
+    async def iter_papers(
+        self, *, known_edit_times: Mapping[str, datetime] | None = None
+    ) -> AsyncIterator[NotionPaper]:
+        """Yield database records one query page (up to 100) at a time.
+
+        Each page's bodies are fetched concurrently, paced by the client's
+        rate limiter, and yielded before the next query page is requested,
+        so at most one query page of block trees is held in memory.
+
+        ``known_edit_times`` maps page ids to the ``last_edited_time`` seen at
+        their last sync; pages still at that time are yielded with an empty
+        ``summary_markdown`` instead of re-downloading their block trees.
+        """
+        known = known_edit_times or {}
         await self._ensure_property_keys()
         ds_id = await self._ensure_data_source_id()
-        pages: list[dict[str, Any]] = []
         cursor: str | None = None
         while True:
             payload: dict[str, Any] = {"page_size": 100}
@@ -1185,20 +1308,23 @@ class NotionClient:
                 f"/data_sources/{ds_id}/query",
                 json_payload=payload,
             )
-            pages.extend(data.get("results", []))
+            page_candidates = [p for p in data.get("results", []) if p.get("object") == "page"]
+            changed_ids = [
+                p["id"]
+                for p in page_candidates
+                if p["id"] not in known
+                or known[p["id"]] != _parse_iso_datetime(p.get("last_edited_time"))
+            ]
+            markdowns = await asyncio.gather(
+                *(self.fetch_page_markdown(page_id) for page_id in changed_ids)
+            )
+            markdown_by_id = dict(zip(changed_ids, markdowns))
+            for page in page_candidates:
+                yield self._parse_page(page, markdown_by_id.get(page["id"], ""))
             if not data.get("has_more"):
                 break
             cursor = data.get("next_cursor")
 
-        page_candidates = [p for p in pages if p.get("object") == "page"]
-        markdowns = await asyncio.gather(
-            *(self.fetch_page_markdown(p["id"]) for p in page_candidates)
-        )
-        records: list[NotionPaper] = []
-        for page, markdown in zip(page_candidates, markdowns):
-            records.append(self._parse_page(page, markdown))
-        return records
-
     def _parse_page(self, page: dict[str, Any], summary_markdown: str) -> NotionPaper:
         props = page.get("properties", {})
         keys = self._property_keys or {}
@@ -1282,13 +1408,22 @@ class NotionClient:
         return blocks
 
     async def _fetch_blocks_recursive(self, parent_id: str) -> list[dict[str, Any]]:
-        """Fetch blocks and recursively populate children for list items."""
+        """Fetch blocks and recursively populate children for list items.
+
+        Sibling subtrees are fetched concurrently; the client's rate limiter
+        keeps the fan-out within Notion's request budget.
+        """
         blocks = await self._fetch_blocks(parent_id)
-        for block in blocks:
-            btype = block.get("type", "")
-            if block.get("has_children") and btype in self._CHILD_BLOCK_TYPES:
-                children = await self._fetch_blocks_recursive(block["id"])
-                block[btype]["children"] = children
+        nested = [
+            block
+            for block in blocks
+            if block.get("has_children") and block.get("type", "") in self._CHILD_BLOCK_TYPES
+        ]
+        children_lists = await asyncio.gather(
+            *(self._fetch_blocks_recursive(block["id"]) for block in nested)
+        )
+        for block, children in zip(nested, children_lists):
+            block[block["type"]]["children"] = children
         return blocks
 
     async def fetch_page_markdown(self, page_id: str) -> str:
@@ -1560,16 +1695,17 @@ class NotionClient:
             raise RuntimeError("Notion upload API did not return upload id")
 
         send_url = f"{self.api_base}/file_uploads/{upload_id}/send"
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            with file_path.open("rb") as fp:
-                resp = await client.post(
-                    send_url,
-                    headers={
-                        "Authorization": f"Bearer {self.token}",
-                        "Notion-Version": self.notion_version,
-                    },
-                    files={"file": (file_path.name, fp, content_type)},
-                )
+        await self._bucket.acquire()
+        with file_path.open("rb") as fp:
+            resp = await self._get_client().post(
+                send_url,
+                headers={
+                    "Authorization": f"Bearer {self.token}",
+                    "Notion-Version": self.notion_version,
+                },
+                files={"file": (file_path.name, fp, content_type)},
+                timeout=120.0,
+            )
         try:
             resp.raise_for_status()
         except httpx.HTTPStatusError as exc:
@@ -1955,12 +2091,36 @@ async def sync_notion(
     if not config.notion_database_id:
         raise ValueError("PAPER_ASSIST_NOTION_DATABASE_ID is required for Notion sync.")
 
+    if notion_client is not None:
+        return await _sync_with_client(
+            notion_client, config=config, storage=storage, paper_id=paper_id, dry_run=dry_run
+        )
+    async with NotionClient(config.notion_token, config.notion_database_id) as client:
+        return await _sync_with_client(
+            client, config=config, storage=storage, paper_id=paper_id, dry_run=dry_run
+        )
+
+
+async def _sync_with_client(
+    client: NotionClient,
+    *,
+    config: Config,
+    storage: StorageManager,
+    paper_id: str | None,
+    dry_run: bool,
+) -> SyncReport:
     report = SyncReport(dry_run=dry_run)
-    client = notion_client or NotionClient(config.notion_token, config.notion_database_id)
     sync_time = _utc_now()
 
     local_papers = storage.list_papers(sort_by="date_added", reverse=False)
-    remote_papers = await client.list_papers()
+    # Linked pages untouched since their last sync come back without a body;
+    # the pull path only compares non-empty remote summaries, so nothing is lost
+    known_edit_times = {
+        p.notion_page_id: p.notion_modified_at
+        for p in local_papers
+        if p.notion_page_id and p.notion_modified_at
+    }
+    remote_papers = await client.list_papers(known_edit_times=known_edit_times)
 
     if paper_id:
         local_papers = [
@@ -2107,5 +2267,8 @@ async def preflight_notion(
     if not config.notion_database_id:
         raise ValueError("PAPER_ASSIST_NOTION_DATABASE_ID is required for Notion sync.")
 
-    client = notion_client or NotionClient(config.notion_token, config.notion_database_id)
-    await client.verify_database()
+    if notion_client is not None:
+        await notion_client.verify_database()
+        return
+    async with NotionClient(config.notion_token, config.notion_database_id) as client:
+        await client.verify_database()
@@ -3,11 +3,43 @@
 from __future__ import annotations
 
 import base64
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+import os
 from pathlib import Path
 
 import pymupdf4llm
 import pymupdf
 
+# Below this many pages per worker, process start-up costs more than it saves
+PAGES_PER_WORKER = 8
+
+
+def _pages_to_markdown(pdf_path: str, pages: list[int]) -> str:
+    return pymupdf4llm.to_markdown(pdf_path, pages=pages)
+
+
+def _to_markdown(pdf_path: Path, pages: list[int]) -> str:
+    """Convert ``pages`` to Markdown, fanning contiguous page runs out to processes.
+
+    Layout analysis is per page, so joining the runs in order matches a single
+    call (header levels are inferred per run, which is stable on a paper's
+    uniform fonts). Short documents, single-core machines, and environments
+    that cannot start workers convert in-process.
+    """
+    workers = min(os.cpu_count() or 1, len(pages) // PAGES_PER_WORKER)
+    if workers < 2:
+        return _pages_to_markdown(str(pdf_path), pages)
+
+    size = -(-len(pages) // workers)
+    runs = [pages[i : i + size] for i in range(0, len(pages), size)]
+    try:
+        with ProcessPoolExecutor(max_workers=len(runs)) as pool:
+            return "".join(pool.map(_pages_to_markdown, repeat(str(pdf_path)), runs))
+    except (BrokenProcessPool, OSError):
+        return _pages_to_markdown(str(pdf_path), pages)
+
 
 def extract_text_from_pdf(pdf_path: Path, max_pages: int = 100) -> str:
     """Extract text from a PDF as Markdown using pymupdf4llm.
@@ -25,8 +57,37 @@ def extract_text_from_pdf(pdf_path: Path, max_pages: int = 100) -> str:
     page_count = get_pdf_page_count(pdf_path)
     pages = list(range(min(page_count, max_pages)))
 
-    md_text = pymupdf4llm.to_markdown(str(pdf_path), pages=pages)
-    return md_text
+    return _to_markdown(pdf_path, pages)
+
+
+def extract_text_from_pdf_bounded(
+    pdf_path: Path,
+    max_chars: int,
+    max_pages: int = 100,
+) -> tuple[str, int, int]:
+    """Extract Markdown from the leading pages that fit a character budget.
+
+    Plain page text (cheap, no layout analysis) is measured first to find
+    where the running total passes ``max_chars``; only those pages go
+    through the Markdown conversion. The page that crosses the budget is
+    kept, so the cut lands on a page boundary. ``max_chars <= 0`` disables
+    the budget.
+
+    Returns:
+        (markdown, pages_extracted, page_count).
+    """
+    with pymupdf.open(str(pdf_path)) as doc:
+        page_count = len(doc)
+        limit = min(page_count, max_pages)
+        if max_chars > 0:
+            total = 0
+            for pno in range(limit):
+                total += len(doc[pno].get_text())
+                if total >= max_chars:
+                    limit = pno + 1
+                    break
+
+    return _to_markdown(pdf_path, list(range(limit))), limit, page_count
 
 
 def get_pdf_page_count(pdf_path: Path) -> int:
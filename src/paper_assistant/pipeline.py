@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import logging
 from pathlib import Path
 import re
-import shutil
 
 import httpx
 
@@ -23,7 +23,7 @@ from paper_assistant.hf_papers import fetch_metadata as fetch_hf_metadata
 from paper_assistant.models import Paper, PaperMetadata, ProcessingStatus, SourceType
 from paper_assistant.notion import describe_exception, sync_notion as run_notion_sync
 from paper_assistant.podcast import generate_feed
-from paper_assistant.storage import StorageManager
+from paper_assistant.storage import StorageManager, copy_file, make_icloud_audio_filename
 from paper_assistant.summarizer import (
     SummarizationResult,
     find_one_pager,
@@ -115,36 +115,36 @@ async def create_local_entry(
         model_used="manual",
         tags=list(tags or []),
     )
-    storage.add_paper(paper)
+    with storage.transaction():
+        storage.add_paper(paper)
 
-    summary_content = format_summary_file(metadata, result)
-    summary_path = storage.save_summary(paper_id, summary_content)
-    paper = storage.get_paper(paper_id) or paper
+        summary_content = format_summary_file(metadata, result)
+        summary_path = storage.save_summary(paper_id, summary_content, paper=paper)
 
-    warnings: list[str] = []
+        warnings: list[str] = []
 
-    audio_result = await render_audio_assets(
-        config=config,
-        storage=storage,
-        paper=paper,
-        source_markdown=markdown,
-        skip_transcript=skip_transcript,
-        skip_audio=skip_audio,
-        provided_script_markdown=provided_script_markdown,
-        skip_script_generation=skip_script_generation,
-    )
-    warnings.extend(audio_result.warnings)
-    paper = storage.get_paper(paper_id) or paper
+        audio_result = await render_audio_assets(
+            config=config,
+            storage=storage,
+            paper=paper,
+            source_markdown=markdown,
+            skip_transcript=skip_transcript,
+            skip_audio=skip_audio,
+            provided_script_markdown=provided_script_markdown,
+            skip_script_generation=skip_script_generation,
+        )
+        warnings.extend(audio_result.warnings)
+        paper = storage.get_paper(paper_id) or paper
 
-    try:
-        from paper_assistant.podcast import generate_feed
+        try:
+            from paper_assistant.podcast import generate_feed
 
-        generate_feed(config, storage.list_papers())
-        paper = storage.get_paper(paper_id) or paper
-        paper.status = ProcessingStatus.COMPLETE
-        storage.add_paper(paper)
-    except Exception as exc:
-        warnings.append(f"Feed regeneration failed: {exc}")
+            await asyncio.to_thread(generate_feed, config, storage.list_papers())
+            paper = storage.get_paper(paper_id) or paper
+            paper.status = ProcessingStatus.COMPLETE
+            storage.add_paper(paper)
+        except Exception as exc:
+            warnings.append(f"Feed regeneration failed: {exc}")
 
     # Update search index
     from paper_assistant.search import get_search_manager
@@ -218,41 +218,39 @@ async def import_paper_summary(
         skip_audio=skip_audio,
         skip_transcript=skip_transcript,
     )
-    storage.add_paper(paper)
-
-    summary_content = format_summary_file(metadata, result)
-    summary_path = storage.save_summary(paper_id, summary_content)
-
-    # Re-fetch after save_summary; StorageManager mutates a different paper instance.
-    paper = storage.get_paper(paper_id) or paper
-    warnings: list[str] = []
+    with storage.transaction():
+        storage.add_paper(paper)
 
-    audio_result = await render_audio_assets(
-        config=config,
-        storage=storage,
-        paper=paper,
-        source_markdown=markdown,
-        skip_transcript=skip_transcript,
-        skip_audio=skip_audio,
-        provided_script_markdown=provided_script_markdown,
-        skip_script_generation=skip_script_generation,
-        script_model_override=script_model_override,
-    )
-    warnings.extend(audio_result.warnings)
-    paper = storage.get_paper(paper_id) or paper
+        summary_content = format_summary_file(metadata, result)
+        summary_path = storage.save_summary(paper_id, summary_content, paper=paper)
+        warnings: list[str] = []
 
-    try:
-        generate_feed(config, storage.list_papers())
-        paper = storage.get_paper(paper_id) or paper
-        paper.status = ProcessingStatus.COMPLETE
-        storage.add_paper(paper)
+        audio_result = await render_audio_assets(
+            config=config,
+            storage=storage,
+            paper=paper,
+            source_markdown=markdown,
+            skip_transcript=skip_transcript,
+            skip_audio=skip_audio,
+            provided_script_markdown=provided_script_markdown,
+            skip_script_generation=skip_script_generation,
+            script_model_override=script_model_override,
+        )
+        warnings.extend(audio_result.warnings)
         paper = storage.get_paper(paper_id) or paper
-    except Exception as exc:
-        warnings.append(f"Feed regeneration failed: {exc}")
+
+        try:
+            await asyncio.to_thread(generate_feed, config, storage.list_papers())
+            paper = storage.get_paper(paper_id) or paper
+            paper.status = ProcessingStatus.COMPLETE
+            storage.add_paper(paper)
+            paper = storage.get_paper(paper_id) or paper
+        except Exception as exc:
+            warnings.append(f"Feed regeneration failed: {exc}")
 
     if paper.audio_path and config.icloud_sync:
         try:
-            _copy_audio_to_icloud(config=config, paper=paper)
+            await asyncio.to_thread(_copy_audio_to_icloud, config=config, paper=paper)
         except Exception as exc:
             warnings.append(f"iCloud copy failed: {exc}")
 
@@ -517,7 +515,7 @@ def _build_import_paper(
     skip_audio: bool,
     skip_transcript: bool,
 ) -> Paper:
-    token_count = result.input_tokens + result.output_tokens
+    token_count = result.total_input_tokens + result.output_tokens
 
     if existing is None:
         return Paper(
@@ -532,8 +530,9 @@ def _build_import_paper(
     # Force × skip preservation rules (invariant 1d + plan §5):
     # - skip_audio is the master switch: preserve both audio and transcript
     # - skip_transcript alone: preserve transcript; regen audio from raw summary
-    # - neither set: clear both so the render helper regenerates them
-    preserved_audio = existing.audio_path if skip_audio else None
+    # - neither set: clear the transcript so the render helper regenerates it
+    # The audio path and its fingerprint always carry over: the render helper
+    # re-synthesizes only when the narration differs from the existing MP3.
     preserved_transcript = (
         existing.transcript_path if (skip_audio or skip_transcript) else None
     )
@@ -549,7 +548,8 @@ def _build_import_paper(
         last_synced_at=existing.last_synced_at,
         archived_at=existing.archived_at,
         notion_page_id=existing.notion_page_id,
-        audio_path=preserved_audio,
+        audio_path=existing.audio_path,
+        tts_hash=existing.tts_hash,
         transcript_path=preserved_transcript,
         model_used=model,
         token_count=token_count,
@@ -570,9 +570,10 @@ def _copy_audio_to_icloud(*, config: Config, paper: Paper) -> Path:
         raise ValueError("Paper has no audio_path to copy to iCloud.")
 
     config.icloud_dir.mkdir(parents=True, exist_ok=True)
-    safe_title = paper.metadata.title[:60].replace("/", "-").replace(":", " -")
-    destination = config.icloud_dir / f"{safe_title} [{paper.metadata.paper_id}].mp3"
-    shutil.copy2(config.data_dir / paper.audio_path, destination)
+    destination = config.icloud_dir / make_icloud_audio_filename(
+        paper.metadata.paper_id, paper.metadata.title
+    )
+    copy_file(config.data_dir / paper.audio_path, destination)
     return destination
 
 
@@ -639,13 +640,13 @@ async def regenerate_transcript_and_audio(
 
     # Refresh feed so the new audio is picked up; failure non-critical.
     try:
-        generate_feed(config, storage.list_papers())
+        await asyncio.to_thread(generate_feed, config, storage.list_papers())
     except Exception as exc:
         warnings.append(f"Feed regeneration failed: {exc}")
 
     if final_paper.audio_path and config.icloud_sync:
         try:
-            _copy_audio_to_icloud(config=config, paper=final_paper)
+            await asyncio.to_thread(_copy_audio_to_icloud, config=config, paper=final_paper)
         except Exception as exc:
             warnings.append(f"iCloud copy failed: {exc}")
 
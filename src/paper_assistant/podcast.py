@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from datetime import timezone
+import threading
+from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from pathlib import Path
 
 from feedgen.feed import FeedGenerator
+from lxml import etree
 
 from paper_assistant.config import Config
+from paper_assistant.fileio import write_bytes_atomic
 from paper_assistant.models import Paper
 
+# Serializes every read-modify-write of a feed file: add-batch siblings patch
+# feed.xml from worker threads, and an unlocked patch drops the other episodes
+_FEED_LOCK = threading.RLock()
+
 
 def generate_feed(
     config: Config,
@@ -28,6 +37,93 @@ def generate_feed(
     Returns:
         The XML string of the feed.
     """
+    fg = _new_feed(config)
+
+    # Add episodes for papers with audio
+    for paper in papers:
+        if paper.audio_path:
+            _add_episode(fg, config, paper)
+
+    # Serialize once and reuse the bytes for both the file and the return value
+    xml = fg.rss_str()
+    out = output_path or config.feed_path
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with _FEED_LOCK:
+        write_bytes_atomic(out, xml)
+
+    return xml.decode("utf-8")
+
+
+def update_feed_entry(
+    config: Config,
+    paper: Paper,
+    output_path: Path | None = None,
+) -> bool:
+    """Insert, replace, or drop a single paper's episode in an existing feed file.
+
+    Avoids reloading every paper just to add one episode. The item is placed
+    where :func:`generate_feed` would put it (items run oldest first) and is
+    rendered by the same code, so the file matches a full regeneration.
+
+    Returns:
+        False if there is no readable feed to patch; the caller should fall
+        back to :func:`generate_feed`, or use :func:`update_or_generate_feed`.
+    """
+    out = output_path or config.feed_path
+    with _FEED_LOCK:
+        try:
+            tree = etree.parse(str(out))
+        except (OSError, etree.XMLSyntaxError):
+            return False
+        channel = tree.getroot().find("channel")
+        if channel is None:
+            return False
+
+        paper_id = paper.metadata.paper_id
+        for item in channel.findall("item"):
+            if item.findtext("guid") == paper_id:
+                channel.remove(item)
+
+        if paper.audio_path:
+            fg = _new_feed(config)
+            _add_episode(fg, config, paper)
+            new_item = etree.fromstring(fg.rss_str()).find("channel/item")
+            new_date = _item_published(new_item)
+            later = next(
+                (item for item in channel.iterfind("item") if _item_published(item) > new_date),
+                None,
+            )
+            if later is None:
+                channel.append(new_item)
+            else:
+                later.addprevious(new_item)
+
+        last_build = channel.find("lastBuildDate")
+        if last_build is not None:
+            last_build.text = format_datetime(datetime.now(timezone.utc))
+
+        write_bytes_atomic(out, etree.tostring(tree, xml_declaration=True, encoding="UTF-8"))
+        return True
+
+
+def update_or_generate_feed(
+    config: Config,
+    paper: Paper,
+    list_papers: Callable[[], list[Paper]],
+    output_path: Path | None = None,
+) -> None:
+    """Patch ``paper``'s episode, building the whole feed first if there is none.
+
+    The lock is held across both steps so concurrent callers that all find
+    no feed cannot each write a full rebuild that lacks the others' episodes.
+    """
+    with _FEED_LOCK:
+        if not update_feed_entry(config, paper, output_path):
+            generate_feed(config, list_papers(), output_path)
+
+
+def _new_feed(config: Config) -> FeedGenerator:
+    """Feed with channel-level metadata and no episodes."""
     fg = FeedGenerator()
     fg.load_extension("podcast")
 
@@ -43,44 +139,43 @@ def generate_feed(
     fg.podcast.itunes_summary(
         "Automated audio summaries of ML research papers from arXiv."
     )
+    return fg
+
+
+def _add_episode(fg: FeedGenerator, config: Config, paper: Paper) -> None:
+    fe = fg.add_entry()
+    fe.id(paper.metadata.paper_id)
+    fe.title(paper.metadata.title)
+    fe.description(paper.metadata.abstract[:500])
+    link_url = (
+        paper.metadata.source_url
+        or paper.metadata.arxiv_url
+        or f"{config.podcast_base_url}/paper/{paper.metadata.paper_id}"
+    )
+    if link_url:
+        fe.link(href=link_url)
 
-    # Add episodes for papers with audio
-    for paper in papers:
-        if not paper.audio_path:
-            continue
-
-        fe = fg.add_entry()
-        fe.id(paper.metadata.paper_id)
-        fe.title(paper.metadata.title)
-        fe.description(paper.metadata.abstract[:500])
-        link_url = (
-            paper.metadata.source_url
-            or paper.metadata.arxiv_url
-            or f"{config.podcast_base_url}/paper/{paper.metadata.paper_id}"
-        )
-        if link_url:
-            fe.link(href=link_url)
-
-        # Ensure datetime is timezone-aware
-        pub_date = paper.date_added
-        if pub_date.tzinfo is None:
-            pub_date = pub_date.replace(tzinfo=timezone.utc)
-        fe.published(pub_date)
-
-        # Audio enclosure
-        audio_filename = paper.audio_path.split("/")[-1]
-        audio_url = f"{config.podcast_base_url}/audio/{audio_filename}"
-
-        # Get file size for enclosure
-        audio_full_path = config.data_dir / paper.audio_path
-        file_size = (
-            audio_full_path.stat().st_size if audio_full_path.exists() else 0
-        )
-
-        fe.enclosure(audio_url, str(file_size), "audio/mpeg")
+    # Ensure datetime is timezone-aware
+    pub_date = paper.date_added
+    if pub_date.tzinfo is None:
+        pub_date = pub_date.replace(tzinfo=timezone.utc)
+    fe.published(pub_date)
+
+    # Audio enclosure
+    audio_filename = paper.audio_path.split("/")[-1]
+    audio_url = f"{config.podcast_base_url}/audio/{audio_filename}"
+
+    # Get file size for enclosure (one stat; a missing file reports 0)
+    try:
+        file_size = (config.data_dir / paper.audio_path).stat().st_size
+    except FileNotFoundError:
+        file_size = 0
+
+    fe.enclosure(audio_url, str(file_size), "audio/mpeg")
 
-    out = output_path or config.feed_path
-    out.parent.mkdir(parents=True, exist_ok=True)
-    fg.rss_file(str(out))
 
-    return fg.rss_str(pretty=True).decode("utf-8")
+def _item_published(item: etree._Element) -> datetime:
+    try:
+        return parsedate_to_datetime(item.findtext("pubDate", ""))
+    except (TypeError, ValueError):
+        return datetime.min.replace(tzinfo=timezone.utc)
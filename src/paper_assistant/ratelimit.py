@@ -0,0 +1,96 @@
+"""Request pacing and retry-delay helpers shared by the HTTP clients."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+# Numeric Retry-After / X-RateLimit-Reset values above this are epoch timestamps
+_EPOCH_SECONDS_THRESHOLD = 10**9
+
+
+class AsyncTokenBucket:
+    """Async token bucket pacing outbound requests to ``rate`` per second.
+
+    Uncontended callers within ``burst`` proceed immediately; later callers
+    reserve a slot and sleep until it comes due. Reservations happen without
+    an await, so no lock is needed and one bucket can outlive event loops.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        self._refill()
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    def defer(self, seconds: float) -> None:
+        """Hold back every caller's next slot by at least ``seconds``.
+
+        Used when the server says to back off: the pause applies to all
+        concurrent requests at once instead of each discovering it with its
+        own 429 and stacking its own backoff.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def parse_retry_after_seconds(value: str | None) -> float | None:
+    """Seconds to wait from a delta, epoch, or HTTP-date header value, or None."""
+    if not value:
+        return None
+
+    stripped = value.strip()
+    try:
+        seconds = float(stripped)
+    except ValueError:
+        pass
+    else:
+        # Some gateways send an absolute epoch timestamp instead of a delta
+        if seconds > _EPOCH_SECONDS_THRESHOLD:
+            seconds -= _utc_now().timestamp()
+        return max(0.0, seconds)
+
+    try:
+        retry_at = parsedate_to_datetime(stripped)
+        if retry_at is None:
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - _utc_now()).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def server_retry_delay(resp: httpx.Response) -> float | None:
+    """Server-requested wait, preferring ``X-RateLimit-Reset`` over ``Retry-After``."""
+    reset_seconds = parse_retry_after_seconds(resp.headers.get("X-RateLimit-Reset"))
+    if reset_seconds is not None:
+        return reset_seconds
+    return parse_retry_after_seconds(resp.headers.get("Retry-After"))
+
+
+def compute_backoff_delay(attempt: int, base_seconds: float, cap_seconds: float) -> float:
+    """Capped exponential backoff for retry ``attempt`` with +/-20% jitter."""
+    exp = min(cap_seconds, base_seconds * float(1 << attempt))
+    # +/-20% jitter, inlined from random.uniform(0.8, 1.2)
+    return max(0.0, min(cap_seconds, exp * (0.8 + 0.4 * random.random())))
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import shutil
+import subprocess
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from paper_assistant.config import Config
+from paper_assistant.fileio import write_bytes_atomic
 from paper_assistant.models import (
     Paper,
     PaperIndex,
@@ -16,6 +27,18 @@ from paper_assistant.models import (
     sanitize_filename,
 )
 
+# Serializes straight to UTF-8 bytes, skipping the str round trip of model_dump_json
+_INDEX_ADAPTER = TypeAdapter(PaperIndex)
+
+# list_papers key functions, chosen once per call rather than per compared paper;
+# any other sort_by sorts on that Paper attribute
+_SORT_KEYS: dict[str, Callable[[Paper], object]] = {
+    "date_added": attrgetter("date_added"),
+    "title": lambda p: p.metadata.title.lower(),
+    "tag": lambda p: p.tags[0].lower() if p.tags else "",
+    "arxiv_id": lambda p: p.metadata.paper_id,
+}
+
 
 def make_summary_filename(
     paper_id: str,
@@ -41,43 +64,184 @@ def make_transcript_filename(paper_id: str) -> str:
     return f"{paper_id}.md"
 
 
+# Characters iCloud Drive rejects or mangles, mapped in a single translate pass
+_ICLOUD_SANITIZE = str.maketrans(
+    {"/": "-", ":": " -", "\\": "-", "|": "-", "?": "", "*": "", '"': "'"}
+)
+
+
+def make_icloud_audio_filename(paper_id: str, title: str) -> str:
+    """Generate the iCloud Drive copy's filename.
+
+    Example: VisualPRM - An Effective Process Reward Model [2503.10291].mp3
+    """
+    return f"{title[:60].translate(_ICLOUD_SANITIZE)} [{paper_id}].mp3"
+
+
 def make_pdf_filename(paper_id: str) -> str:
     """Generate PDF cache filename. Example: 2503.10291.pdf"""
     return f"{paper_id}.pdf"
 
 
+def copy_file(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst``, cloning the file on APFS when possible.
+
+    On macOS ``cp -c`` asks for a clonefile(2) copy-on-write clone, which is a
+    metadata-only operation when both paths live on the same APFS volume.
+    Anywhere else (or if cloning fails) fall back to ``shutil.copy2``, which
+    already uses ``sendfile`` on Linux.
+    """
+    if sys.platform == "darwin":
+        try:
+            subprocess.run(
+                ["cp", "-c", "-p", str(src), str(dst)],
+                check=True,
+                capture_output=True,
+            )
+            return
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    shutil.copy2(src, dst)
+
+
+def _transaction_owner() -> object:
+    """Return the asyncio task, or failing that the thread, running this code."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return task if task is not None else threading.get_ident()
+
+
 class StorageManager:
     """Manages the paper index and file organization."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, *, reuse_index: bool = False) -> None:
         self.config = config
+        self._reuse_index = reuse_index
         self._index: PaperIndex | None = None
+        self._index_stamp: tuple[int, int, int] | None = None
+        self._batch_depth = 0
+        self._batch_owner: object | None = None
+        self._dirty = False
+        self._touched: set[str] = set()
+        self._ids: frozenset[str] = frozenset()
+        self._ids_stamp: tuple[int, int] | None = None
+
+    def _index_file_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.config.index_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
     def load_index(self) -> PaperIndex:
-        """Load index from disk, always re-reading to pick up external changes."""
-        if self.config.index_path.exists():
-            data = json.loads(self.config.index_path.read_text())
-            self._index = PaperIndex.model_validate(data)
+        """Load index from disk.
+
+        With ``reuse_index=True`` the parsed index is reused while ``index.json``
+        keeps the same inode, mtime, and size, so repeated lookups within one
+        command parse the file once while external changes (and this manager's
+        own atomic writes, which swap in a new inode) still trigger a fresh read.
+        The reused ``Paper`` objects are shared between callers, so only opt in
+        for short-lived, single-caller managers such as one CLI invocation.
+        Inside :meth:`transaction` the in-memory index is returned instead so
+        pending writes stay visible.
+        """
+        if self._batch_depth and self._index is not None:
+            return self._index
+
+        stamp = self._index_file_stamp()
+        if stamp is not None:
+            if not self._reuse_index or stamp != self._index_stamp or self._index is None:
+                # Parse and validate in one pass in pydantic-core, from bytes
+                self._index = PaperIndex.model_validate_json(
+                    self.config.index_path.read_bytes()
+                )
+                self._index_stamp = stamp
         elif self._index is None:
             self._index = PaperIndex()
 
         return self._index
 
     def save_index(self) -> None:
-        """Persist the current index to disk."""
+        """Persist the current index to disk (deferred inside a transaction)."""
         if self._index is None:
             return
+        if self._batch_depth:
+            self._dirty = True
+            return
 
         self._index.last_updated = datetime.now(timezone.utc)
-        self.config.index_path.parent.mkdir(parents=True, exist_ok=True)
-        self.config.index_path.write_text(
-            self._index.model_dump_json(indent=2)
+        index_path = self.config.index_path
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unset optional fields load back as their ``None`` defaults
+        write_bytes_atomic(
+            index_path, _INDEX_ADAPTER.dump_json(self._index, indent=2, exclude_none=True)
         )
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Coalesce index writes made inside the block into one write on exit.
+
+        On exit the index is re-read from disk and only the papers added,
+        looked up, or deleted inside the block are applied, so writes made
+        meanwhile by other managers (e.g. sibling ``add-batch`` tasks) survive.
+        The write happens even if the block raises, so error states recorded
+        before the failure are kept. Nested transactions from the same task
+        join the outer one; opening one from another task or thread while a
+        transaction is active raises ``RuntimeError`` — give each concurrent
+        operation its own manager instead.
+        """
+        owner = _transaction_owner()
+        if self._batch_depth:
+            if owner != self._batch_owner:
+                raise RuntimeError("StorageManager transaction already active in another task")
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+
+        self.load_index()
+        self._batch_depth = 1
+        self._batch_owner = owner
+        self._dirty = False
+        self._touched = set()
+        try:
+            yield
+        finally:
+            self._batch_depth = 0
+            self._batch_owner = None
+            touched, self._touched = self._touched, set()
+            if self._dirty:
+                self._dirty = False
+                self._commit(touched)
+
+    def _touch(self, paper_id: str) -> None:
+        """Record a paper the open transaction may change, so the commit merges it."""
+        if self._batch_depth:
+            self._touched.add(paper_id)
+
+    def _commit(self, touched: set[str]) -> None:
+        """Merge the ``touched`` papers into the on-disk index and save."""
+        pending = self._index.papers
+        self._index = None
+        self._index_stamp = None
+        index = self.load_index()
+        for paper_id in touched:
+            paper = pending.get(paper_id)
+            if paper is None:
+                index.papers.pop(paper_id, None)
+            else:
+                index.papers[paper_id] = paper
+        self.save_index()
+
     def add_paper(self, paper: Paper) -> None:
         """Add or update a paper in the index."""
         index = self.load_index()
         index.papers[paper.metadata.paper_id] = paper
+        self._touch(paper.metadata.paper_id)
         self.save_index()
 
     @staticmethod
@@ -88,6 +252,7 @@ class StorageManager:
     def get_paper(self, paper_id: str) -> Paper | None:
         """Retrieve a paper by its paper_id (arxiv_id or source_slug)."""
         index = self.load_index()
+        self._touch(paper_id)
         return index.papers.get(paper_id)
 
     def list_papers(
@@ -100,26 +265,15 @@ class StorageManager:
     ) -> list[Paper]:
         """List papers with optional filtering and sorting."""
         index = self.load_index()
-        papers = list(index.papers.values())
-
-        if status is not None:
-            papers = [p for p in papers if p.status == status]
-
-        if reading_status is not None:
-            papers = [p for p in papers if p.reading_status == reading_status]
-
-        if tag is not None:
-            papers = [p for p in papers if tag in p.tags]
-
-        def sort_key(p: Paper) -> object:
-            if sort_by == "title":
-                return p.metadata.title.lower()
-            if sort_by == "tag":
-                return p.tags[0].lower() if p.tags else ""
-            if sort_by == "arxiv_id":
-                return p.metadata.paper_id
-            return getattr(p, sort_by, p.date_added)
-
+        papers = [
+            p
+            for p in index.papers.values()
+            if (status is None or p.status == status)
+            and (reading_status is None or p.reading_status == reading_status)
+            and (tag is None or tag in p.tags)
+        ]
+
+        sort_key = _SORT_KEYS.get(sort_by) or (lambda p: getattr(p, sort_by, p.date_added))
         papers.sort(key=sort_key, reverse=reverse)
         return papers
 
@@ -132,6 +286,7 @@ class StorageManager:
         paper = index.papers.pop(paper_id, None)
         if paper is None:
             return False
+        self._touch(paper_id)
 
         if delete_files:
             for rel_path in [
@@ -149,9 +304,28 @@ class StorageManager:
         return True
 
     def paper_exists(self, paper_id: str) -> bool:
-        """Check if a paper already exists in the index."""
-        index = self.load_index()
-        return paper_id in index.papers
+        """Check if a paper already exists in the index.
+
+        Answered from a set of IDs that is rebuilt only when the index file's
+        mtime or size changes, so repeated checks (e.g. duplicate URLs in
+        ``add-batch``) skip re-validating every paper in the index.
+        """
+        if self._batch_depth and self._index is not None:
+            return paper_id in self._index.papers
+        return paper_id in self._paper_ids()
+
+    def _paper_ids(self) -> frozenset[str]:
+        try:
+            stat = self.config.index_path.stat()
+        except FileNotFoundError:
+            return frozenset(self._index.papers) if self._index is not None else frozenset()
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._ids_stamp:
+            data = json.loads(self.config.index_path.read_bytes())
+            self._ids = frozenset(data.get("papers", {}))
+            self._ids_stamp = stamp
+        return self._ids
 
     def make_unique_slug(self, base_slug: str) -> str:
         """Return a slug that does not collide with an existing paper_id."""
@@ -252,6 +426,8 @@ class StorageManager:
             )
 
         if changed_paper_ids:
+            for paper_id in changed_paper_ids:
+                self._touch(paper_id)
             self.save_index()
 
         return {
@@ -285,11 +461,22 @@ class StorageManager:
         paper_id: str,
         content: str,
         modified_at: datetime | None = None,
+        *,
+        paper: Paper | None = None,
     ) -> Path:
-        """Write summary markdown file and update paper's summary_path."""
-        paper = self.get_paper(paper_id)
-        if paper is None:
+        """Write summary markdown file and update paper's summary_path.
+
+        Pass the caller's ``paper`` to have it updated in place and stored as
+        the index record, saving a ``get_paper`` re-fetch afterwards.
+        """
+        index = self.load_index()
+        if paper_id not in index.papers:
             raise KeyError(f"Paper {paper_id} not in index")
+        if paper is None:
+            paper = index.papers[paper_id]
+        else:
+            index.papers[paper_id] = paper
+        self._touch(paper_id)
 
         filename = make_summary_filename(
             paper_id,
@@ -360,6 +547,7 @@ class StorageManager:
         full_path.write_bytes(audio_data)
 
         paper.audio_path = f"audio/{filename}"
+        paper.tts_hash = None  # the narration behind these bytes is unknown
         paper.status = ProcessingStatus.AUDIO_GENERATED
         self.save_index()
 
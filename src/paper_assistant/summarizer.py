@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import dataclasses
+import hashlib
+import json
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -17,6 +20,8 @@ from paper_assistant.prompt import (
     USER_PROMPT_TEMPLATE,
 )
 
+SUMMARY_MAX_TOKENS = 8192
+
 
 @dataclass
 class SummarizationResult:
@@ -28,6 +33,16 @@ class SummarizationResult:
     model_used: str = ""
     input_tokens: int = 0
     output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    from_cache: bool = False  # served from the local LLM cache, no API call made
+
+    @property
+    def total_input_tokens(self) -> int:
+        """Prompt tokens including those written to or read from the cache."""
+        return (
+            self.input_tokens + self.cache_creation_input_tokens + self.cache_read_input_tokens
+        )
 
 
 def _require_api_key(config: Config) -> str:
@@ -40,10 +55,83 @@ def _require_api_key(config: Config) -> str:
     return config.anthropic_api_key
 
 
+def _cached_system(prompt: str) -> list[dict]:
+    """Wrap a static system prompt as a block with a prompt-cache breakpoint.
+
+    Everything up to and including the system prompt is identical across
+    papers, so consecutive summaries within the cache TTL reuse the prefix.
+    """
+    return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+def _result_from_response(config: Config, response) -> SummarizationResult:
+    full_text = response.content[0].text
+    sections = parse_summary_sections(full_text)
+    usage = response.usage
+
+    return SummarizationResult(
+        full_markdown=full_text,
+        one_pager=find_one_pager(sections),
+        sections=sections,
+        model_used=config.claude_model,
+        input_tokens=usage.input_tokens,
+        output_tokens=usage.output_tokens,
+        cache_creation_input_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0,
+        cache_read_input_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+    )
+
+
+async def _summarize(
+    config: Config,
+    system_prompt: str,
+    content: str | list[dict],
+    *,
+    use_cache: bool,
+    cache_content: str | None = None,
+) -> SummarizationResult:
+    """Run one summarization request, consulting the local LLM cache first.
+
+    ``cache_content`` stands in for ``content`` in the cache key when the
+    caller has a cheaper identity for it (e.g. a document digest).
+    """
+    from paper_assistant import llm_cache
+
+    key = None
+    if use_cache:
+        if cache_content is None:
+            cache_content = (
+                content if isinstance(content, str) else json.dumps(content, sort_keys=True)
+            )
+        key = llm_cache.prompt_hash(
+            config.claude_model,
+            str(SUMMARY_MAX_TOKENS),
+            system_prompt,
+            cache_content,
+        )
+        cached = llm_cache.get(config, key)
+        if cached is not None:
+            return dataclasses.replace(cached, from_cache=True)
+
+    client = anthropic.AsyncAnthropic(api_key=_require_api_key(config))
+    response = await client.messages.create(
+        model=config.claude_model,
+        max_tokens=SUMMARY_MAX_TOKENS,
+        system=_cached_system(system_prompt),
+        messages=[{"role": "user", "content": content}],
+    )
+
+    result = _result_from_response(config, response)
+    if key is not None:
+        llm_cache.put(config, key, result)
+    return result
+
+
 async def summarize_paper_text(
     config: Config,
     metadata: PaperMetadata,
     paper_text: str,
+    *,
+    use_cache: bool = True,
 ) -> SummarizationResult:
     """Send extracted paper text to Claude for summarization.
 
@@ -51,12 +139,11 @@ async def summarize_paper_text(
         config: Application configuration (API key, model).
         metadata: Paper metadata for context.
         paper_text: Markdown text extracted from PDF.
+        use_cache: Reuse a cached result for an identical request.
 
     Returns:
         SummarizationResult with full markdown and parsed sections.
     """
-    client = anthropic.AsyncAnthropic(api_key=_require_api_key(config))
-
     user_message = USER_PROMPT_TEMPLATE.format(
         title=metadata.title,
         authors=", ".join(metadata.authors),
@@ -64,30 +151,15 @@ async def summarize_paper_text(
         paper_content=paper_text,
     )
 
-    response = await client.messages.create(
-        model=config.claude_model,
-        max_tokens=8192,
-        system=SYSTEM_PROMPT,
-        messages=[{"role": "user", "content": user_message}],
-    )
-
-    full_text = response.content[0].text
-    sections = parse_summary_sections(full_text)
-
-    return SummarizationResult(
-        full_markdown=full_text,
-        one_pager=find_one_pager(sections),
-        sections=sections,
-        model_used=config.claude_model,
-        input_tokens=response.usage.input_tokens,
-        output_tokens=response.usage.output_tokens,
-    )
+    return await _summarize(config, SYSTEM_PROMPT, user_message, use_cache=use_cache)
 
 
 async def summarize_paper_pdf(
     config: Config,
     metadata: PaperMetadata,
     pdf_path: Path,
+    *,
+    use_cache: bool = True,
 ) -> SummarizationResult:
     """Send raw PDF to Claude using native document support.
 
@@ -95,7 +167,6 @@ async def summarize_paper_pdf(
     """
     from paper_assistant.pdf import encode_pdf_base64
 
-    client = anthropic.AsyncAnthropic(api_key=_require_api_key(config))
     pdf_b64 = encode_pdf_base64(pdf_path)
 
     user_text = (
@@ -105,38 +176,27 @@ async def summarize_paper_pdf(
         f"**arXiv ID**: {metadata.arxiv_id or ''}\n"
     )
 
-    response = await client.messages.create(
-        model=config.claude_model,
-        max_tokens=8192,
-        system=SYSTEM_PROMPT,
-        messages=[
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "document",
-                        "source": {
-                            "type": "base64",
-                            "media_type": "application/pdf",
-                            "data": pdf_b64,
-                        },
-                    },
-                    {"type": "text", "text": user_text},
-                ],
-            }
-        ],
-    )
-
-    full_text = response.content[0].text
-    sections = parse_summary_sections(full_text)
-
-    return SummarizationResult(
-        full_markdown=full_text,
-        one_pager=find_one_pager(sections),
-        sections=sections,
-        model_used=config.claude_model,
-        input_tokens=response.usage.input_tokens,
-        output_tokens=response.usage.output_tokens,
+    content = [
+        {
+            "type": "document",
+            "source": {
+                "type": "base64",
+                "media_type": "application/pdf",
+                "data": pdf_b64,
+            },
+        },
+        {"type": "text", "text": user_text},
+    ]
+
+    # Key on the PDF digest so a --force re-run with an unchanged PDF hits the
+    # cache without serializing the whole base64 payload into the key
+    pdf_digest = hashlib.sha256(pdf_b64.encode("ascii")).hexdigest()
+    return await _summarize(
+        config,
+        SYSTEM_PROMPT,
+        content,
+        use_cache=use_cache,
+        cache_content=f"application/pdf sha256:{pdf_digest}\n{user_text}",
     )
 
 
@@ -144,13 +204,13 @@ async def summarize_article_text(
     config: Config,
     metadata: PaperMetadata,
     article_text: str,
+    *,
+    use_cache: bool = True,
 ) -> SummarizationResult:
     """Send web article text to Claude for summarization.
 
     Uses the article-specific prompt template (not the ML paper prompt).
     """
-    client = anthropic.AsyncAnthropic(api_key=_require_api_key(config))
-
     user_message = ARTICLE_USER_PROMPT_TEMPLATE.format(
         title=metadata.title,
         authors=", ".join(metadata.authors) if metadata.authors else "Unknown",
@@ -158,24 +218,7 @@ async def summarize_article_text(
         article_content=article_text,
     )
 
-    response = await client.messages.create(
-        model=config.claude_model,
-        max_tokens=8192,
-        system=ARTICLE_SYSTEM_PROMPT,
-        messages=[{"role": "user", "content": user_message}],
-    )
-
-    full_text = response.content[0].text
-    sections = parse_summary_sections(full_text)
-
-    return SummarizationResult(
-        full_markdown=full_text,
-        one_pager=find_one_pager(sections),
-        sections=sections,
-        model_used=config.claude_model,
-        input_tokens=response.usage.input_tokens,
-        output_tokens=response.usage.output_tokens,
-    )
+    return await _summarize(config, ARTICLE_SYSTEM_PROMPT, user_message, use_cache=use_cache)
 
 
 def _looks_like_generated_header(chunk: str) -> bool:
@@ -12,6 +12,7 @@ import os
 import re
 import shutil
 import tempfile
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
@@ -262,6 +263,10 @@ def _strip_markdown_for_speech(text: str, *, replace_equations: bool) -> str:
 
 
 _SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'`(])")
+# Words whose trailing period does not end a sentence ("Dr. Smith", "e.g. X")
+_ABBREVIATIONS = frozenset(
+    {"dr", "mr", "mrs", "ms", "prof", "st", "vs", "etc", "e.g", "i.e", "al", "fig", "eq", "no"}
+)
 
 
 def split_into_chunks(text: str, max_chars: int) -> list[str]:
@@ -334,6 +339,56 @@ def _hard_split(text: str, max_chars: int) -> list[str]:
     return chunks
 
 
+async def iter_speech_chunks(
+    deltas: AsyncIterator[str],
+    *,
+    first_chars: int = 200,
+    max_chars: int = 2000,
+) -> AsyncIterator[str]:
+    """Regroup streamed text into paragraph-aligned chunks for incremental TTS.
+
+    A chunk is released once at least ``first_chars`` of complete paragraphs
+    have arrived, so speech can start early; the first chunk may also end at
+    a sentence break past ``first_chars`` when the opening paragraph runs
+    long. Each later chunk doubles the threshold up to ``max_chars`` to keep
+    TTS round trips few. Whatever remains when the stream ends is flushed as
+    the last chunk.
+    """
+    threshold = first_chars
+    buffer = ""
+    started = False
+    async for delta in deltas:
+        buffer += delta
+        cut = buffer.rfind("\n\n")
+        if cut >= threshold:
+            yield buffer[:cut]
+            buffer = buffer[cut + 2 :]
+        elif not started and (end := _sentence_end(buffer, threshold)) is not None:
+            # Don't hold the first audio back for a long opening paragraph
+            yield buffer[:end].rstrip()
+            buffer = buffer[end:]
+        else:
+            continue
+        started = True
+        threshold = min(max_chars, threshold * 2)
+    if buffer.strip():
+        yield buffer
+
+
+def _sentence_end(text: str, start: int) -> int | None:
+    """Index just past the first sentence break at or after ``start``.
+
+    Periods after abbreviations and single-letter initials are skipped;
+    decimals never match because the break needs following whitespace.
+    """
+    for match in _SENTENCE_SPLIT_RE.finditer(text, max(start - 1, 0)):
+        word = text[: match.start()].rsplit(None, 1)[-1].lstrip("(\"'").rstrip(".").lower()
+        if text[match.start() - 1] == "." and (len(word) == 1 or word in _ABBREVIATIONS):
+            continue
+        return match.end()
+    return None
+
+
 # Backend protocol + factory ---------------------------------------------------
 
 
@@ -381,6 +436,26 @@ class EdgeTTSBackend:
             raise EdgeTTSError(f"edge-tts failed: {exc}") from exc
         return output_path
 
+    async def synthesize_stream(self, chunks: AsyncIterator[str], output_path: Path) -> Path:
+        """Synthesize text chunks as they arrive, appending MP3 frames to ``output_path``.
+
+        edge-tts emits headerless constant-bitrate MP3, so the per-chunk
+        outputs concatenate into one playable file. Errors raised by the
+        ``chunks`` iterator itself propagate unchanged.
+        """
+        with output_path.open("wb") as f:
+            async for chunk in chunks:
+                try:
+                    communicate = edge_tts.Communicate(
+                        text=chunk, voice=self.voice, rate=self.rate
+                    )
+                    async for message in communicate.stream():
+                        if message["type"] == "audio":
+                            f.write(message["data"])
+                except Exception as exc:
+                    raise EdgeTTSError(f"edge-tts failed: {exc}") from exc
+        return output_path
+
 
 # MLX backend ------------------------------------------------------------------
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -13,9 +14,18 @@ from paper_assistant.config import Config
 WEB_DIR = Path(__file__).parent
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    # Release pooled arXiv keep-alive connections held by the server loop
+    from paper_assistant.arxiv import aclose_client
+
+    await aclose_client()
+
+
 def create_app(config: Config) -> FastAPI:
     """Create and configure the FastAPI application."""
-    app = FastAPI(title="Paper Assistant")
+    app = FastAPI(title="Paper Assistant", lifespan=_lifespan)
 
     # Store config on app state
     app.state.config = config
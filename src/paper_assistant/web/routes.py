@@ -16,6 +16,8 @@ from paper_assistant.storage import StorageManager
 
 logger = logging.getLogger(__name__)
 
+_VALID_SORTS = frozenset({"date_added", "title", "tag", "arxiv_id"})
+
 
 class ImportRequest(BaseModel):
     url: str
@@ -118,8 +120,7 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
         """Dashboard: list all papers with optional filters and sorting."""
         from paper_assistant.models import ProcessingStatus, ReadingStatus
 
-        valid_sorts = {"date_added", "title", "tag", "arxiv_id"}
-        if sort not in valid_sorts:
+        if sort not in _VALID_SORTS:
             sort = "date_added"
         reverse = order != "asc"
 
@@ -222,10 +223,9 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
 
             result = await summarize_article_text(config, metadata, body_text)
             summary_content = format_summary_file(metadata, result)
-            storage.save_summary(paper_id, summary_content)
-            paper = storage.get_paper(paper_id)
+            storage.save_summary(paper_id, summary_content, paper=paper)
             paper.model_used = result.model_used
-            paper.token_count = result.input_tokens + result.output_tokens
+            paper.token_count = result.total_input_tokens + result.output_tokens
             storage.add_paper(paper)
 
             audio_result = await render_audio_assets(
@@ -241,7 +241,7 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
             storage.add_paper(paper)
 
             all_papers = storage.list_papers()
-            generate_feed(config, all_papers)
+            await asyncio.to_thread(generate_feed, config, all_papers)
 
             if search_mgr:
                 try:
@@ -312,10 +312,11 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
                 paper_text = await fetch_hf_markdown_body(arxiv_id, config=config)
             except Exception as exc:
                 logger.warning("HF markdown unavailable for %s in WebUI add flow: %s", arxiv_id, exc)
-                pdf_path = config.pdfs_dir / make_pdf_filename(arxiv_id)
+                pdf_name = make_pdf_filename(arxiv_id)
+                pdf_path = config.pdfs_dir / pdf_name
                 await download_pdf(arxiv_id, pdf_path, config=config)
-                paper.pdf_path = f"pdfs/{make_pdf_filename(arxiv_id)}"
-                paper_text = extract_text_from_pdf(pdf_path)
+                paper.pdf_path = f"pdfs/{pdf_name}"
+                paper_text = await asyncio.to_thread(extract_text_from_pdf, pdf_path)
 
             paper.status = ProcessingStatus.FETCHED
             storage.add_paper(paper)
@@ -330,10 +331,9 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
             )
 
             summary_content = format_summary_file(metadata, result)
-            storage.save_summary(arxiv_id, summary_content)
-            paper = storage.get_paper(arxiv_id)
+            storage.save_summary(arxiv_id, summary_content, paper=paper)
             paper.model_used = result.model_used
-            paper.token_count = result.input_tokens + result.output_tokens
+            paper.token_count = result.total_input_tokens + result.output_tokens
             storage.add_paper(paper)
 
             audio_result = await render_audio_assets(
@@ -349,7 +349,7 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
             storage.add_paper(paper)
 
             all_papers = storage.list_papers()
-            generate_feed(config, all_papers)
+            await asyncio.to_thread(generate_feed, config, all_papers)
 
             if search_mgr:
                 try:
@@ -383,7 +383,8 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
         try:
             result = await import_paper_summary(
                 config=config,
-                storage=storage,
+                # Own manager: the pipeline holds a transaction across awaits
+                storage=StorageManager(config),
                 url=req.url,
                 markdown=req.markdown,
                 model="manual",
@@ -420,7 +421,8 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
         try:
             outcome = await create_local_entry(
                 config=config,
-                storage=storage,
+                # Own manager: the pipeline holds a transaction across awaits
+                storage=StorageManager(config),
                 title=req.title,
                 markdown=req.markdown,
                 source_url=req.source_url,
@@ -497,7 +499,7 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
         if storage.delete_paper(paper_id, delete_files=True):
             from paper_assistant.podcast import generate_feed
             all_papers = storage.list_papers()
-            generate_feed(config, all_papers)
+            await asyncio.to_thread(generate_feed, config, all_papers)
             if search_mgr:
                 try:
                     search_mgr.delete_paper(paper_id)
@@ -587,8 +589,7 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
         """JSON API: list all papers."""
         from paper_assistant.models import ProcessingStatus, ReadingStatus
 
-        valid_sorts = {"date_added", "title", "tag", "arxiv_id"}
-        if sort not in valid_sorts:
+        if sort not in _VALID_SORTS:
             sort = "date_added"
         reverse = order != "asc"
 
@@ -715,8 +716,7 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
                 model_used=paper.model_used or "manual-edit",
             )
             summary_content = format_summary_file(paper.metadata, result)
-            storage.save_summary(paper_id, summary_content)
-            paper = storage.get_paper(paper_id)
+            storage.save_summary(paper_id, summary_content, paper=paper)
         except Exception as e:
             return {"error": f"Failed to save summary: {e}"}
 
@@ -735,7 +735,7 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
 
         try:
             all_papers = storage.list_papers()
-            generate_feed(config, all_papers)
+            await asyncio.to_thread(generate_feed, config, all_papers)
         except Exception:
             pass
 
@@ -812,7 +812,7 @@ def create_router(config: Config, templates: Jinja2Templates) -> APIRouter:
         from paper_assistant.podcast import generate_feed
 
         papers = storage.list_papers()
-        xml = generate_feed(config, papers)
+        xml = await asyncio.to_thread(generate_feed, config, papers)
         return Response(content=xml, media_type="application/rss+xml")
 
     return router
@@ -6,9 +6,7 @@ import re
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
-import httpx
-
-from paper_assistant.arxiv import parse_arxiv_url
+from paper_assistant.arxiv import parse_arxiv_url, shared_client
 from paper_assistant.models import PaperMetadata, SourceType
 
 
@@ -60,13 +58,12 @@ async def fetch_article(
     Returns:
         (metadata, body_text) where body_text is the article content as plain text.
     """
-    async with httpx.AsyncClient(
-        timeout=timeout,
-        follow_redirects=True,
+    response = await shared_client().get(
+        url,
         headers={"User-Agent": "paper-assistant/0.1"},
-    ) as client:
-        response = await client.get(url)
-        response.raise_for_status()
+        timeout=timeout,
+    )
+    response.raise_for_status()
 
     html = response.text
     slug = slugify_url(url)
@@ -1,14 +1,36 @@
 """Tests for paper_assistant.arxiv URL parsing and request resilience."""
 
+import asyncio
+import os
+import tempfile
+import time
 from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
-from paper_assistant.arxiv import ArxivRateLimitError, fetch_metadata, parse_arxiv_url
+from paper_assistant.arxiv import (
+    ARXIV_METADATA_CACHE_TTL_SECONDS,
+    ArxivRateLimitError,
+    PaperNotFoundError,
+    _env_request_policy,
+    _get_client,
+    _parse_arxiv_datetime,
+    _resolve_request_policy,
+    aclose_client,
+    download_pdf,
+    fetch_all,
+    fetch_metadata,
+    fetch_metadata_many,
+    parse_arxiv_url,
+    warmup,
+)
 from paper_assistant.config import Config
+from paper_assistant.fileio import _UMASK
+from paper_assistant.ratelimit import AsyncTokenBucket
 
 ATOM_ENTRY_XML = """<?xml version="1.0" encoding="UTF-8"?>
 <feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
@@ -26,6 +48,25 @@ ATOM_ENTRY_XML = """<?xml version="1.0" encoding="UTF-8"?>
 </feed>
 """
 
+ATOM_MULTI_CATEGORY_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <entry>
+    <id>http://arxiv.org/abs/2503.10291v1</id>
+    <published>2025-03-13T00:00:00Z</published>
+    <title>A Long Title
+      Wrapped Across Lines</title>
+    <summary>  Test abstract  </summary>
+    <author><name>Alice</name></author>
+    <category term="cs.LG" />
+    <arxiv:primary_category term="cs.CL" />
+    <category term="cs.CL" />
+    <category term="cs.LG" />
+    <category />
+    <category term="stat.ML" />
+  </entry>
+</feed>
+"""
+
 ABS_PAGE_HTML = """<!doctype html>
 <html>
   <head>
@@ -44,6 +85,30 @@ ABS_PAGE_HTML = """<!doctype html>
 """
 
 
+ATOM_ERROR_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/api/Error</id>
+    <title>Error</title>
+    <summary>incorrect id format for 9999.99999</summary>
+  </entry>
+</feed>
+"""
+
+ATOM_EMPTY_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"></feed>
+"""
+
+
+@pytest.fixture(autouse=True)
+def _unpaced_arxiv_bucket(monkeypatch):
+    """Keep the process-wide arXiv pacing bucket from leaking between tests."""
+    monkeypatch.setattr(
+        "paper_assistant.arxiv._ARXIV_BUCKET",
+        AsyncTokenBucket(rate=1000.0, burst=1000),
+    )
+
+
 def _metadata_response(
     status_code: int = 200,
     *,
@@ -75,6 +140,7 @@ def _abs_page_response(
 def _test_config(**overrides: object) -> Config:
     kwargs = {
         "anthropic_api_key": "test-key",
+        "data_dir": Path(tempfile.mkdtemp(prefix="paper-assist-arxiv-")),
         "arxiv_max_retries": 2,
         "arxiv_backoff_base_seconds": 0.01,
         "arxiv_backoff_cap_seconds": 0.05,
@@ -129,6 +195,94 @@ class TestParseArxivUrl:
         with pytest.raises(ValueError):
             parse_arxiv_url("not-an-arxiv-id")
 
+    def test_bare_id_with_pdf_extension_raises(self):
+        with pytest.raises(ValueError):
+            parse_arxiv_url("2503.10291.pdf")
+
+    def test_repeated_invalid_input_raises_every_time(self):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parse_arxiv_url("https://example.com/paper")
+
+
+class TestRequestPolicy:
+    def test_env_policy_is_parsed_once_until_cache_clear(self, monkeypatch):
+        monkeypatch.setenv("PAPER_ASSIST_ARXIV_MAX_RETRIES", "3")
+        _env_request_policy.cache_clear()
+        try:
+            assert _resolve_request_policy(None)[1] == 3
+
+            monkeypatch.setenv("PAPER_ASSIST_ARXIV_MAX_RETRIES", "5")
+            assert _resolve_request_policy(None)[1] == 3
+
+            _env_request_policy.cache_clear()
+            assert _resolve_request_policy(None)[1] == 5
+        finally:
+            _env_request_policy.cache_clear()
+
+    def test_config_policy_bypasses_env(self, monkeypatch):
+        monkeypatch.setenv("PAPER_ASSIST_ARXIV_MAX_RETRIES", "9")
+        assert _resolve_request_policy(_test_config(arxiv_max_retries=1))[1] == 1
+
+
+class TestAtomParsing:
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_extracts_first_entry_fields(self):
+        get_mock = AsyncMock(side_effect=[_metadata_response(200)])
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            metadata = await fetch_metadata("2503.10291", config=_test_config())
+
+        assert metadata.title == "Test Paper"
+        assert metadata.abstract == "Test abstract"
+        assert metadata.authors == ["Alice", "Bob"]
+        assert metadata.published == datetime(2025, 3, 13, tzinfo=timezone.utc)
+        assert metadata.categories == ["cs.AI"]
+        assert metadata.pdf_url == "https://arxiv.org/pdf/2503.10291"
+        assert get_mock.await_args.kwargs["headers"]["Accept-Encoding"] == "gzip, br, zstd"
+
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_orders_primary_category_first_without_duplicates_or_blanks(self):
+        get_mock = AsyncMock(side_effect=[_metadata_response(200, text=ATOM_MULTI_CATEGORY_XML)])
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            metadata = await fetch_metadata("2503.10291", config=_test_config())
+
+        assert metadata.title == "A Long Title Wrapped Across Lines"
+        assert metadata.abstract == "Test abstract"
+        assert metadata.categories == ["cs.CL", "cs.LG", "stat.ML"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_collapses_unicode_whitespace_in_title(self):
+        body = ATOM_ENTRY_XML.replace("Test Paper", "Test\u00a0\u00a0Paper\u2009 Title")
+        get_mock = AsyncMock(side_effect=[_metadata_response(200, text=body)])
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            metadata = await fetch_metadata("2503.10291", config=_test_config())
+
+        assert metadata.title == "Test Paper Title"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [ATOM_ERROR_XML, ATOM_EMPTY_XML], ids=["error", "empty"])
+    async def test_fetch_metadata_raises_not_found_for_error_or_empty_feed(self, body):
+        get_mock = AsyncMock(side_effect=[_metadata_response(200, text=body)])
+        with (
+            patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock),
+            pytest.raises(PaperNotFoundError),
+        ):
+            await fetch_metadata("9999.99999", config=_test_config())
+
+    @pytest.mark.parametrize(
+        "value",
+        ["2025-03-13T17:59:59Z", "2025-03-13T17:59:59+00:00"],
+        ids=["zulu", "offset"],
+    )
+    def test_parse_arxiv_datetime_returns_utc(self, value):
+        assert _parse_arxiv_datetime(value) == datetime(
+            2025, 3, 13, 17, 59, 59, tzinfo=timezone.utc
+        )
+
+    def test_parse_arxiv_datetime_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            _parse_arxiv_datetime("2025-13-45T99:99:99Z")
+
 
 class TestArxivRetries:
     @pytest.mark.asyncio
@@ -164,10 +318,10 @@ class TestArxivRetries:
         with (
             patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock),
             patch("paper_assistant.arxiv.asyncio.sleep", new=sleep_mock),
-            patch("paper_assistant.arxiv._utc_now", return_value=now),
+            patch("paper_assistant.ratelimit._utc_now", return_value=now),
+            pytest.raises(ArxivRateLimitError, match="Retry in about 15s"),
         ):
-            with pytest.raises(ArxivRateLimitError, match="Retry in about 15s"):
-                await fetch_metadata("2503.10291", config=_test_config())
+            await fetch_metadata("2503.10291", config=_test_config())
 
         assert get_mock.await_count == 2
         assert sleep_mock.await_count == 0
@@ -192,6 +346,29 @@ class TestArxivRetries:
         assert get_mock.await_count == 3
         assert sleep_mock.await_count == 2
 
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_honors_503_retry_hint_bounded_by_cap(self):
+        get_mock = AsyncMock(
+            side_effect=[
+                _metadata_response(503, headers={"Retry-After": "0.02"}, text="unavailable"),
+                _metadata_response(
+                    503,
+                    headers={"Retry-After": "0.02", "X-RateLimit-Reset": "0.03"},
+                    text="unavailable",
+                ),
+                _metadata_response(503, headers={"Retry-After": "3600"}, text="unavailable"),
+                _metadata_response(200),
+            ]
+        )
+        sleep_mock = AsyncMock()
+        with (
+            patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock),
+            patch("paper_assistant.arxiv.asyncio.sleep", new=sleep_mock),
+        ):
+            await fetch_metadata("2503.10291", config=_test_config(arxiv_max_retries=3))
+
+        assert [call.args[0] for call in sleep_mock.await_args_list] == [0.02, 0.03, 0.1]
+
     @pytest.mark.asyncio
     async def test_fetch_metadata_does_not_retry_non_retryable_4xx(self):
         get_mock = AsyncMock(side_effect=[_metadata_response(404, text="not found")])
@@ -199,9 +376,9 @@ class TestArxivRetries:
         with (
             patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock),
             patch("paper_assistant.arxiv.asyncio.sleep", new=sleep_mock),
+            pytest.raises(httpx.HTTPStatusError),
         ):
-            with pytest.raises(httpx.HTTPStatusError):
-                await fetch_metadata("2503.10291", config=_test_config())
+            await fetch_metadata("2503.10291", config=_test_config())
 
         assert get_mock.await_count == 1
         assert sleep_mock.await_count == 0
@@ -218,9 +395,9 @@ class TestArxivRetries:
         with (
             patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock),
             patch("paper_assistant.arxiv.asyncio.sleep", new=sleep_mock),
+            pytest.raises(ArxivRateLimitError, match="Retry in about 5s"),
         ):
-            with pytest.raises(ArxivRateLimitError, match="Retry in about 5s"):
-                await fetch_metadata("2503.10291", config=_test_config(arxiv_max_retries=1))
+            await fetch_metadata("2503.10291", config=_test_config(arxiv_max_retries=1))
 
         assert get_mock.await_count == 2
         assert sleep_mock.await_count == 0
@@ -245,3 +422,339 @@ class TestArxivRetries:
         assert metadata.authors == ["Alice", "Bob"]
         assert get_mock.await_count == 2
         assert sleep_mock.await_count == 0
+
+
+class TestArxivCaching:
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_serves_repeat_calls_from_disk_cache(self, tmp_path):
+        config = _test_config(data_dir=tmp_path)
+        get_mock = AsyncMock(side_effect=[_metadata_response(200)])
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            first = await fetch_metadata("2503.10291", config=config)
+            second = await fetch_metadata("2503.10291", config=config)
+
+        assert get_mock.await_count == 1
+        assert second == first
+        assert second.categories == ["cs.AI"]
+        assert second.published == datetime(2025, 3, 13, tzinfo=timezone.utc)
+        assert (config.arxiv_cache_dir / "2503.10291.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetch_metadata_calls_share_one_request(self, tmp_path):
+        config = _test_config(data_dir=tmp_path)
+        release = asyncio.Event()
+
+        async def slow_get(*args, **kwargs):
+            await release.wait()
+            return _metadata_response(200)
+
+        get_mock = AsyncMock(side_effect=slow_get)
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            tasks = [
+                asyncio.create_task(fetch_metadata("2503.10291", config=config))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert get_mock.await_count == 1
+        assert all(result == results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetch_metadata_failure_propagates_to_all_waiters(self, tmp_path):
+        config = _test_config(data_dir=tmp_path)
+        release = asyncio.Event()
+
+        async def failing_get(*args, **kwargs):
+            await release.wait()
+            return _metadata_response(404, text="not found")
+
+        get_mock = AsyncMock(side_effect=failing_get)
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            tasks = [
+                asyncio.create_task(fetch_metadata("2503.10291", config=config))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert get_mock.await_count == 1
+        assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_first_caller_does_not_cancel_other_waiters(self, tmp_path):
+        config = _test_config(data_dir=tmp_path)
+        release = asyncio.Event()
+
+        async def slow_get(*args, **kwargs):
+            await release.wait()
+            return _metadata_response(200)
+
+        get_mock = AsyncMock(side_effect=slow_get)
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            first = asyncio.create_task(fetch_metadata("2503.10291", config=config))
+            second = asyncio.create_task(fetch_metadata("2503.10291", config=config))
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            metadata = await second
+
+        assert first.cancelled()
+        assert metadata.title == "Test Paper"
+        assert get_mock.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_refetches_expired_cache_entry(self, tmp_path):
+        config = _test_config(data_dir=tmp_path)
+        get_mock = AsyncMock(side_effect=[_metadata_response(200), _metadata_response(200)])
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            await fetch_metadata("2503.10291", config=config)
+            cache_path = config.arxiv_cache_dir / "2503.10291.json"
+            stale = time.time() - ARXIV_METADATA_CACHE_TTL_SECONDS - 1
+            os.utime(cache_path, (stale, stale))
+            await fetch_metadata("2503.10291", config=config)
+
+        assert get_mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_metadata_does_not_cache_abs_page_fallback(self, tmp_path):
+        config = _test_config(data_dir=tmp_path)
+        get_mock = AsyncMock(
+            side_effect=[
+                _metadata_response(429, headers={"Retry-After": "0"}),
+                _abs_page_response(200),
+            ]
+        )
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            await fetch_metadata("2503.10291", config=config)
+
+        assert not (config.arxiv_cache_dir / "2503.10291.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_download_pdf_skips_request_when_file_exists(self, tmp_path):
+        output_path = tmp_path / "2503.10291.pdf"
+        output_path.write_bytes(b"%PDF-1.7")
+        get_mock = AsyncMock()
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            result = await download_pdf("2503.10291", output_path, config=_test_config())
+
+        assert result == output_path
+        get_mock.assert_not_awaited()
+
+
+class TestArxivClientPool:
+    @pytest.mark.asyncio
+    async def test_client_is_reused_within_a_loop_until_closed(self):
+        first = _get_client()
+        assert _get_client() is first
+
+        await aclose_client()
+
+        assert first.is_closed
+        replacement = _get_client()
+        assert replacement is not first
+        await aclose_client()
+
+    @pytest.mark.asyncio
+    async def test_warmup_probes_both_hosts_and_swallows_errors(self):
+        head_mock = AsyncMock(side_effect=[httpx.ConnectError("offline"), None])
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.head", new=head_mock):
+            await warmup(config=_test_config())
+
+        assert [call.args[0] for call in head_mock.await_args_list] == [
+            "https://export.arxiv.org/",
+            "https://arxiv.org/",
+        ]
+        await aclose_client()
+
+
+def _pdf_response(
+    status_code: int = 200,
+    *,
+    content: bytes = b"%PDF-1.7 body",
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
+    return httpx.Response(
+        status_code=status_code,
+        headers=headers,
+        content=content,
+        request=httpx.Request("GET", "https://arxiv.org/pdf/2503.10291"),
+    )
+
+
+class TestDownloadPdf:
+    @pytest.mark.asyncio
+    async def test_download_pdf_streams_body_to_disk_after_retry(self, tmp_path):
+        output_path = tmp_path / "2503.10291.pdf"
+        send_mock = AsyncMock(side_effect=[_pdf_response(503, content=b""), _pdf_response(200)])
+        sleep_mock = AsyncMock()
+        with (
+            patch("paper_assistant.arxiv.httpx.AsyncClient.send", new=send_mock),
+            patch("paper_assistant.arxiv.asyncio.sleep", new=sleep_mock),
+        ):
+            await download_pdf("2503.10291", output_path, config=_test_config())
+
+        assert output_path.read_bytes() == b"%PDF-1.7 body"
+        assert os.stat(output_path).st_mode & 0o777 == 0o666 & ~_UMASK
+        assert send_mock.await_count == 2
+        assert send_mock.await_args.kwargs["stream"] is True
+        assert sleep_mock.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_download_pdf_429_pauses_the_shared_bucket(self, tmp_path, monkeypatch):
+        bucket = AsyncTokenBucket(rate=1000.0, burst=1000)
+        monkeypatch.setattr("paper_assistant.arxiv._ARXIV_BUCKET", bucket)
+        send_mock = AsyncMock(
+            side_effect=[
+                _pdf_response(429, content=b"", headers={"Retry-After": "0.05"}),
+                _pdf_response(200),
+            ]
+        )
+        sleep_mock = AsyncMock()
+        with (
+            patch("paper_assistant.arxiv.httpx.AsyncClient.send", new=send_mock),
+            patch("paper_assistant.arxiv.asyncio.sleep", new=sleep_mock),
+        ):
+            await download_pdf("2503.10291", tmp_path / "out.pdf", config=_test_config())
+
+        assert send_mock.await_count == 2
+        assert [call.args[0] for call in sleep_mock.await_args_list] == [
+            pytest.approx(0.05, abs=0.01)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_returns_metadata_and_pdf_path(self, tmp_path):
+        output_path = tmp_path / "2503.10291.pdf"
+        get_mock = AsyncMock(side_effect=[_metadata_response(200)])
+        send_mock = AsyncMock(side_effect=[_pdf_response(200)])
+        with (
+            patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock),
+            patch("paper_assistant.arxiv.httpx.AsyncClient.send", new=send_mock),
+        ):
+            metadata, pdf_path = await fetch_all(
+                "2503.10291", output_path, config=_test_config(data_dir=tmp_path)
+            )
+
+        assert metadata.title == "Test Paper"
+        assert pdf_path == output_path
+        assert output_path.read_bytes() == b"%PDF-1.7 body"
+
+    @pytest.mark.asyncio
+    async def test_download_pdf_leaves_no_partial_file_on_failure(self, tmp_path):
+        output_path = tmp_path / "2503.10291.pdf"
+        send_mock = AsyncMock(side_effect=[_pdf_response(404, content=b"missing")])
+        with (
+            patch("paper_assistant.arxiv.httpx.AsyncClient.send", new=send_mock),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            await download_pdf("2503.10291", output_path, config=_test_config())
+
+        assert not output_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_download_pdf_discards_temp_file_when_stream_breaks(self, tmp_path):
+        output_path = tmp_path / "2503.10291.pdf"
+
+        class _BrokenStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b"%PDF-1.7 partial"
+                raise httpx.ReadError("connection reset")
+
+        resp = httpx.Response(
+            status_code=200,
+            stream=_BrokenStream(),
+            request=httpx.Request("GET", "https://arxiv.org/pdf/2503.10291"),
+        )
+        send_mock = AsyncMock(side_effect=[resp])
+        with (
+            patch("paper_assistant.arxiv.httpx.AsyncClient.send", new=send_mock),
+            pytest.raises(httpx.ReadError),
+        ):
+            await download_pdf("2503.10291", output_path, config=_test_config())
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_downloads_use_separate_temp_files(self, tmp_path):
+        output_path = tmp_path / "2503.10291.pdf"
+        send_mock = AsyncMock(side_effect=[_pdf_response(200), _pdf_response(200)])
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.send", new=send_mock):
+            await asyncio.gather(
+                download_pdf("2503.10291", output_path, config=_test_config()),
+                download_pdf("2503.10291", output_path, config=_test_config()),
+            )
+
+        assert output_path.read_bytes() == b"%PDF-1.7 body"
+        assert list(tmp_path.iterdir()) == [output_path]
+
+
+def _atom_feed(*arxiv_ids: str) -> str:
+    entries = "".join(
+        f"""
+  <entry>
+    <id>http://arxiv.org/abs/{arxiv_id}v1</id>
+    <published>2025-03-13T00:00:00Z</published>
+    <title>Paper {arxiv_id}</title>
+    <summary>Abstract</summary>
+    <author><name>Alice</name></author>
+  </entry>"""
+        for arxiv_id in arxiv_ids
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f"{entries}\n</feed>\n"
+    )
+
+
+class TestFetchMetadataMany:
+    @pytest.mark.asyncio
+    async def test_uncached_ids_share_one_request_and_keep_input_order(self, tmp_path):
+        config = _test_config(data_dir=tmp_path)
+        get_mock = AsyncMock(side_effect=[_metadata_response(200)])
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            await fetch_metadata("2503.10291", config=config)
+
+        get_mock = AsyncMock(
+            side_effect=[_metadata_response(200, text=_atom_feed("2501.00002", "2501.00001"))]
+        )
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            results = await fetch_metadata_many(
+                ["2501.00001", "2503.10291", "2501.00002"], config=config
+            )
+
+        assert [m.arxiv_id for m in results] == ["2501.00001", "2503.10291", "2501.00002"]
+        assert results[1].title == "Test Paper"
+        assert get_mock.await_count == 1
+        assert get_mock.await_args.kwargs["params"]["id_list"] == "2501.00001,2501.00002"
+
+    @pytest.mark.asyncio
+    async def test_ids_are_chunked_into_batches_of_100(self, tmp_path):
+        config = _test_config(data_dir=tmp_path)
+        ids = [f"2501.{n:05d}" for n in range(150)]
+        get_mock = AsyncMock(
+            side_effect=[
+                _metadata_response(200, text=_atom_feed(*ids[:100])),
+                _metadata_response(200, text=_atom_feed(*ids[100:])),
+            ]
+        )
+        with patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock):
+            results = await fetch_metadata_many(ids, config=config)
+
+        assert [m.arxiv_id for m in results] == ids
+        assert get_mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_ids_raise_not_found(self, tmp_path):
+        config = _test_config(data_dir=tmp_path)
+        get_mock = AsyncMock(side_effect=[_metadata_response(200, text=_atom_feed("2501.00001"))])
+        with (
+            patch("paper_assistant.arxiv.httpx.AsyncClient.get", new=get_mock),
+            pytest.raises(PaperNotFoundError, match="2501.00002"),
+        ):
+            await fetch_metadata_many(["2501.00001", "2501.00002"], config=config)
+
+        assert (config.arxiv_cache_dir / "2501.00001.json").exists()
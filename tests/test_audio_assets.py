@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import ClassVar
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -453,3 +454,176 @@ async def test_skip_transcript_true_still_regenerates_audio(config, storage):
     gen_script.assert_not_awaited()
     assert result.audio_path is not None
     assert result.transcript_path is None
+
+
+@pytest.mark.asyncio
+async def test_unchanged_narration_reuses_existing_audio(config, storage):
+    paper = _paper()
+    storage.add_paper(paper)
+
+    async def render(script: str):
+        return await render_audio_assets(
+            config=config,
+            storage=storage,
+            paper=storage.get_paper("2503.10291"),
+            source_markdown="# One-Pager\nRaw body",
+            skip_transcript=False,
+            skip_audio=False,
+            provided_script_markdown=script,
+        )
+
+    with patch("paper_assistant.audio_assets.get_tts_backend") as get_backend:
+        fake = AsyncMock()
+        fake.name = "mlx"
+        fake.synthesize.side_effect = _fake_mlx_backend(config.audio_dir / "2503.10291.mp3")
+        get_backend.return_value = fake
+
+        first = await render("Narration script.")
+        again = await render("Narration script.")
+        edited = await render("Edited narration script.")
+
+    assert fake.synthesize.await_count == 2
+    assert first.backend_used == "mlx"
+    assert again.backend_used is None
+    assert again.audio_path == config.audio_dir / "2503.10291.mp3"
+    assert edited.backend_used == "mlx"
+    saved = storage.get_paper("2503.10291")
+    assert saved.status == ProcessingStatus.AUDIO_GENERATED
+    assert saved.tts_hash is not None
+
+
+class _FakeCommunicate:
+    """Stands in for edge_tts.Communicate; emits the input text as 'audio'."""
+
+    spoken: ClassVar[list[str]] = []
+
+    def __init__(self, text: str, voice: str, rate: str) -> None:
+        self.text = text
+        _FakeCommunicate.spoken.append(text)
+
+    async def stream(self):
+        yield {"type": "WordBoundary"}
+        yield {"type": "audio", "data": self.text.encode() + b"|"}
+
+    async def save(self, path: str) -> None:
+        Path(path).write_bytes(self.text.encode())
+
+
+def _edge_config(tmp_data_dir) -> Config:
+    cfg = Config(anthropic_api_key="test-key", data_dir=tmp_data_dir, icloud_sync=False)
+    cfg.ensure_dirs()
+    return cfg
+
+
+@pytest.mark.asyncio
+async def test_edge_backend_speaks_script_while_it_streams(tmp_data_dir):
+    config = _edge_config(tmp_data_dir)
+    storage = StorageManager(config)
+    paper = _paper()
+    storage.add_paper(paper)
+    paragraphs = ["Intro paragraph " + "a" * 200, "**Middle** paragraph.", "Closing words."]
+    script = "\n\n".join(paragraphs)
+
+    async def fake_stream(**kwargs):
+        for i in range(0, len(script), 16):
+            yield script[i : i + 16]
+
+    _FakeCommunicate.spoken = []
+    with (
+        patch("paper_assistant.tts.edge_tts.Communicate", new=_FakeCommunicate),
+        patch("paper_assistant.audio_script.stream_audio_script", new=fake_stream),
+        patch(
+            "paper_assistant.audio_script.generate_audio_script", new_callable=AsyncMock
+        ) as gen_script,
+    ):
+        result = await render_audio_assets(
+            config=config,
+            storage=storage,
+            paper=paper,
+            source_markdown="# One-Pager\nRaw body",
+            skip_transcript=False,
+            skip_audio=False,
+        )
+
+    gen_script.assert_not_awaited()
+    assert result.backend_used == "edge"
+    assert result.script_model == config.audio_script_model
+    assert result.transcript_path.read_text(encoding="utf-8") == script
+    assert _FakeCommunicate.spoken[0] == paragraphs[0]
+    assert "**" not in "".join(_FakeCommunicate.spoken)
+    assert result.audio_path.read_bytes() == b"".join(
+        text.encode() + b"|" for text in _FakeCommunicate.spoken
+    )
+    assert storage.get_paper("2503.10291").audio_path == "audio/2503.10291.mp3"
+
+
+@pytest.mark.asyncio
+async def test_streamed_audio_is_reused_for_the_same_script(tmp_data_dir):
+    config = _edge_config(tmp_data_dir)
+    storage = StorageManager(config)
+    storage.add_paper(_paper())
+    script = "Intro paragraph " + "a" * 200 + "\n\nClosing words."
+
+    async def fake_stream(**kwargs):
+        yield script
+
+    async def render(**kwargs):
+        return await render_audio_assets(
+            config=config,
+            storage=storage,
+            paper=storage.get_paper("2503.10291"),
+            source_markdown="# One-Pager\nRaw body",
+            skip_transcript=False,
+            skip_audio=False,
+            **kwargs,
+        )
+
+    _FakeCommunicate.spoken = []
+    with (
+        patch("paper_assistant.tts.edge_tts.Communicate", new=_FakeCommunicate),
+        patch("paper_assistant.audio_script.stream_audio_script", new=fake_stream),
+    ):
+        streamed = await render()
+        spoken = len(_FakeCommunicate.spoken)
+        again = await render(provided_script_markdown=script)
+
+    assert streamed.backend_used == "edge"
+    assert storage.get_paper("2503.10291").tts_hash is not None
+    assert again.backend_used is None
+    assert len(_FakeCommunicate.spoken) == spoken
+
+
+@pytest.mark.asyncio
+async def test_streamed_script_failure_discards_partial_audio_and_uses_raw_summary(
+    tmp_data_dir,
+):
+    from paper_assistant.audio_script import AudioScriptError
+
+    config = _edge_config(tmp_data_dir)
+    storage = StorageManager(config)
+    paper = _paper()
+    storage.add_paper(paper)
+
+    async def failing_stream(**kwargs):
+        yield "First paragraph " + "b" * 250 + "\n\nSecond"
+        raise AudioScriptError("connection dropped")
+
+    _FakeCommunicate.spoken = []
+    with (
+        patch("paper_assistant.tts.edge_tts.Communicate", new=_FakeCommunicate),
+        patch("paper_assistant.audio_script.stream_audio_script", new=failing_stream),
+    ):
+        result = await render_audio_assets(
+            config=config,
+            storage=storage,
+            paper=paper,
+            source_markdown="# One-Pager\nRaw body",
+            skip_transcript=False,
+            skip_audio=False,
+        )
+
+    assert result.transcript_path is None
+    assert any("connection dropped" in w for w in result.warnings)
+    # The published file is the raw-summary narration, not the partial stream
+    assert result.audio_path.read_bytes().startswith(b"This is a summary of the paper")
+    assert [p.name for p in config.audio_dir.iterdir()] == ["2503.10291.mp3"]
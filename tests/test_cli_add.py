@@ -1,12 +1,14 @@
 """Tests for the HF-first arXiv add pipeline."""
 
 from __future__ import annotations
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
+from click.testing import CliRunner
 import pytest
 
-from paper_assistant.cli import _add_arxiv_paper
+from paper_assistant.cli import _add_arxiv_paper, _add_papers_batch, main
 from paper_assistant.config import Config
 from paper_assistant.hf_papers import HFPaperContentRejectedError, extract_markdown_body
 from paper_assistant.models import ProcessingStatus
@@ -102,8 +104,8 @@ async def test_add_arxiv_falls_back_to_pdf_when_hf_markdown_rejected(tmp_path):
         ),
         patch("paper_assistant.arxiv.download_pdf", new=AsyncMock()) as download_pdf,
         patch(
-            "paper_assistant.pdf.extract_text_from_pdf",
-            return_value="Extracted PDF body",
+            "paper_assistant.pdf.extract_text_from_pdf_bounded",
+            return_value=("Extracted PDF body", 3, 3),
         ) as extract_text_from_pdf,
         patch(
             "paper_assistant.summarizer.summarize_paper_text",
@@ -129,3 +131,366 @@ async def test_add_arxiv_falls_back_to_pdf_when_hf_markdown_rejected(tmp_path):
     assert summarize_paper_text.await_args.args[2] == "Extracted PDF body"
     download_pdf.assert_awaited_once()
     extract_text_from_pdf.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_add_batch_bounds_concurrency_and_collects_failures(tmp_path):
+    active = 0
+    peak = 0
+
+    async def fake_add_paper(obj, url, *args, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        if url == "bad":
+            raise RuntimeError("boom")
+
+    with patch("paper_assistant.cli._add_paper", new=fake_add_paper):
+        failures = await _add_papers_batch(
+            _obj(tmp_path),
+            ["a", "bad", "c", "d"],
+            concurrency=2,
+            native_pdf=False,
+            skip_audio=True,
+        )
+
+    assert peak == 2
+    assert list(failures) == ["bad"]
+    assert str(failures["bad"]) == "boom"
+
+
+@pytest.mark.asyncio
+async def test_add_batch_feed_keeps_every_episode(tmp_path):
+    import time
+
+    from lxml import etree
+
+    from paper_assistant.fileio import write_bytes_atomic
+
+    arxiv_ids = ["2503.10291", "2601.15621", "2603.19835"]
+    metadata = {arxiv_id: load_hf_metadata_fixture(arxiv_id) for arxiv_id in arxiv_ids}
+
+    async def fake_metadata(arxiv_id, config=None):
+        return metadata[arxiv_id]
+
+    async def fake_audio(config, storage, paper_id, *args):
+        audio_path = f"audio/{paper_id}.mp3"
+        (config.data_dir / audio_path).write_bytes(b"ID3")
+        paper = storage.get_paper(paper_id)
+        paper.audio_path = audio_path
+        storage.add_paper(paper)
+
+    def slow_write(path, data):
+        # Widen the read-modify-write window so unserialized writers would collide
+        time.sleep(0.05)
+        write_bytes_atomic(path, data)
+
+    with (
+        patch("paper_assistant.hf_papers.fetch_metadata", new=fake_metadata),
+        patch(
+            "paper_assistant.hf_papers.fetch_markdown_body",
+            new=AsyncMock(return_value=_load_body_fixture("2603.19835")),
+        ),
+        patch(
+            "paper_assistant.summarizer.summarize_paper_text",
+            new=AsyncMock(return_value=_summary_result()),
+        ),
+        patch("paper_assistant.cli._generate_audio_step", new=fake_audio),
+        patch("paper_assistant.podcast.write_bytes_atomic", new=slow_write),
+    ):
+        failures = await _add_papers_batch(
+            _obj(tmp_path),
+            [f"https://arxiv.org/abs/{arxiv_id}" for arxiv_id in arxiv_ids],
+            concurrency=3,
+            native_pdf=False,
+            skip_audio=False,
+        )
+
+    assert failures == {}
+    feed = etree.parse(str(_config(tmp_path).feed_path))
+    assert sorted(feed.xpath("//item/guid/text()")) == arxiv_ids
+
+
+@pytest.mark.asyncio
+async def test_add_force_reuses_audio_for_unchanged_narration(tmp_path):
+    metadata = load_hf_metadata_fixture("2603.19835")
+    body = _load_body_fixture("2603.19835")
+
+    async def write_audio(text, output_path):
+        output_path.write_bytes(b"fake-audio")
+
+    backend = AsyncMock()
+    backend.name = "edge"
+    backend.synthesize.side_effect = write_audio
+
+    with (
+        patch("paper_assistant.hf_papers.fetch_metadata", new=AsyncMock(return_value=metadata)),
+        patch(
+            "paper_assistant.hf_papers.fetch_markdown_body",
+            new=AsyncMock(return_value=body),
+        ),
+        patch(
+            "paper_assistant.summarizer.summarize_paper_text",
+            new=AsyncMock(return_value=_summary_result()),
+        ),
+        patch("paper_assistant.audio_assets.get_tts_backend", return_value=backend),
+        patch("paper_assistant.podcast.generate_feed", new=Mock()),
+    ):
+        for force in (False, True):
+            await _add_arxiv_paper(
+                _obj(tmp_path),
+                "https://arxiv.org/abs/2603.19835",
+                native_pdf=False,
+                skip_audio=False,
+                skip_transcript=True,
+                force=force,
+            )
+
+    backend.synthesize.assert_awaited_once()
+    paper = StorageManager(_config(tmp_path)).get_paper("2603.19835")
+    assert paper.audio_path == "audio/2603.19835.mp3"
+    assert paper.tts_hash is not None
+
+
+def test_add_batch_reads_urls_from_file(tmp_path):
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text("2503.10291\n# comment\n\n2501.09898  # trailing\n2503.10291\n")
+
+    with patch("paper_assistant.cli._add_papers_batch", new=AsyncMock(return_value={})) as batch:
+        result = CliRunner().invoke(
+            main, ["add-batch", "2401.00001", "--from-file", str(url_file), "-j", "3"]
+        )
+
+    assert result.exit_code == 0, result.output
+    assert batch.await_args.args[1] == ["2401.00001", "2503.10291", "2501.09898"]
+    assert batch.await_args.args[2] == 3
+
+
+@pytest.mark.asyncio
+async def test_add_arxiv_fetches_hf_markdown_while_metadata_loads(tmp_path):
+    metadata = load_hf_metadata_fixture("2603.19835")
+    body = _load_body_fixture("2603.19835")
+    body_started = asyncio.Event()
+
+    async def fake_body(arxiv_id, config=None):
+        body_started.set()
+        return body
+
+    async def fake_metadata(arxiv_id, config=None):
+        # Resolves only if the body fetch is already in flight
+        await asyncio.wait_for(body_started.wait(), timeout=1)
+        return metadata
+
+    with (
+        patch("paper_assistant.hf_papers.fetch_metadata", new=fake_metadata),
+        patch("paper_assistant.hf_papers.fetch_markdown_body", new=fake_body),
+        patch(
+            "paper_assistant.summarizer.summarize_paper_text",
+            new=AsyncMock(return_value=_summary_result()),
+        ),
+        patch("paper_assistant.podcast.generate_feed", new=Mock()),
+    ):
+        await _add_arxiv_paper(
+            _obj(tmp_path),
+            "2603.19835",
+            native_pdf=False,
+            skip_audio=True,
+        )
+
+    paper = StorageManager(_config(tmp_path)).get_paper("2603.19835")
+    assert paper is not None
+    assert paper.status == ProcessingStatus.COMPLETE
+
+
+@pytest.mark.asyncio
+async def test_add_arxiv_cancels_body_fetch_when_metadata_fails(tmp_path):
+    finished = asyncio.Event()
+
+    async def slow_body(arxiv_id, config=None):
+        await asyncio.sleep(10)
+        finished.set()
+
+    with (
+        patch(
+            "paper_assistant.hf_papers.fetch_metadata",
+            new=AsyncMock(side_effect=RuntimeError("hf down")),
+        ),
+        patch(
+            "paper_assistant.arxiv.fetch_metadata",
+            new=AsyncMock(side_effect=RuntimeError("arxiv down")),
+        ),
+        patch("paper_assistant.hf_papers.fetch_markdown_body", new=slow_body),
+    ):
+        await _add_arxiv_paper(
+            _obj(tmp_path),
+            "2503.10291",
+            native_pdf=False,
+            skip_audio=True,
+        )
+
+    assert not finished.is_set()
+    assert not [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    assert StorageManager(_config(tmp_path)).get_paper("2503.10291") is None
+
+
+@pytest.mark.asyncio
+async def test_add_arxiv_cancels_body_fetch_when_a_later_step_raises(tmp_path):
+    metadata = load_hf_metadata_fixture("2603.19835")
+    finished = asyncio.Event()
+
+    async def slow_body(arxiv_id, config=None):
+        await asyncio.sleep(10)
+        finished.set()
+
+    with (
+        patch("paper_assistant.hf_papers.fetch_metadata", new=AsyncMock(return_value=metadata)),
+        patch("paper_assistant.hf_papers.fetch_markdown_body", new=slow_body),
+        patch.object(StorageManager, "add_paper", side_effect=OSError("disk full")),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        await _add_arxiv_paper(
+            _obj(tmp_path),
+            "2603.19835",
+            native_pdf=False,
+            skip_audio=True,
+        )
+
+    assert not finished.is_set()
+    assert not [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+
+@pytest.mark.asyncio
+async def test_copy_to_icloud_copies_audio_off_the_event_loop(tmp_path):
+    from types import SimpleNamespace
+
+    from paper_assistant.cli import _copy_to_icloud
+
+    config = Config(
+        anthropic_api_key="test-key",
+        data_dir=tmp_path / "data",
+        icloud_dir=tmp_path / "icloud",
+    )
+    audio = config.data_dir / "audio" / "paper.mp3"
+    audio.parent.mkdir(parents=True)
+    audio.write_bytes(b"ID3 audio bytes")
+    paper = SimpleNamespace(audio_path="audio/paper.mp3")
+
+    with patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+        error = await _copy_to_icloud(config, paper, "A: Title/Sub", "2503.10291", quiet=True)
+
+    assert error is None
+    to_thread.assert_called_once()
+    assert (config.icloud_dir / "A - Title-Sub [2503.10291].mp3").read_bytes() == b"ID3 audio bytes"
+
+
+def test_run_uses_uvloop_when_installed():
+    from types import SimpleNamespace
+
+    from paper_assistant.cli import _run
+
+    async def answer():
+        return 42
+
+    fake_uvloop = SimpleNamespace(run=Mock(side_effect=asyncio.run))
+    with patch.dict("sys.modules", {"uvloop": fake_uvloop}):
+        assert _run(answer()) == 42
+    fake_uvloop.run.assert_called_once()
+
+    with patch.dict("sys.modules", {"uvloop": None}):
+        assert _run(answer()) == 42
+
+
+def test_get_config_loads_once_per_context_object(tmp_path):
+    from paper_assistant.cli import _get_config
+
+    obj = _obj(tmp_path)
+    with patch("paper_assistant.config.load_config", return_value=_config(tmp_path)) as load:
+        first = _get_config(obj)
+        second = _get_config(obj)
+
+    assert first is second
+    load.assert_called_once_with(
+        anthropic_api_key="test-key", data_dir=str(tmp_path), icloud_sync=False
+    )
+
+
+def test_get_storage_shares_one_manager_per_context_object(tmp_path):
+    from paper_assistant.cli import _get_storage
+
+    obj = _obj(tmp_path)
+    storage = _get_storage(obj)
+
+    assert _get_storage(obj) is storage
+    assert storage.config is obj["_config"]
+
+
+@pytest.mark.asyncio
+async def test_icloud_copy_and_search_sync_run_concurrently(tmp_path):
+    import threading
+    from types import SimpleNamespace
+
+    from paper_assistant.cli import _publish_outputs_step
+
+    # Each side waits for the other to have started, so running the two
+    # steps one after the other would time out.
+    copy_started = threading.Event()
+    search_overlapped = []
+
+    def sync_paper(paper_id, storage):
+        search_overlapped.append(copy_started.wait(timeout=5))
+
+    async def fake_copy(*args, **kwargs):
+        copy_started.set()
+
+    config = Config(anthropic_api_key="test-key", data_dir=tmp_path, icloud_sync=True)
+    paper = SimpleNamespace(audio_path="audio/paper.mp3")
+    search_mgr = SimpleNamespace(sync_paper=sync_paper)
+
+    with (
+        patch("paper_assistant.search.get_search_manager", return_value=search_mgr),
+        patch("paper_assistant.cli._copy_to_icloud", new=fake_copy),
+    ):
+        await _publish_outputs_step(config, Mock(), paper, "Title", "2503.10291")
+
+    assert search_overlapped == [True]
+
+
+@pytest.mark.asyncio
+async def test_feed_step_runs_off_the_event_loop(tmp_path):
+    import threading
+
+    from paper_assistant.cli import _update_feed_step
+    from paper_assistant.models import Paper, PaperMetadata
+
+    loop_thread = threading.current_thread()
+    feed_threads: list[threading.Thread] = []
+
+    def fake_update(config, paper, output_path=None):
+        feed_threads.append(threading.current_thread())
+        return True
+
+    config = _config(tmp_path)
+    config.ensure_dirs()
+    storage = StorageManager(config)
+    paper = Paper(metadata=PaperMetadata(arxiv_id="2503.10291", title="T", authors=[]))
+
+    with patch("paper_assistant.podcast.update_feed_entry", new=fake_update):
+        await _update_feed_step(config, storage, paper, "5/5")
+
+    assert feed_threads and feed_threads[0] is not loop_thread
+    assert storage.get_paper("2503.10291").status == ProcessingStatus.COMPLETE
+
+
+def test_run_closes_the_pooled_client_before_the_loop_ends():
+    from paper_assistant.arxiv import shared_client
+    from paper_assistant.cli import _run
+
+    async def open_client():
+        return shared_client()
+
+    with patch.dict("sys.modules", {"uvloop": None}):
+        client = _run(open_client())
+
+    assert client.is_closed
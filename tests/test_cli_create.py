@@ -5,7 +5,8 @@ from __future__ import annotations
 import json
 import subprocess
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
 from click.testing import CliRunner
 
@@ -76,6 +77,7 @@ class TestCreateCommand:
                 new_callable=AsyncMock,
                 return_value=_make_outcome(paper_id="clip-note", title="Clip Note"),
             ) as create_local_entry,
+            patch.dict("sys.modules", {"AppKit": None}),
             patch(
                 "paper_assistant.cli.subprocess.run",
                 return_value=subprocess.CompletedProcess(
@@ -92,6 +94,33 @@ class TestCreateCommand:
         kwargs = create_local_entry.await_args.kwargs
         assert kwargs["markdown"] == "# Note\nBody from clipboard"
 
+    def test_create_from_clipboard_reads_pasteboard_in_process(self, tmp_path):
+        pasteboard = Mock()
+        pasteboard.stringForType_.return_value = "# Note\nBody from pasteboard"
+        appkit = SimpleNamespace(
+            NSPasteboard=SimpleNamespace(generalPasteboard=lambda: pasteboard),
+            NSPasteboardTypeString="public.utf8-plain-text",
+        )
+
+        with (
+            patch(
+                "paper_assistant.pipeline.create_local_entry",
+                new_callable=AsyncMock,
+                return_value=_make_outcome(paper_id="clip-note", title="Clip Note"),
+            ) as create_local_entry,
+            patch.dict("sys.modules", {"AppKit": appkit}),
+            patch("paper_assistant.cli.subprocess.run") as run,
+        ):
+            result = CliRunner().invoke(
+                main, ["create", "--title", "Clip Note"], env=_env(tmp_path)
+            )
+
+        assert result.exit_code == 0
+        run.assert_not_called()
+        pasteboard.stringForType_.assert_called_once_with("public.utf8-plain-text")
+        kwargs = create_local_entry.await_args.kwargs
+        assert kwargs["markdown"] == "# Note\nBody from pasteboard"
+
     def test_create_empty_input_exits_nonzero(self, tmp_path):
         """Empty input must not exit 0 — JSON callers would parse empty stdout."""
         runner = CliRunner()
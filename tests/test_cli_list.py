@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 from click.testing import CliRunner
+from rich.console import Console
 
 from paper_assistant.cli import main
 from paper_assistant.config import Config
@@ -122,3 +125,56 @@ class TestListJson:
         summary_path = Path(by_id["2503.10291"]["summary_path"])
         assert summary_path.is_absolute()
         assert summary_path.is_file()
+
+
+class TestListTable:
+    def test_list_pages_when_taller_than_terminal(self, tmp_path):
+        _seed_papers(tmp_path)
+        terminal = Console(file=io.StringIO(), force_terminal=True, height=1, width=120)
+
+        with (
+            patch("paper_assistant.cli.console", terminal),
+            patch.object(terminal, "pager", wraps=terminal.pager) as pager,
+            patch("rich.pager.SystemPager.show") as show,
+        ):
+            result = CliRunner().invoke(main, ["list"], env=_env(tmp_path))
+
+        assert result.exit_code == 0
+        pager.assert_called_once_with(styles=True)
+        assert "Sample Paper" in show.call_args.args[0]
+
+    def test_list_prints_directly_on_a_short_terminal(self, tmp_path):
+        _seed_papers(tmp_path)
+        terminal = Console(
+            file=io.StringIO(), force_terminal=True, height=100, width=120, highlight=False
+        )
+
+        with (
+            patch("paper_assistant.cli.console", terminal),
+            patch.object(terminal, "pager") as pager,
+        ):
+            result = CliRunner().invoke(main, ["list"], env=_env(tmp_path))
+
+        assert result.exit_code == 0
+        pager.assert_not_called()
+        output = terminal.file.getvalue()
+        assert "Sample Paper" in output
+        assert "Total: 2 papers" in output
+
+    def test_list_emits_tsv_when_not_a_terminal(self, tmp_path):
+        _seed_papers(tmp_path)
+
+        result = CliRunner().invoke(main, ["list", "--tag", "rl"], env=_env(tmp_path))
+
+        assert result.exit_code == 0
+        rows = [line.split("\t") for line in result.output.splitlines()]
+        assert len(rows) == 1
+        paper_id, title, added, status, audio, tags = rows[0]
+        assert (paper_id, title, status, audio, tags) == (
+            "2503.10291",
+            "Sample Paper",
+            "summarized",
+            "-",
+            "rl",
+        )
+        assert len(added) == len("2025-01-01")
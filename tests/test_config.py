@@ -0,0 +1,67 @@
+"""Tests for paper_assistant.config."""
+
+from __future__ import annotations
+
+from paper_assistant.config import _DERIVED_PATHS, Config
+
+
+def test_derived_paths_are_computed_once(tmp_path):
+    config = Config(data_dir=tmp_path)
+
+    assert config.papers_dir == tmp_path / "papers"
+    assert config.papers_dir is config.papers_dir
+    assert config.llm_cache_dir == tmp_path / "cache" / "llm"
+
+
+def test_derived_paths_follow_data_dir_changes(tmp_path):
+    config = Config(data_dir=tmp_path / "a")
+    assert config.index_path == tmp_path / "a" / "index.json"
+
+    config.data_dir = tmp_path / "b"
+    assert config.index_path == tmp_path / "b" / "index.json"
+
+    moved = config.model_copy(update={"data_dir": tmp_path / "c"})
+    assert moved.index_path == tmp_path / "c" / "index.json"
+    assert config.index_path == tmp_path / "b" / "index.json"
+
+
+def test_every_derived_path_follows_data_dir_changes(tmp_path):
+    config = Config(data_dir=tmp_path / "a")
+    assert {"papers_dir", "llm_cache_dir", "feed_path"} <= set(_DERIVED_PATHS)
+    for name in _DERIVED_PATHS:
+        getattr(config, name)
+
+    config.data_dir = tmp_path / "b"
+    for name in _DERIVED_PATHS:
+        assert (tmp_path / "b") in getattr(config, name).parents
+
+
+def test_cache_dir_override_applies_to_cache_paths(tmp_path):
+    config = Config(data_dir=tmp_path)
+    assert config.arxiv_cache_dir == tmp_path / "cache" / "arxiv"
+
+    config.cache_dir = tmp_path / "elsewhere"
+    assert config.arxiv_cache_dir == tmp_path / "elsewhere" / "arxiv"
+
+
+def test_ensure_dirs_creates_the_layout_once_per_data_dir(tmp_path, monkeypatch):
+    config = Config(data_dir=tmp_path / "data")
+    config.ensure_dirs()
+    assert config.papers_dir.is_dir()
+    assert config.images_dir.is_dir()
+
+    calls: list[object] = []
+    monkeypatch.setattr("pathlib.Path.mkdir", lambda *args, **kwargs: calls.append(args))
+    Config(data_dir=tmp_path / "data").ensure_dirs()
+
+    assert calls == []
+
+
+def test_ensure_dirs_recreates_directories_removed_later(tmp_path):
+    config = Config(data_dir=tmp_path / "data")
+    config.ensure_dirs()
+    config.audio_dir.rmdir()
+
+    config.ensure_dirs()
+
+    assert config.audio_dir.is_dir()
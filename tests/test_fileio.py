@@ -0,0 +1,62 @@
+"""Tests for paper_assistant.fileio."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+from pydantic import TypeAdapter
+
+from paper_assistant.fileio import _UMASK, read_json_cache, write_bytes_atomic, write_json_cache
+
+
+def test_write_bytes_atomic_replaces_file_with_umask_mode(tmp_path):
+    target = tmp_path / "index.json"
+    target.write_bytes(b"old")
+
+    write_bytes_atomic(target, b"new")
+
+    assert target.read_bytes() == b"new"
+    assert os.stat(target).st_mode & 0o777 == 0o666 & ~_UMASK
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_write_bytes_atomic_leaves_no_temp_file_on_failure(tmp_path, monkeypatch):
+    target = tmp_path / "index.json"
+    target.write_bytes(b"old")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("paper_assistant.fileio.os.replace", failing_replace)
+    with pytest.raises(OSError, match="disk full"):
+        write_bytes_atomic(target, b"new")
+
+    assert target.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+_INT_LIST = TypeAdapter(list[int])
+
+
+def test_json_cache_round_trips_within_ttl(tmp_path):
+    path = tmp_path / "cache" / "entry.json"
+
+    write_json_cache(path, [1, 2, 3], _INT_LIST)
+
+    assert read_json_cache(path, 60, _INT_LIST) == [1, 2, 3]
+    assert os.stat(path).st_mode & 0o777 == 0o666 & ~_UMASK
+
+
+def test_json_cache_treats_expired_missing_and_corrupt_entries_as_misses(tmp_path):
+    path = tmp_path / "entry.json"
+    assert read_json_cache(path, 60, _INT_LIST) is None
+
+    write_json_cache(path, [1], _INT_LIST)
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+    assert read_json_cache(path, 60, _INT_LIST) is None
+
+    path.write_text("not json", encoding="utf-8")
+    assert read_json_cache(path, 60, _INT_LIST) is None
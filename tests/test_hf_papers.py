@@ -1,11 +1,14 @@
 """Tests for Hugging Face paper-page metadata and markdown retrieval."""
 
 from __future__ import annotations
+import os
+import time
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
+from paper_assistant.config import Config
 from paper_assistant.hf_papers import (
     HFPaperContentRejectedError,
     extract_markdown_body,
@@ -121,6 +124,26 @@ async def test_fetch_metadata_uses_http_and_maps_response():
     assert get_mock.await_count == 1
 
 
+@pytest.mark.asyncio
+async def test_fetch_metadata_is_cached_on_disk_for_a_day(tmp_path):
+    config = Config(anthropic_api_key="key", data_dir=tmp_path)
+    payload = load_hf_metadata_payload("2601.15621")
+    get_mock = AsyncMock(
+        return_value=_json_response("https://huggingface.co/api/papers/2601.15621", payload)
+    )
+
+    with patch("paper_assistant.hf_papers.httpx.AsyncClient.get", new=get_mock):
+        first = await fetch_metadata("2601.15621", config=config)
+        second = await fetch_metadata("2601.15621", config=config)
+        cache_file = config.hf_cache_dir / "2601.15621.json"
+        stale = time.time() - 2 * 86400
+        os.utime(cache_file, (stale, stale))
+        third = await fetch_metadata("2601.15621", config=config)
+
+    assert first == second == third
+    assert get_mock.await_count == 2
+
+
 @pytest.mark.asyncio
 async def test_fetch_markdown_body_uses_http_and_validates_response():
     markdown = load_hf_markdown_fixture("2603.19835")
@@ -134,3 +157,24 @@ async def test_fetch_markdown_body_uses_http_and_validates_response():
     assert body.startswith("\\useunder")
     assert "Future-KL Influenced Policy Optimization" in body
     assert get_mock.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_metadata_and_body_fetches_share_one_pooled_client():
+    markdown = load_hf_markdown_fixture("2603.19835")
+    payload = load_hf_metadata_payload("2603.19835")
+    clients: list[httpx.AsyncClient] = []
+
+    async def fake_get(self, url, **kwargs):
+        clients.append(self)
+        if url.endswith(".md"):
+            return _text_response(url, markdown)
+        return _json_response(url, payload)
+
+    with patch("paper_assistant.hf_papers.httpx.AsyncClient.get", new=fake_get):
+        await fetch_metadata("2603.19835")
+        await fetch_markdown_body("2603.19835")
+
+    assert len(clients) == 2
+    assert clients[0] is clients[1]
+    assert not clients[0].is_closed
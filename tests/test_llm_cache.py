@@ -0,0 +1,136 @@
+"""Tests for paper_assistant.llm_cache and its use by the summarizer."""
+
+from __future__ import annotations
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from paper_assistant import llm_cache
+from paper_assistant.config import Config
+from paper_assistant.models import PaperMetadata
+from paper_assistant.summarizer import (
+    SummarizationResult,
+    summarize_paper_pdf,
+    summarize_paper_text,
+)
+
+
+def _config(tmp_path, **overrides) -> Config:
+    return Config(anthropic_api_key="key", data_dir=tmp_path, **overrides)
+
+
+def _result() -> SummarizationResult:
+    return SummarizationResult(
+        full_markdown="## One-Pager\nBody",
+        one_pager="Body",
+        sections={"One-Pager": "Body"},
+        model_used="claude-test",
+        input_tokens=10,
+        output_tokens=5,
+    )
+
+
+def _fake_client(text: str = "## One-Pager\nBody") -> MagicMock:
+    client = MagicMock()
+    client.messages.create = AsyncMock(
+        return_value=SimpleNamespace(
+            content=[SimpleNamespace(text=text)],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        )
+    )
+    return client
+
+
+METADATA = PaperMetadata(arxiv_id="2503.10291", title="T", authors=["A"], abstract="")
+
+
+class TestLlmCacheStore:
+    def test_round_trip(self, tmp_path):
+        config = _config(tmp_path)
+        key = llm_cache.prompt_hash("model", "system", "content")
+
+        llm_cache.put(config, key, _result())
+
+        assert llm_cache.get(config, key) == _result()
+        assert (config.llm_cache_dir / f"{key}.json").is_file()
+
+    def test_prompt_hash_separates_parts(self):
+        assert llm_cache.prompt_hash("ab", "c") != llm_cache.prompt_hash("a", "bc")
+
+    def test_expired_entry_is_ignored(self, tmp_path):
+        config = _config(tmp_path, llm_cache_ttl_days=1)
+        key = llm_cache.prompt_hash("k")
+        llm_cache.put(config, key, _result())
+        stale = time.time() - 2 * 86400
+        os.utime(config.llm_cache_dir / f"{key}.json", (stale, stale))
+
+        assert llm_cache.get(config, key) is None
+
+    def test_zero_ttl_disables_cache(self, tmp_path):
+        config = _config(tmp_path, llm_cache_ttl_days=0)
+        key = llm_cache.prompt_hash("k")
+        llm_cache.put(config, key, _result())
+
+        assert llm_cache.get(config, key) is None
+        assert not config.llm_cache_dir.exists()
+
+    def test_clear_removes_entries(self, tmp_path):
+        config = _config(tmp_path)
+        for part in ("a", "b"):
+            llm_cache.put(config, llm_cache.prompt_hash(part), _result())
+
+        assert llm_cache.clear(config) == 2
+        assert llm_cache.get(config, llm_cache.prompt_hash("a")) is None
+
+
+class TestSummarizerUsesCache:
+    @pytest.mark.asyncio
+    async def test_identical_request_is_served_from_cache(self, tmp_path):
+        config = _config(tmp_path)
+        client = _fake_client()
+
+        with patch("paper_assistant.summarizer.anthropic.AsyncAnthropic", return_value=client):
+            first = await summarize_paper_text(config, METADATA, "paper body")
+            second = await summarize_paper_text(config, METADATA, "paper body")
+            changed = await summarize_paper_text(config, METADATA, "edited body")
+
+        assert client.messages.create.await_count == 2
+        assert not first.from_cache
+        assert second.from_cache
+        assert second.full_markdown == first.full_markdown
+        assert not changed.from_cache
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_always_calls_claude(self, tmp_path):
+        config = _config(tmp_path)
+        client = _fake_client()
+
+        with patch("paper_assistant.summarizer.anthropic.AsyncAnthropic", return_value=client):
+            await summarize_paper_text(config, METADATA, "paper body")
+            result = await summarize_paper_text(
+                config, METADATA, "paper body", use_cache=False
+            )
+
+        assert client.messages.create.await_count == 2
+        assert not result.from_cache
+
+    @pytest.mark.asyncio
+    async def test_unchanged_pdf_is_served_from_cache(self, tmp_path):
+        config = _config(tmp_path)
+        client = _fake_client()
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.7 original")
+
+        with patch("paper_assistant.summarizer.anthropic.AsyncAnthropic", return_value=client):
+            await summarize_paper_pdf(config, METADATA, pdf_path)
+            again = await summarize_paper_pdf(config, METADATA, pdf_path)
+            pdf_path.write_bytes(b"%PDF-1.7 revised")
+            revised = await summarize_paper_pdf(config, METADATA, pdf_path)
+
+        assert client.messages.create.await_count == 2
+        assert again.from_cache
+        assert not revised.from_cache
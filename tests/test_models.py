@@ -2,6 +2,9 @@
 
 from datetime import datetime, timezone
 
+import pytest
+from pydantic import ValidationError
+
 from paper_assistant.models import (
     Paper,
     PaperIndex,
@@ -52,6 +55,9 @@ class TestSanitizeFilename:
     def test_whitespace_collapsed(self):
         assert sanitize_filename("A   B") == "A B"
 
+    def test_non_ascii_title_matches_ascii_rules(self):
+        assert sanitize_filename('Über: "Modelle" a/b') == "Über - Modelle ab"
+
 
 class TestPaperMetadata:
     def test_roundtrip(self):
@@ -70,6 +76,20 @@ class TestPaperMetadata:
         assert meta.paper_id == "local-note"
         assert meta.source_label == "note"
 
+    def test_paper_id_follows_model_copy_updates(self):
+        meta = _make_metadata()
+        assert meta.paper_id == "2503.10291"
+
+        copy = meta.model_copy(update={"arxiv_id": "2501.00001"})
+
+        assert copy.paper_id == "2501.00001"
+        assert "paper_id" not in meta.model_dump()
+
+    def test_is_frozen(self):
+        meta = _make_metadata()
+        with pytest.raises(ValidationError):
+            meta.title = "Changed"
+
 
 class TestPaper:
     def test_defaults(self):
@@ -92,6 +112,17 @@ class TestPaper:
         paper = Paper(metadata=meta)
         assert ":" not in paper.safe_title
 
+    def test_display_fields(self):
+        short = Paper(
+            metadata=_make_metadata(title="Short"),
+            date_added=datetime(2025, 3, 13, 23, 59, tzinfo=timezone.utc),
+        )
+        long = Paper(metadata=_make_metadata(title="x" * 51))
+        assert short.display_title == "Short"
+        assert short.date_added_label == "2025-03-13"
+        assert long.display_title == "x" * 50 + "..."
+        assert "display_title" not in long.model_dump()
+
     def test_tags(self):
         meta = _make_metadata()
         paper = Paper(metadata=meta, tags=["rl", "multimodal"])
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import copy
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -107,7 +108,7 @@ class FakeNotionClient:
     async def _ensure_property_keys(self) -> dict[str, str]:
         return self._property_keys
 
-    async def list_papers(self) -> list[NotionPaper]:
+    async def list_papers(self, *, known_edit_times=None) -> list[NotionPaper]:
         return list(self.remote_papers)
 
     async def create_page(
@@ -672,6 +673,15 @@ def _rich_text(block):
 
 
 class TestMarkdownToBlocks:
+    def test_repeat_conversion_returns_independent_blocks(self):
+        first = _markdown_to_blocks("Hello **bold** text")
+        first[0]["paragraph"]["rich_text"].clear()
+
+        second = _markdown_to_blocks("Hello **bold** text")
+
+        assert second[0]["paragraph"]["rich_text"]
+        assert second is not first
+
     def test_bold_annotation(self):
         blocks = _markdown_to_blocks("Hello **bold** text")
         rt = _rich_text(blocks[0])
@@ -1709,6 +1719,64 @@ async def test_list_papers_queries_data_source_endpoint():
     assert not any(p.endswith("/databases/db/query") for _, p in client.calls)
 
 
+class _PagedQueryStub(NotionClient):
+    """NotionClient serving two query pages and recording query cursors."""
+
+    def __init__(self) -> None:
+        super().__init__("token", "db")
+        self.cursors: list[str | None] = []
+        self._property_keys = {}
+        self._data_source_id = "ds-xyz"
+
+    async def _request(
+        self, method, path, *, json_payload=None, params=None, timeout=60.0
+    ):
+        cursor = json_payload.get("start_cursor")
+        self.cursors.append(cursor)
+        if cursor is None:
+            return {
+                "results": [
+                    {"object": "page", "id": "p1", "last_edited_time": "2025-01-02T03:04:00.000Z"},
+                    {"object": "page", "id": "p2", "last_edited_time": "2025-01-02T03:04:00.000Z"},
+                ],
+                "has_more": True,
+                "next_cursor": "c2",
+            }
+        return {"results": [{"object": "page", "id": "p3"}], "has_more": False}
+
+    async def fetch_page_markdown(self, page_id: str) -> str:
+        return f"body {page_id}"
+
+    def _parse_page(self, page, summary_markdown):
+        return (page["id"], summary_markdown)
+
+
+@pytest.mark.asyncio
+async def test_iter_papers_streams_one_query_page_at_a_time():
+    client = _PagedQueryStub()
+    records = client.iter_papers()
+
+    assert await anext(records) == ("p1", "body p1")
+    assert client.cursors == [None]
+
+    rest = [record async for record in records]
+
+    assert rest == [("p2", "body p2"), ("p3", "body p3")]
+    assert client.cursors == [None, "c2"]
+
+
+@pytest.mark.asyncio
+async def test_iter_papers_skips_bodies_of_pages_unchanged_since_last_sync():
+    client = _PagedQueryStub()
+    seen = datetime(2025, 1, 2, 3, 4, tzinfo=timezone.utc)
+
+    records = await client.list_papers(
+        known_edit_times={"p1": seen, "p2": seen - timedelta(minutes=1)}
+    )
+
+    assert records == [("p1", ""), ("p2", "body p2"), ("p3", "body p3")]
+
+
 @pytest.mark.asyncio
 async def test_create_page_parent_uses_data_source_id():
     client = RecordingNotionWriteClient()
@@ -2033,3 +2101,102 @@ async def test_replace_page_body_archives_blocks_with_write_timeout():
     by_path = {(method, path): timeout for method, path, timeout in client.calls}
     assert by_path[("GET", "/blocks/page-1/children")] == 60.0
     assert by_path[("PATCH", "/blocks/old-block-1")] == _NOTION_WRITE_TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_pooled_http_client():
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    async with NotionClient("token", "db") as client:
+        pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client._client = pooled
+        await client._request("GET", "/pages/a")
+        await client._request("GET", "/pages/b")
+        assert client._get_client() is pooled
+
+    assert seen == ["/v1/pages/a", "/v1/pages/b"]
+    assert pooled.is_closed
+    assert client._client is None
+
+
+@pytest.mark.asyncio
+async def test_request_retries_after_rate_limit():
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0.01"}),
+        httpx.Response(200, json={"ok": True}),
+    ]
+    client = NotionClient("token", "db")
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: responses.pop(0))
+    )
+
+    async with client:
+        assert await client._request("GET", "/pages/a") == {"ok": True}
+
+    assert responses == []
+
+
+class _BlockTreeStub(NotionClient):
+    """NotionClient serving a fixed block tree and tracking in-flight fetches."""
+
+    def __init__(self, tree: dict[str, list[dict[str, object]]]) -> None:
+        super().__init__("token", "db")
+        self.tree = tree
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _fetch_blocks(self, parent_id: str) -> list[dict[str, object]]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return copy.deepcopy(self.tree[parent_id])
+
+
+def _list_item(block_id: str, *, has_children: bool) -> dict[str, object]:
+    return {
+        "id": block_id,
+        "type": "bulleted_list_item",
+        "has_children": has_children,
+        "bulleted_list_item": {"rich_text": []},
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_blocks_recursive_fetches_sibling_subtrees_concurrently():
+    client = _BlockTreeStub(
+        {
+            "page": [_list_item("a", has_children=True), _list_item("b", has_children=True)],
+            "a": [_list_item("a1", has_children=False)],
+            "b": [_list_item("b1", has_children=False)],
+        }
+    )
+
+    blocks = await client._fetch_blocks_recursive("page")
+
+    children = [
+        [child["id"] for child in block["bulleted_list_item"]["children"]] for block in blocks
+    ]
+    assert children == [["a1"], ["b1"]]
+    assert client.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_request_sends_compact_utf8_json_body():
+    bodies: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        assert request.headers["Content-Type"] == "application/json"
+        return httpx.Response(200, json={})
+
+    client = NotionClient("token", "db")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        await client._request("PATCH", "/pages/a", json_payload={"title": "Über", "n": [1, 2]})
+
+    assert bodies == ['{"title":"Über","n":[1,2]}'.encode()]
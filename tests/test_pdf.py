@@ -0,0 +1,56 @@
+"""Tests for paper_assistant.pdf."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pymupdf
+
+from paper_assistant import pdf
+from paper_assistant.pdf import extract_text_from_pdf_bounded
+
+
+def _write_pdf(path: Path, pages: int) -> Path:
+    doc = pymupdf.open()
+    for pno in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page marker {pno} " + "filler text " * 8)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_bounded_extraction_stops_after_the_page_that_reaches_the_budget(tmp_path):
+    pdf_path = _write_pdf(tmp_path / "paper.pdf", pages=6)
+    with pymupdf.open(str(pdf_path)) as doc:
+        first_two = len(doc[0].get_text()) + len(doc[1].get_text())
+
+    markdown, pages_used, page_count = extract_text_from_pdf_bounded(
+        pdf_path, max_chars=first_two - 1
+    )
+
+    assert (pages_used, page_count) == (2, 6)
+    assert "Page marker 1" in markdown
+    assert "Page marker 2" not in markdown
+
+
+def test_bounded_extraction_without_budget_reads_up_to_max_pages(tmp_path):
+    pdf_path = _write_pdf(tmp_path / "paper.pdf", pages=4)
+
+    markdown, pages_used, page_count = extract_text_from_pdf_bounded(
+        pdf_path, max_chars=0, max_pages=3
+    )
+
+    assert (pages_used, page_count) == (3, 4)
+    assert "Page marker 2" in markdown
+    assert "Page marker 3" not in markdown
+
+
+def test_parallel_conversion_matches_single_pass(tmp_path, monkeypatch):
+    pdf_path = _write_pdf(tmp_path / "paper.pdf", pages=6)
+    pages = list(range(6))
+    single = pdf._pages_to_markdown(str(pdf_path), pages)
+    monkeypatch.setattr(pdf, "PAGES_PER_WORKER", 2)
+    monkeypatch.setattr(pdf.os, "cpu_count", lambda: 3)
+
+    assert pdf._to_markdown(pdf_path, pages) == single
@@ -103,3 +103,28 @@ async def test_create_slug_dedupe_with_script_params(config, storage):
     assert second.paper.metadata.paper_id == "survey-note-2"
     transcript_path = config.data_dir / second.paper.transcript_path
     assert transcript_path.read_text(encoding="utf-8") == "Second narration."
+
+
+@pytest.mark.asyncio
+async def test_create_writes_index_once(config, storage):
+    real_commit = StorageManager._commit
+    with (
+        patch("paper_assistant.audio_assets.get_tts_backend") as get_backend,
+        patch("paper_assistant.podcast.generate_feed", new=Mock()),
+        patch.object(StorageManager, "_commit", autospec=True, side_effect=real_commit) as commit,
+    ):
+        get_backend.return_value = _fake_backend(config)
+
+        outcome = await create_local_entry(
+            config=config,
+            storage=storage,
+            title="Survey Note",
+            markdown="# One-Pager\nSynthesis body",
+            provided_script_markdown="Curated synthesis narration.",
+            skip_script_generation=True,
+        )
+
+    assert commit.call_count == 1
+    saved = StorageManager(config).get_paper(outcome.paper.metadata.paper_id)
+    assert saved is not None
+    assert saved.audio_path is not None
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from paper_assistant import podcast
 from paper_assistant.config import Config
+from paper_assistant.fileio import _UMASK
 from paper_assistant.models import Paper, PaperMetadata, ProcessingStatus, SourceType
-from paper_assistant.podcast import generate_feed
+from paper_assistant.podcast import generate_feed, update_feed_entry, update_or_generate_feed
 
 
 def test_generate_feed_uses_local_detail_page_when_no_external_url(tmp_path):
@@ -29,3 +37,111 @@ def test_generate_feed_uses_local_detail_page_when_no_external_url(tmp_path):
     feed = generate_feed(config, [paper])
 
     assert "http://127.0.0.1:8877/paper/local-note" in feed
+
+
+def _audio_paper(config: Config, slug: str, day: int, title: str | None = None) -> Paper:
+    (config.audio_dir / f"{slug}.mp3").write_bytes(b"audio-" + slug.encode())
+    return Paper(
+        metadata=PaperMetadata(
+            source_type=SourceType.NOTE,
+            source_slug=slug,
+            title=title or slug.title(),
+        ),
+        status=ProcessingStatus.COMPLETE,
+        audio_path=f"audio/{slug}.mp3",
+        date_added=datetime(2026, 1, day, tzinfo=timezone.utc),
+    )
+
+
+def _without_build_date(xml: bytes) -> bytes:
+    return re.sub(rb"<lastBuildDate>[^<]*</lastBuildDate>", b"", xml)
+
+
+def test_update_feed_entry_matches_full_regeneration(tmp_path):
+    config = Config(anthropic_api_key="test-key", data_dir=tmp_path, icloud_sync=False)
+    config.ensure_dirs()
+    first = _audio_paper(config, "first", 1)
+    middle = _audio_paper(config, "middle", 2)
+    last = _audio_paper(config, "last", 3)
+
+    # Newest-first, like StorageManager.list_papers()
+    generate_feed(config, [last, first])
+    assert update_feed_entry(config, middle)
+    incremental = config.feed_path.read_bytes()
+
+    generate_feed(config, [last, middle, first])
+    assert _without_build_date(incremental) == _without_build_date(config.feed_path.read_bytes())
+
+
+def test_update_feed_entry_replaces_and_removes_existing_items(tmp_path):
+    config = Config(anthropic_api_key="test-key", data_dir=tmp_path, icloud_sync=False)
+    config.ensure_dirs()
+    keep = _audio_paper(config, "keep", 1)
+    change = _audio_paper(config, "change", 2)
+    generate_feed(config, [change, keep])
+
+    assert update_feed_entry(config, _audio_paper(config, "change", 2, title="Renamed"))
+    feed = config.feed_path.read_text(encoding="utf-8")
+    assert feed.count("<guid") == 2
+    assert "Renamed" in feed
+
+    keep.audio_path = None
+    assert update_feed_entry(config, keep)
+    feed = config.feed_path.read_text(encoding="utf-8")
+    assert feed.count("<guid") == 1
+    assert ">keep<" not in feed
+
+
+def test_update_feed_entry_reports_missing_feed(tmp_path):
+    config = Config(anthropic_api_key="test-key", data_dir=tmp_path, icloud_sync=False)
+    config.ensure_dirs()
+
+    assert not update_feed_entry(config, _audio_paper(config, "solo", 1))
+    assert not config.feed_path.exists()
+
+
+def test_concurrent_feed_updates_keep_every_episode(tmp_path, monkeypatch):
+    config = Config(anthropic_api_key="test-key", data_dir=tmp_path, icloud_sync=False)
+    config.ensure_dirs()
+    papers = [_audio_paper(config, f"paper-{n}", n) for n in range(1, 4)]
+
+    real_write = podcast.write_bytes_atomic
+
+    def slow_write(path, data):
+        time.sleep(0.05)
+        real_write(path, data)
+
+    monkeypatch.setattr("paper_assistant.podcast.write_bytes_atomic", slow_write)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(
+            pool.map(
+                lambda paper: update_or_generate_feed(config, paper, lambda: [paper]),
+                papers,
+            )
+        )
+
+    assert config.feed_path.read_text(encoding="utf-8").count("<guid") == 3
+
+
+def test_generate_feed_returns_the_written_xml_and_tolerates_missing_audio(tmp_path):
+    config = Config(anthropic_api_key="test-key", data_dir=tmp_path, icloud_sync=False)
+    config.ensure_dirs()
+    present = _audio_paper(config, "present", 1)
+    missing = _audio_paper(config, "missing", 2)
+    (config.audio_dir / "missing.mp3").unlink()
+
+    feed = generate_feed(config, [missing, present])
+
+    assert config.feed_path.read_text(encoding="utf-8") == feed
+    assert 'length="0"' in feed
+    assert f'length="{len(b"audio-present")}"' in feed
+    assert not list(config.feed_path.parent.glob(".feed.*"))
+
+
+def test_generate_feed_writes_umask_permissions(tmp_path):
+    config = Config(anthropic_api_key="test-key", data_dir=tmp_path, icloud_sync=False)
+    config.ensure_dirs()
+
+    generate_feed(config, [])
+
+    assert os.stat(config.feed_path).st_mode & 0o777 == 0o666 & ~_UMASK
@@ -0,0 +1,103 @@
+"""Tests for paper_assistant.ratelimit pacing and retry delays."""
+
+import random
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from paper_assistant.ratelimit import (
+    AsyncTokenBucket,
+    compute_backoff_delay,
+    parse_retry_after_seconds,
+)
+
+
+class TestRetryAfterParsing:
+    NOW = datetime(2026, 2, 14, 10, 0, 0, tzinfo=timezone.utc)
+
+    def test_delta_seconds(self):
+        assert parse_retry_after_seconds("7") == 7.0
+
+    def test_epoch_seconds(self):
+        epoch = str(int(self.NOW.timestamp()) + 20)
+        with patch("paper_assistant.ratelimit._utc_now", return_value=self.NOW):
+            assert parse_retry_after_seconds(epoch) == 20.0
+
+    def test_http_date_without_timezone_is_treated_as_utc(self):
+        with patch("paper_assistant.ratelimit._utc_now", return_value=self.NOW):
+            assert parse_retry_after_seconds("Sat, 14 Feb 2026 10:00:30") == 30.0
+
+    def test_past_values_clamp_to_zero(self):
+        epoch = str(int(self.NOW.timestamp()) - 20)
+        with patch("paper_assistant.ratelimit._utc_now", return_value=self.NOW):
+            assert parse_retry_after_seconds(epoch) == 0.0
+
+    def test_garbage_returns_none(self):
+        assert parse_retry_after_seconds("soon") is None
+
+
+class TestBackoffDelay:
+    def test_matches_uniform_jitter_for_the_same_random_stream(self):
+        rng = random.Random(1234)
+        expected = []
+        for attempt in range(12):
+            exp = min(30.0, 0.5 * (2**attempt))
+            expected.append(max(0.0, min(30.0, exp * rng.uniform(0.8, 1.2))))
+
+        with patch("paper_assistant.ratelimit.random.random", new=random.Random(1234).random):
+            actual = [compute_backoff_delay(attempt, 0.5, 30.0) for attempt in range(12)]
+
+        assert actual == pytest.approx(expected)
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_proceeds_immediately_then_paces(self):
+        bucket = AsyncTokenBucket(rate=0.5, burst=2)
+        sleep_mock = AsyncMock()
+        with (
+            patch("paper_assistant.ratelimit.asyncio.sleep", new=sleep_mock),
+            patch("paper_assistant.ratelimit.time.monotonic", return_value=100.0),
+        ):
+            bucket._updated = 100.0
+            await bucket.acquire()
+            await bucket.acquire()
+            assert sleep_mock.await_count == 0
+
+            await bucket.acquire()
+            await bucket.acquire()
+
+        assert [call.args[0] for call in sleep_mock.await_args_list] == [2.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_tokens_refill_over_time_up_to_burst(self):
+        bucket = AsyncTokenBucket(rate=1.0, burst=2)
+        sleep_mock = AsyncMock()
+        with (
+            patch("paper_assistant.ratelimit.asyncio.sleep", new=sleep_mock),
+            patch("paper_assistant.ratelimit.time.monotonic", side_effect=[10.0, 10.0, 60.0, 60.0, 60.0]),
+        ):
+            bucket._updated = 10.0
+            await bucket.acquire()
+            await bucket.acquire()
+            await bucket.acquire()
+            await bucket.acquire()
+            await bucket.acquire()
+
+        assert [call.args[0] for call in sleep_mock.await_args_list] == [1.0]
+
+    @pytest.mark.asyncio
+    async def test_defer_holds_back_every_caller(self):
+        bucket = AsyncTokenBucket(rate=1.0, burst=2)
+        sleep_mock = AsyncMock()
+        with (
+            patch("paper_assistant.ratelimit.asyncio.sleep", new=sleep_mock),
+            patch("paper_assistant.ratelimit.time.monotonic", return_value=100.0),
+        ):
+            bucket._updated = 100.0
+            bucket.defer(5.0)
+            await bucket.acquire()
+            await bucket.acquire()
+
+        assert [call.args[0] for call in sleep_mock.await_args_list] == [5.0, 6.0]
@@ -530,6 +530,37 @@ async def test_force_merge_audio_replace(config, storage):
     assert paper.audio_path == f"audio/{metadata.paper_id}.mp3"
 
 
+@pytest.mark.asyncio
+async def test_force_import_reuses_audio_for_unchanged_narration(config, storage):
+    metadata = _metadata()
+
+    with (
+        patch("paper_assistant.pipeline.fetch_hf_metadata", new=AsyncMock(return_value=metadata)),
+        patch("paper_assistant.pipeline.generate_feed", new=Mock()),
+        patch("paper_assistant.audio_assets.get_tts_backend") as get_backend,
+    ):
+        fake = AsyncMock()
+        fake.name = "edge"
+        fake.synthesize.side_effect = _write_audio
+        get_backend.return_value = fake
+
+        for force in (False, True):
+            result = await import_paper_summary(
+                config=config,
+                storage=storage,
+                url=metadata.arxiv_url or metadata.paper_id,
+                markdown="# One-Pager\nSame body",
+                model="claude-code",
+                force=force,
+                provided_script_markdown="Same narration.",
+            )
+
+    fake.synthesize.assert_awaited_once()
+    assert result.backend_used is None
+    assert result.audio_path == config.audio_dir / f"{metadata.paper_id}.mp3"
+    assert storage.get_paper(metadata.paper_id).tts_hash is not None
+
+
 @pytest.mark.asyncio
 async def test_force_import_with_script_file_and_no_fallback_skips_api_generation(config, storage):
     metadata = _metadata()
@@ -1,15 +1,27 @@
 """Tests for paper_assistant.storage."""
 
+import asyncio
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
 from paper_assistant.config import Config
-from paper_assistant.models import Paper, PaperMetadata, ProcessingStatus, ReadingStatus, SourceType
+from paper_assistant.fileio import _UMASK
+from paper_assistant.models import (
+    Paper,
+    PaperIndex,
+    PaperMetadata,
+    ProcessingStatus,
+    ReadingStatus,
+    SourceType,
+)
 from paper_assistant.storage import (
     StorageManager,
+    copy_file,
     make_audio_filename,
+    make_icloud_audio_filename,
     make_pdf_filename,
     make_summary_filename,
 )
@@ -53,6 +65,10 @@ class TestFilenaming:
     def test_pdf_filename(self):
         assert make_pdf_filename("2503.10291") == "2503.10291.pdf"
 
+    def test_icloud_audio_filename(self):
+        result = make_icloud_audio_filename("2503.10291", 'A/B: "Why?" C|D*')
+        assert result == "A-B - 'Why' C-D [2503.10291].mp3"
+
 
 class TestStorageManager:
     @pytest.fixture
@@ -232,6 +248,18 @@ class TestStorageManager:
         assert paper.summary_path is not None
         assert paper.status == ProcessingStatus.SUMMARIZED
 
+    def test_save_summary_updates_callers_paper_in_place(self, storage, sample_paper):
+        storage.add_paper(sample_paper)
+        sample_paper.model_used = "claude-test"
+
+        storage.save_summary("2503.10291", "# Summary", paper=sample_paper)
+
+        assert sample_paper.summary_path is not None
+        assert sample_paper.status == ProcessingStatus.SUMMARIZED
+        stored = StorageManager(storage.config).get_paper("2503.10291")
+        assert stored.summary_path == sample_paper.summary_path
+        assert stored.model_used == "claude-test"
+
     def test_save_summary_nonexistent_paper(self, storage):
         with pytest.raises(KeyError):
             storage.save_summary("9999.99999", "content")
@@ -278,6 +306,16 @@ class TestStorageManager:
         assert paper is not None
         assert paper.tags == ["test"]
 
+    def test_index_omits_unset_optional_fields(self, storage, sample_paper, tmp_path):
+        storage.add_paper(sample_paper)
+
+        raw = storage.config.index_path.read_text()
+        assert "null" not in raw
+        assert '"audio_path"' not in raw
+
+        paper = StorageManager(_make_config(tmp_path)).get_paper("2503.10291")
+        assert paper == sample_paper
+
     def test_list_papers_sort_by_title(self, storage):
         p1 = Paper(metadata=_make_metadata(arxiv_id="2501.00001", title="Zebra"))
         p2 = Paper(metadata=_make_metadata(arxiv_id="2501.00002", title="Apple"))
@@ -504,3 +542,199 @@ class TestNoteStorage:
         path = storage.save_summary("local-reading-note", "# Note\nBody")
 
         assert path.name.startswith("[Note][local-reading-note]")
+
+
+class TestStorageTransaction:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        config = _make_config(tmp_path)
+        config.ensure_dirs()
+        return StorageManager(config)
+
+    def test_writes_are_coalesced_until_exit(self, storage, monkeypatch):
+        writes = []
+        real_replace = os.replace
+        monkeypatch.setattr(
+            "paper_assistant.fileio.os.replace",
+            lambda src, dst: writes.append(dst) or real_replace(src, dst),
+        )
+
+        with storage.transaction():
+            paper = Paper(metadata=_make_metadata())
+            storage.add_paper(paper)
+            paper.status = ProcessingStatus.FETCHED
+            storage.add_paper(paper)
+            storage.save_summary("2503.10291", "# Summary")
+            assert storage.get_paper("2503.10291").status == ProcessingStatus.SUMMARIZED
+            assert writes == []
+
+        assert len(writes) == 1
+        reloaded = StorageManager(storage.config).get_paper("2503.10291")
+        assert reloaded.status == ProcessingStatus.SUMMARIZED
+
+    def test_commit_keeps_papers_written_by_other_managers(self, storage):
+        storage.add_paper(Paper(metadata=_make_metadata(), tags=["old"]))
+        other = StorageManager(storage.config)
+
+        with storage.transaction():
+            storage.add_paper(Paper(metadata=_make_metadata(arxiv_id="2501.00001")))
+            other.add_paper(Paper(metadata=_make_metadata(arxiv_id="2501.00002")))
+            other.add_tags("2503.10291", ["new"])
+
+        reloaded = StorageManager(storage.config)
+        assert {p.metadata.paper_id for p in reloaded.list_papers()} == {
+            "2503.10291",
+            "2501.00001",
+            "2501.00002",
+        }
+        assert reloaded.get_paper("2503.10291").tags == ["old", "new"]
+
+    def test_commit_applies_deletes(self, storage):
+        storage.add_paper(Paper(metadata=_make_metadata()))
+
+        with storage.transaction():
+            storage.delete_paper("2503.10291", delete_files=False)
+
+        assert StorageManager(storage.config).get_paper("2503.10291") is None
+
+    def test_error_state_is_written_when_block_raises(self, storage):
+        with pytest.raises(RuntimeError), storage.transaction():
+            paper = Paper(metadata=_make_metadata())
+            storage.add_paper(paper)
+            paper.status = ProcessingStatus.ERROR
+            storage.add_paper(paper)
+            raise RuntimeError("boom")
+
+        reloaded = StorageManager(storage.config).get_paper("2503.10291")
+        assert reloaded.status == ProcessingStatus.ERROR
+
+    def test_transaction_from_another_task_is_rejected(self, storage):
+        async def main():
+            entered = asyncio.Event()
+            release = asyncio.Event()
+
+            async def holder():
+                with storage.transaction():
+                    storage.add_paper(Paper(metadata=_make_metadata()))
+                    entered.set()
+                    await release.wait()
+
+            task = asyncio.create_task(holder())
+            await entered.wait()
+            with pytest.raises(RuntimeError), storage.transaction():
+                pass
+            release.set()
+            await task
+
+        asyncio.run(main())
+
+        assert storage._batch_depth == 0
+        storage.add_paper(Paper(metadata=_make_metadata(arxiv_id="2501.00001")))
+        reloaded = StorageManager(storage.config)
+        assert reloaded.paper_exists("2503.10291")
+        assert reloaded.paper_exists("2501.00001")
+
+    def test_index_file_gets_umask_permissions(self, storage):
+        storage.add_paper(Paper(metadata=_make_metadata()))
+
+        assert os.stat(storage.config.index_path).st_mode & 0o777 == 0o666 & ~_UMASK
+
+
+class TestPaperExists:
+    @pytest.fixture
+    def storage(self, tmp_path):
+        config = _make_config(tmp_path)
+        config.ensure_dirs()
+        return StorageManager(config)
+
+    def test_repeated_checks_skip_reparsing_unchanged_index(self, storage, monkeypatch):
+        storage.add_paper(Paper(metadata=_make_metadata()))
+        assert storage.paper_exists("2503.10291")
+
+        monkeypatch.setattr(
+            "paper_assistant.storage.json.loads",
+            lambda *_: pytest.fail("index re-parsed although unchanged"),
+        )
+        assert storage.paper_exists("2503.10291")
+        assert not storage.paper_exists("2501.00001")
+
+    def test_sees_papers_added_by_another_manager(self, storage):
+        assert not storage.paper_exists("2501.00001")
+
+        StorageManager(storage.config).add_paper(
+            Paper(metadata=_make_metadata(arxiv_id="2501.00001"))
+        )
+
+        assert storage.paper_exists("2501.00001")
+
+    def test_sees_pending_papers_inside_transaction(self, storage):
+        with storage.transaction():
+            storage.add_paper(Paper(metadata=_make_metadata()))
+            assert storage.paper_exists("2503.10291")
+
+
+class TestIndexReuse:
+    def test_unchanged_index_is_parsed_once(self, tmp_path, monkeypatch):
+        config = _make_config(tmp_path)
+        config.ensure_dirs()
+        StorageManager(config).add_paper(Paper(metadata=_make_metadata()))
+        storage = StorageManager(config, reuse_index=True)
+        assert storage.get_paper("2503.10291") is not None
+
+        monkeypatch.setattr(
+            PaperIndex,
+            "model_validate_json",
+            lambda *_: pytest.fail("index re-parsed although unchanged"),
+        )
+        assert len(storage.list_papers()) == 1
+        assert storage.get_paper("2503.10291") is not None
+
+    def test_rereads_after_another_manager_writes(self, tmp_path):
+        config = _make_config(tmp_path)
+        config.ensure_dirs()
+        storage = StorageManager(config, reuse_index=True)
+        storage.add_paper(Paper(metadata=_make_metadata()))
+        assert len(storage.list_papers()) == 1
+
+        StorageManager(config).add_paper(Paper(metadata=_make_metadata(arxiv_id="2501.00001")))
+
+        assert storage.get_paper("2501.00001") is not None
+
+    def test_default_manager_hands_out_fresh_papers(self, tmp_path):
+        config = _make_config(tmp_path)
+        config.ensure_dirs()
+        storage = StorageManager(config)
+        storage.add_paper(Paper(metadata=_make_metadata()))
+
+        storage.get_paper("2503.10291").tags.append("unsaved")
+
+        assert storage.get_paper("2503.10291").tags == []
+
+
+class TestCopyFile:
+    def test_copies_bytes_and_mtime(self, tmp_path):
+        src = tmp_path / "a.mp3"
+        src.write_bytes(b"ID3 audio")
+        os.utime(src, (1_700_000_000, 1_700_000_000))
+        dst = tmp_path / "b.mp3"
+
+        copy_file(src, dst)
+
+        assert dst.read_bytes() == b"ID3 audio"
+        assert dst.stat().st_mtime == 1_700_000_000
+
+    def test_falls_back_when_clone_fails(self, tmp_path, monkeypatch):
+        import subprocess
+
+        src = tmp_path / "a.mp3"
+        src.write_bytes(b"ID3 audio")
+        monkeypatch.setattr("paper_assistant.storage.sys.platform", "darwin")
+
+        def failing_clone(*args, **kwargs):
+            raise subprocess.CalledProcessError(1, "cp")
+
+        monkeypatch.setattr("paper_assistant.storage.subprocess.run", failing_clone)
+
+        copy_file(src, tmp_path / "b.mp3")
+
+        assert (tmp_path / "b.mp3").read_bytes() == b"ID3 audio"
@@ -1,12 +1,20 @@
 """Tests for paper_assistant.summarizer parsing functions."""
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from paper_assistant.config import Config
 from paper_assistant.models import PaperMetadata, SourceType
+from paper_assistant.prompt import SYSTEM_PROMPT
 from paper_assistant.summarizer import (
     SummarizationResult,
     find_one_pager,
     format_summary_file,
     normalize_summary_body,
     parse_summary_sections,
+    summarize_paper_text,
 )
 
 
@@ -223,3 +231,36 @@ class TestNormalizeSummaryBody:
         assert "# Background" in cleaned
         assert "Real intro paragraph." in cleaned
         assert "## Methods" in cleaned
+
+
+@pytest.mark.asyncio
+async def test_summarize_paper_text_marks_system_prompt_cacheable(tmp_path):
+    config = Config(anthropic_api_key="key", data_dir=tmp_path)
+    fake_response = SimpleNamespace(
+        content=[SimpleNamespace(text="## One-Pager\nBody")],
+        usage=SimpleNamespace(
+            input_tokens=50,
+            output_tokens=20,
+            cache_creation_input_tokens=0,
+            cache_read_input_tokens=700,
+        ),
+    )
+    fake_client = MagicMock()
+    fake_client.messages.create = AsyncMock(return_value=fake_response)
+
+    with patch(
+        "paper_assistant.summarizer.anthropic.AsyncAnthropic", return_value=fake_client
+    ):
+        result = await summarize_paper_text(
+            config,
+            PaperMetadata(arxiv_id="2503.10291", title="T", authors=["A"], abstract=""),
+            "paper body",
+        )
+
+    system = fake_client.messages.create.await_args.kwargs["system"]
+    assert system == [
+        {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+    ]
+    assert result.one_pager == "Body"
+    assert result.cache_read_input_tokens == 700
+    assert result.total_input_tokens == 750
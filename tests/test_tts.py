@@ -9,6 +9,7 @@ from paper_assistant.tts import (
     MlxQualityError,
     MlxTTSBackend,
     get_tts_backend,
+    iter_speech_chunks,
     prepare_script_for_tts,
     prepare_text_for_tts,
     raise_for_audio_quality,
@@ -153,6 +154,47 @@ class TestSplitIntoChunks:
         assert "".join(chunks) == word
 
 
+async def _collect_speech_chunks(deltas: list[str], **kwargs) -> list[str]:
+    async def _source():
+        for delta in deltas:
+            yield delta
+
+    return [chunk async for chunk in iter_speech_chunks(_source(), **kwargs)]
+
+
+class TestIterSpeechChunks:
+    @pytest.mark.asyncio
+    async def test_releases_small_first_chunk_then_grows(self):
+        paragraphs = [f"Paragraph {i} " + "x" * 20 for i in range(8)]
+        text = "\n\n".join(paragraphs)
+        deltas = [text[i : i + 7] for i in range(0, len(text), 7)]
+
+        chunks = await _collect_speech_chunks(deltas, first_chars=30, max_chars=120)
+
+        assert chunks[0] == paragraphs[0]
+        assert len(chunks) < len(paragraphs)
+        assert "\n\n".join(chunks) == text
+
+    @pytest.mark.asyncio
+    async def test_first_chunk_ends_at_sentence_when_opening_paragraph_is_long(self):
+        text = (
+            "Dr. Smith reports a 3.5 point gain on the benchmark. "
+            "The method scales well. It also transfers.\n\nNext paragraph."
+        )
+        deltas = [text[i : i + 5] for i in range(0, len(text), 5)]
+
+        chunks = await _collect_speech_chunks(deltas, first_chars=20, max_chars=200)
+
+        assert chunks[0] == "Dr. Smith reports a 3.5 point gain on the benchmark."
+        assert chunks[1] == "The method scales well. It also transfers."
+        assert chunks[2] == "Next paragraph."
+
+    @pytest.mark.asyncio
+    async def test_flushes_tail_without_paragraph_break(self):
+        assert await _collect_speech_chunks(["Short ", "script."]) == ["Short script."]
+        assert await _collect_speech_chunks(["  \n"]) == []
+
+
 class TestGetTtsBackend:
     def test_default_mlx_model_matches_current_omlx_server(self, tmp_path):
         config = Config(anthropic_api_key="k", data_dir=tmp_path)